@@ -34,6 +34,17 @@
 console = Console()
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def _classic_cli_mode(args):
     """Handle classic CLI arguments for backward compatibility"""
     # Mutually-aware run mode
@@ -63,7 +74,12 @@ def _classic_cli_mode(args):
         start = perf_counter()
         banner("Audiobook Hardlinker", "dry" if dry else "commit")
         stats = run_batch(
-            args.batch_file, args.also_cover, args.zero_pad_vol, args.force, dry
+            args.batch_file,
+            args.also_cover,
+            args.zero_pad_vol,
+            args.force,
+            dry,
+            jobs=args.jobs,
         )
         summary_table(stats, perf_counter() - start)
         return
@@ -275,6 +291,12 @@ def main():
     ap.add_argument("--commit", action="store_true", help="Actually create links")
     ap.add_argument("--dry-run", action="store_true", help="Preview only (default)")
     ap.add_argument("--batch-file", type=Path, help="Process batch file")
+    ap.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help="Books to link in parallel in batch mode (default: 1)",
+    )
     ap.add_argument("--no-color", action="store_true", help="Disable colors")
 
     args = ap.parse_args()
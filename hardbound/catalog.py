@@ -7,9 +7,11 @@
 import os
 import re
 import sqlite3
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 from time import perf_counter
 from typing import Any
@@ -23,16 +25,106 @@
 DB_DIR = Path(__file__).parent.parent  # Go up to the main hardbound directory
 DB_FILE = DB_DIR / "catalog.db"
 
+# Writable item columns, in schema order
+_ITEM_COLUMNS = (
+    "author",
+    "series",
+    "book",
+    "path",
+    "asin",
+    "mtime",
+    "size",
+    "file_count",
+    "has_m4b",
+    "has_mp3",
+)
+
+# SQL expression mapping missing/placeholder authors to "Unknown" for browsing
+_AUTHOR_NAME_SQL = "COALESCE(NULLIF(NULLIF(author, ''), '—'), 'Unknown')"
+
+# Series books first (alphabetical by series, then book), standalone books last
+_SERIES_ORDER_SQL = (
+    "ORDER BY NULLIF(NULLIF(series, ''), '—') IS NULL,"
+    " NULLIF(NULLIF(series, ''), '—'), book"
+)
+
+
+# Group key for the author browser: A-Z, 'U' for Unknown, '#' for everything
+# else. Pure SQL so idx_author_initial can serve it; SQLite's upper() only
+# folds ASCII, so non-ASCII initials (É, ø, emoji) all group under '#'.
+_AUTHOR_INITIAL_SQL = """CASE
+        WHEN author IS NULL OR author IN ('', '—') THEN 'U'
+        WHEN upper(substr(author, 1, 1)) BETWEEN 'A' AND 'Z'
+            THEN upper(substr(author, 1, 1))
+        ELSE '#'
+    END"""
+
+_AUTHOR_INITIAL_INDEX_SQL = (
+    f"CREATE INDEX idx_author_initial ON items({_AUTHOR_INITIAL_SQL}, author)"
+)
+
+
+class IndexCancelled(Exception):
+    """Raised by index_directory when its cancel event is set"""
+
 
 class AudiobookCatalog:
     """SQLite FTS5 catalog for fast audiobook searching"""
 
-    def __init__(self):
-        DB_DIR.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(DB_FILE)
+    def __init__(self, db_path: str | Path | None = None):
+        if db_path is None:
+            DB_DIR.mkdir(parents=True, exist_ok=True)
+            db_path = DB_FILE
+        self.conn = sqlite3.connect(db_path)
         self.conn.row_factory = sqlite3.Row
+        self._wal_enabled = False
+        self._bulk_depth = 0
+        # Author pages keyed on (initial, offset, limit); cleared on every write
+        self._authors_cache: dict[tuple[str, int, int], list[tuple[str, int]]] = {}
         self._init_db()
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> "AudiobookCatalog":
+        """Build a throwaway in-memory catalog from existing result rows"""
+        catalog = cls(":memory:")
+        catalog.conn.executemany(
+            f"""
+            INSERT OR REPLACE INTO items ({", ".join(_ITEM_COLUMNS)})
+            VALUES ({", ".join(":" + col for col in _ITEM_COLUMNS)})
+        """,
+            ({col: row.get(col) for col in _ITEM_COLUMNS} for row in rows),
+        )
+        catalog.conn.commit()
+        return catalog
+
+    @contextmanager
+    def bulk(self) -> Iterator["AudiobookCatalog"]:
+        """Run a batch of writes as one transaction on a WAL-mode database
+
+        Nested blocks and index_directory calls inside the block share the
+        outer transaction; it commits on exit and rolls back on error.
+        """
+        if self._bulk_depth:
+            self._bulk_depth += 1
+            try:
+                yield self
+            finally:
+                self._bulk_depth -= 1
+            return
+
+        if not self._wal_enabled:
+            self.conn.commit()  # journal mode can't change inside a transaction
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self._wal_enabled = True
+
+        self._bulk_depth = 1
+        try:
+            with self.conn:
+                yield self
+        finally:
+            self._bulk_depth = 0
+
     def _init_db(self):
         """Initialize database schema"""
         self.conn.executescript(
@@ -53,6 +145,7 @@ def _init_db(self):
 
             CREATE INDEX IF NOT EXISTS idx_mtime ON items(mtime DESC);
             CREATE INDEX IF NOT EXISTS idx_path ON items(path);
+            CREATE INDEX IF NOT EXISTS idx_author ON items(author);
 
             CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
                 author, series, book, asin,
@@ -79,6 +172,14 @@ def _init_db(self):
             END;
         """
         )
+
+        # Recreate the initial index if it was built from an older expression
+        row = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'idx_author_initial'"
+        ).fetchone()
+        if row is None or row[0] != _AUTHOR_INITIAL_INDEX_SQL:
+            self.conn.execute("DROP INDEX IF EXISTS idx_author_initial")
+            self.conn.execute(_AUTHOR_INITIAL_INDEX_SQL)
         self.conn.commit()
 
     def parse_audiobook_path(self, path: Path) -> dict[str, str]:
@@ -273,9 +374,17 @@ def _extract_author_from_title(self, title: str) -> str:
         return "Unknown"
 
     def index_directory(
-        self, root: Path, verbose: bool = False, progress_callback=None
+        self,
+        root: Path,
+        verbose: bool = False,
+        progress_callback=None,
+        cancel: threading.Event | None = None,
     ):
-        """Index or update a directory tree"""
+        """Index or update a directory tree
+
+        Once cancel is set, both passes stop at the next entry and raise
+        IndexCancelled; inside bulk() the rows written so far are rolled back.
+        """
         if verbose:
             console.print(f"[yellow]Indexing {root}...[/yellow]")
 
@@ -283,6 +392,8 @@ def index_directory(
         # First pass: count total directories to process
         total_dirs = 0
         for path in root.rglob("*"):
+            if cancel is not None and cancel.is_set():
+                raise IndexCancelled(str(root))
             if path.is_dir():
                 m4b_files = list(path.glob("*.m4b"))
                 mp3_files = list(path.glob("*.mp3"))
@@ -294,6 +405,8 @@ def index_directory(
             progress_callback.total = total_dirs
 
         for path in root.rglob("*"):
+            if cancel is not None and cancel.is_set():
+                raise IndexCancelled(str(root))
             if not path.is_dir():
                 continue
 
@@ -339,7 +452,9 @@ def index_directory(
             elif verbose and count % 100 == 0:
                 print(f"  Indexed {count} audiobooks...")
 
-        self.conn.commit()
+        if not self._bulk_depth:
+            self.conn.commit()
+        self._authors_cache.clear()
 
         if progress_callback:
             progress_callback.done(f"Indexed {count} audiobooks")
@@ -350,38 +465,114 @@ def index_directory(
 
     def search(self, query: str, limit: int = 500) -> list[dict]:
         """Full-text search the catalog with enhanced features"""
-        if not query or query == "*":
-            # Return recent items
-            cursor = self.conn.execute(
-                """
-                SELECT * FROM items
-                ORDER BY mtime DESC
-                LIMIT ?
-            """,
-                (limit,),
-            )
-        else:
+        if query and query != "*":
             # FTS5 search with ranking
-            cursor = self.conn.execute(
-                """
-                SELECT i.*, f.rank
-                FROM items i
-                JOIN items_fts f ON i.id = f.rowid
-                WHERE items_fts MATCH ?
-                ORDER BY f.rank, i.mtime DESC
-                LIMIT ?
-            """,
-                (query, limit),
-            )
+            return self._fts_search(query, query, limit)
+
+        return self.recent(limit)
+
+    def recent(self, limit: int = 50) -> list[dict]:
+        """Most recently modified items, newest first (served by idx_mtime)"""
+        cursor = self.conn.execute(
+            """
+            SELECT * FROM items
+            ORDER BY mtime DESC
+            LIMIT ?
+        """,
+            (limit,),
+        )
+        return [dict(row) for row in cursor.fetchall()]
 
+    def search_text(self, text: str, limit: int = 500) -> list[dict]:
+        """Prefix-match plain user input, treating FTS5 operators as literal text"""
+        terms = text.split()
+        if not terms:
+            return self.recent(limit)
+
+        # Quote each term so punctuation can't produce FTS5 syntax errors
+        match = " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+        return self._fts_search(match, text.strip(), limit)
+
+    def _fts_search(self, match: str, query: str, limit: int) -> list[dict]:
+        """Run an FTS5 MATCH ranked by relevance and record the query in history"""
+        cursor = self.conn.execute(
+            """
+            SELECT i.*, f.rank
+            FROM items i
+            JOIN items_fts f ON i.id = f.rowid
+            WHERE items_fts MATCH ?
+            ORDER BY f.rank, i.mtime DESC
+            LIMIT ?
+        """,
+            (match, limit),
+        )
         results = [dict(row) for row in cursor.fetchall()]
 
         # Record search in history if it's a meaningful query
-        if query and query != "*" and len(query.strip()) > 2:
+        if len(query.strip()) > 2:
             self._record_search_history(query)
 
         return results
 
+    def authors_by_initial(self) -> dict[str, int]:
+        """Count distinct authors per initial letter for the author browser"""
+        cursor = self.conn.execute(
+            f"""
+            SELECT {_AUTHOR_INITIAL_SQL} AS initial,
+                   COUNT(DISTINCT {_AUTHOR_NAME_SQL}) AS authors
+            FROM items
+            GROUP BY initial
+            ORDER BY initial
+        """
+        )
+        return {row["initial"]: row["authors"] for row in cursor}
+
+    def authors_page(
+        self, initial: str, offset: int = 0, limit: int = -1
+    ) -> list[tuple[str, int]]:
+        """One page of (author, book_count) pairs for an initial, sorted by author
+
+        Pages are cached so next/previous flips don't re-query.
+        """
+        key = (initial, offset, limit)
+        page = self._authors_cache.get(key)
+        if page is None:
+            if len(self._authors_cache) >= 16:
+                self._authors_cache.clear()
+            cursor = self.conn.execute(
+                f"""
+                SELECT {_AUTHOR_NAME_SQL} AS name, COUNT(*) AS books
+                FROM items
+                WHERE {_AUTHOR_INITIAL_SQL} = ?
+                GROUP BY name
+                ORDER BY name
+                LIMIT ? OFFSET ?
+            """,
+                (initial, limit, offset),
+            )
+            page = [(row["name"], row["books"]) for row in cursor]
+            self._authors_cache[key] = page
+        return list(page)
+
+    def books_for_author(self, author: str) -> list[dict]:
+        """Fetch every catalog entry for one author as shown in the browser
+
+        Rows come back grouped by series (standalone books last), then by book.
+        """
+        if author == "Unknown":
+            cursor = self.conn.execute(
+                f"""
+                SELECT * FROM items
+                WHERE author IS NULL OR author IN ('', '—', 'Unknown')
+                {_SERIES_ORDER_SQL}
+            """
+            )
+        else:
+            cursor = self.conn.execute(
+                f"SELECT * FROM items WHERE author = ? {_SERIES_ORDER_SQL}", (author,)
+            )
+        return [dict(row) for row in cursor]
+
     def get_autocomplete_suggestions(
         self, partial_query: str, limit: int = 10
     ) -> list[str]:
@@ -513,6 +704,7 @@ def rebuild_indexes(self, verbose: bool = False) -> dict[str, Any]:
             print("  Rebuilding regular indexes...")
         self.conn.execute("REINDEX idx_mtime")
         self.conn.execute("REINDEX idx_path")
+        self.conn.execute("REINDEX idx_author")
 
         # Analyze for query optimization
         if verbose:
@@ -549,6 +741,7 @@ def clean_orphaned_entries(self, verbose: bool = False) -> dict[str, int]:
         placeholders = ",".join("?" * len(orphaned))
         self.conn.execute(f"DELETE FROM items WHERE id IN ({placeholders})", orphaned)
         self.conn.commit()
+        self._authors_cache.clear()
 
         if verbose:
             console.print(f"[green]✅ Removed {len(orphaned)} orphaned entries[/green]")
@@ -847,6 +1040,8 @@ def index_directory_parallel(
                             f"[yellow]⚠️  Error processing {audio_file}: {e}[/yellow]"
                         )
 
+        self._authors_cache.clear()
+
         elapsed = time.time() - start_time
         if verbose:
             console.print(
@@ -901,15 +1096,18 @@ def _process_single_file(self, audio_file: Path) -> bool:
                     ),
                 )
                 self.conn.commit()
+                self._authors_cache.clear()
                 return True
         except Exception:
             pass
         return False
 
     def clear_cache(self):
-        """Clear search cache"""
+        """Clear search and author page caches"""
         if hasattr(self, "_search_cache"):
             self._search_cache.clear()
+        self._authors_cache.clear()
 
     def close(self):
+        self._authors_cache.clear()
         self.conn.close()
@@ -18,12 +18,15 @@
 
 from rich.console import Console
 
+from . import catalog as catalog_module
 from .display import Sty, row, section, term_width
 from .linker import (
     plan_and_link_red,
     set_dir_permissions_and_ownership,
     set_file_permissions_and_ownership,
 )
+from .preview import fzf_preview_command
+from .utils.validation import YES_ANSWERS
 
 # Global console instance
 console = Console()
@@ -1171,25 +1174,9 @@ def fzf_pick(candidates: list[dict], multi: bool = True) -> list[str]:
         # Use hierarchical browser instead of simple fallback
         console.print("[yellow]fzf not found. Using hierarchical browser.[/yellow]")
 
-        # Create a temporary catalog-like interface
-        class TempCatalog:
-            def search(self, query, limit):
-                if query == "*":
-                    return candidates[:limit]
-                query_lower = query.lower()
-                results = []
-                for c in candidates:
-                    if (
-                        query_lower in c.get("author", "").lower()
-                        or query_lower in c.get("book", "").lower()
-                        or query_lower in c.get("series", "").lower()
-                    ):
-                        results.append(c)
-                        if len(results) >= limit:
-                            break
-                return results
-
-        temp_catalog = AudiobookCatalog()
+        # Browse only the candidates, loaded into an in-memory FTS5 catalog
+        # (lowercased/tokenized once at insert time rather than per query)
+        temp_catalog = catalog_module.AudiobookCatalog.from_rows(candidates)
         try:
             selected_books = hierarchical_browser(temp_catalog)
             # Extract paths from selected books
@@ -1205,7 +1192,7 @@ def search(self, query, limit):
         book = r.get("book", "—")
         path = r["path"]
 
-        # Format: "Author ▸ Series ▸ Book\tpath\tJSON"
+        # Format: "Author ▸ Series ▸ Book\tpath"
         display = (
             f"{author} ▸ {series} ▸ {book}" if series != "—" else f"{author} ▸ {book}"
         )
@@ -1220,24 +1207,10 @@ def search(self, query, limit):
         size_mb = r.get("size", 0) / (1024 * 1024)
         display += f" ({size_mb:.0f}MB)"
 
-        payload = json.dumps({"path": path})
-        lines.append(f"{display}\t{path}\t{payload}")
-
-    # Preview command - show files and stats
-    preview_cmd = r"""
-    p=$(echo {} | awk -F"\t" "{print \$2}");
-    if [ -d "$p" ]; then
-        echo "📁 $p";
-        echo "";
-        echo "Files:";
-        ls -lah "$p" 2>/dev/null | head -20;
-        echo "";
-        echo "Audio files:";
-        find "$p" -maxdepth 1 \( -name "*.m4b" -o -name "*.mp3" \) -exec basename {} \; 2>/dev/null | head -10;
-        echo "";
-        echo "Total size: $(du -sh "$p" 2>/dev/null | cut -f1)";
-    fi
-    """
+        lines.append(f"{display}\t{path}")
+
+    # Preview command - one scandir per highlighted row instead of ls/find/du
+    preview_cmd = fzf_preview_command()
 
     # Build fzf command
     fzf_args = [
@@ -1268,13 +1241,10 @@ def search(self, query, limit):
         # Extract paths from selected lines
         paths = []
         for line in proc.stdout.strip().splitlines():
-            parts = line.split("\t")
-            if len(parts) >= 3:
-                try:
-                    payload = json.loads(parts[2])
-                    paths.append(payload["path"])
-                except json.JSONDecodeError:
-                    pass
+            # The path is the last tab-separated column
+            _display, sep, path = line.rpartition("\t")
+            if sep:
+                paths.append(path)
 
         return paths
 
@@ -1767,7 +1737,7 @@ def search_and_link_wizard():
     )
     confirm = input("Continue? [y/N]: ").lower()
 
-    if confirm in ["y", "yes"]:
+    if confirm in YES_ANSWERS:
         stats = {
             "linked": 0,
             "replaced": 0,
@@ -2352,7 +2322,7 @@ def _link_selected_paths(selected_paths: list[str]):
         f"\n{Sty.YELLOW}Link {len(selected_paths)} audiobook(s)? [y/N]: {Sty.RESET}",
         end="",
     )
-    if input().strip().lower() not in ["y", "yes"]:
+    if input().strip().lower() not in YES_ANSWERS:
         return
 
     stats = {
@@ -2412,7 +2382,7 @@ def update_catalog_wizard():
     print("This will rebuild the search index for faster queries.")
 
     confirm = input("Continue? [y/N]: ").strip().lower()
-    if confirm not in ["y", "yes"]:
+    if confirm not in YES_ANSWERS:
         return
 
     catalog = AudiobookCatalog()
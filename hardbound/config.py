@@ -281,12 +281,41 @@ def validate_path_length(self, name: str, path_str: str) -> bool:
 # Global config manager instance
 config_manager = ConfigManager()
 
+# Parsed config keyed on the config file's (path, mtime_ns, size) signature
+_config_cache: tuple[tuple[str, int, int], dict[str, Any]] | None = None
+
+
+def _config_signature() -> tuple[str, int, int] | None:
+    """Stat signature of the config file, or None if it can't be stat'ed"""
+    try:
+        st = CONFIG_FILE.stat()
+    except OSError:
+        return None
+    return (str(CONFIG_FILE), st.st_mtime_ns, st.st_size)
+
+
+def _remember_config(config_data: dict[str, Any]):
+    """Cache a private copy of the config against the current file signature"""
+    global _config_cache
+    signature = _config_signature()
+    _config_cache = (
+        (signature, copy.deepcopy(config_data)) if signature is not None else None
+    )
+
 
 def load_config():
-    """Load configuration (backward compatibility)"""
-    return config_manager.load_config()
+    """Load configuration, reusing the parsed file until it changes on disk"""
+    if _config_cache is not None and _config_cache[0] == _config_signature():
+        config_manager.config = copy.deepcopy(_config_cache[1])
+        return config_manager.config
+
+    config = config_manager.load_config()
+    _remember_config(config)
+    return config
 
 
 def save_config(config_data):
-    """Save configuration (backward compatibility)"""
+    """Save configuration and refresh the cached copy"""
     config_manager.save_config(config_data)
+    # Cache what load_config() would read back: migrated, defaults filled in
+    _remember_config(config_manager._migrate_config(config_data))
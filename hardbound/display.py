@@ -9,6 +9,7 @@
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 # Global console instance
 console = Console()
@@ -84,31 +85,53 @@ def section(title: str) -> None:
     console.print("─" * term_width())
 
 
+# Old Sty constants -> Rich color names for row()
+_ROW_COLORS = {
+    Sty.GREEN: "green",
+    Sty.BLUE: "blue",
+    Sty.YELLOW: "yellow",
+    Sty.RED: "red",
+    Sty.GREY: "bright_black",
+    Sty.CYAN: "cyan",
+    Sty.MAGENTA: "magenta",
+}
+
+
 def row(
     status_icon: str, status_color: str, kind: str, src: Path, dst: Path, dry: bool
 ) -> None:
     """Display a row with status using Rich"""
-    # Convert ANSI color to Rich markup
-    color_map = {
-        Sty.GREEN: "green",
-        Sty.BLUE: "blue",
-        Sty.YELLOW: "yellow",
-        Sty.RED: "red",
-        Sty.GREY: "bright_black",
-        Sty.CYAN: "cyan",
-        Sty.MAGENTA: "magenta",
-    }
-
     # Handle both old Sty constants and direct color strings
-    if status_color in color_map:
-        rich_color = color_map[status_color]
-    else:
-        rich_color = status_color
+    rich_color = _ROW_COLORS.get(status_color, status_color)
+
+    # Assemble styled Text directly: no markup to parse per row, and paths
+    # containing [brackets] print verbatim
+    middle = Text.assemble((str(src), "bright_black"), " ", ("→", "dim"), " ", str(dst))
+    limit = term_width() - 20
+    if len(middle) > limit:
+        middle.truncate(limit - 1, overflow="ellipsis")
+
+    console.print(
+        Text.assemble(f"{status_icon} ", (f"{kind:<6}", rich_color), "  ", middle)
+    )
 
-    left = f"{status_icon} [{rich_color}]{kind:<6}[/{rich_color}]"
-    middle = f"[bright_black]{src}[/bright_black] [dim]→[/dim] {dst}"
 
-    console.print(f"{left}  {ellipsize(middle, term_width() - 20)}")
+def format_row(book: dict, idx: int, breadcrumb: bool = False) -> str:
+    """Numbered browser row for a catalog entry; the label is memoized on the dict"""
+    key = "_display_breadcrumb" if breadcrumb else "_display"
+    label = book.get(key)
+    if label is None:
+        title = book.get("book", "—")
+        if breadcrumb:
+            author = book.get("author", "—")
+            series = book.get("series", "")
+            title = (
+                f"{author} ▸ {series} ▸ {title}" if series else f"{author} ▸ {title}"
+            )
+        indicator = "📘" if book.get("has_m4b") else "🎵"
+        size_mb = (book.get("size") or 0) / (1024 * 1024)
+        label = book[key] = f"{title} {indicator} ({size_mb:.0f}MB)"
+    return f"[green]{idx:3d}[/green]) {label}"
 
 
 def strip_ansi(s: str) -> str:
@@ -3,12 +3,17 @@
 Interactive mode and wizard functionality
 """
 
+import atexit
 import copy
-import json
 import os
 import shutil
 import subprocess
+import threading
+from collections import ChainMap
+from concurrent.futures import Future
+from contextlib import suppress
 from datetime import datetime
+from itertools import groupby
 from pathlib import Path
 from time import perf_counter
 from typing import Any
@@ -17,12 +22,13 @@
 
 from .catalog import DB_FILE, AudiobookCatalog
 from .config import DEFAULT_CONFIG, ConfigManager, load_config, save_config
-from .display import summary_table
-from .linker import plan_and_link_red
+from .display import format_row, summary_table
+from .linker import invalidate_link_config, new_stats, plan_and_link_red
+from .preview import fzf_preview_command
 from .ui.feedback import ErrorHandler, ProgressIndicator, VisualFeedback
 from .ui.menu import create_main_menu, create_quick_actions_menu, menu_system
 from .utils.logging import get_logger
-from .utils.validation import InputValidator, PathValidator
+from .utils.validation import YES_ANSWERS, InputValidator, PathValidator
 
 # Global Rich console for consistent output
 console = Console()
@@ -30,6 +36,14 @@
 # Get structured logger for interactive module
 log = get_logger(__name__)
 
+# Audio extensions that mark a directory as an audiobook folder
+_AUDIO_EXT = (".m4b", ".mp3")
+
+# First-launch catalog build running behind the welcome prompts
+_initial_index: Future | None = None
+_initial_index_thread: threading.Thread | None = None
+_initial_index_cancel = threading.Event()
+
 
 def _get_recent_sources(config):
     """Safely get recent sources as a list"""
@@ -115,40 +129,36 @@ def display_selection_review(selected_books: list[dict[str, Any]]) -> None:
     console.print(f"\n[bold]Total size:[/bold] [yellow]{total_size_mb:.1f} MB[/yellow]")
 
 
+def _has_audio(path: str | os.PathLike[str]) -> bool:
+    """Check whether a directory directly contains .m4b or .mp3 files"""
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                # Stop at the first audio file; like glob("*.m4b"), dotfiles count
+                if entry.name.endswith(_AUDIO_EXT):
+                    return True
+    except OSError:
+        pass
+    return False
+
+
 def have_fzf() -> bool:
     """Check if fzf is available"""
 
     return shutil.which("fzf") is not None
 
 
-def hierarchical_browser(catalog) -> list[dict[str, Any]]:
-    """Browse audiobooks by author/series hierarchy"""
-
-    # Get all unique authors from catalog
-    all_items = catalog.search("*", limit=5000)
+def _series_name(book: dict[str, Any]) -> str:
+    """Series a catalog row belongs to, or "" for standalone books"""
+    series = book.get("series") or ""
+    return "" if series == "—" else series
 
-    # Build author index
-    authors_by_initial: dict[str, set[str]] = {}
-    author_to_books: dict[str, list[dict[str, Any]]] = {}
 
-    for item in all_items:
-        author = item.get("author", "Unknown")
-        if not author or author == "—":
-            author = "Unknown"
-
-        # Get first character for grouping
-        initial = author[0].upper() if author else "#"
-        if not initial.isalpha():
-            initial = "#"  # Group numbers and special chars
-
-        if initial not in authors_by_initial:
-            authors_by_initial[initial] = set()
-        authors_by_initial[initial].add(author)
+def hierarchical_browser(catalog) -> list[dict[str, Any]]:
+    """Browse audiobooks by author/series hierarchy"""
 
-        # Track books per author
-        if author not in author_to_books:
-            author_to_books[author] = []
-        author_to_books[author].append(item)
+    # Author counts per initial, aggregated in SQL
+    authors_by_initial = catalog.authors_by_initial()
 
     console.print("[cyan]📚 BROWSE BY AUTHOR[/cyan]")
     print("\nSelect first letter of author's name:\n")
@@ -161,7 +171,7 @@ def hierarchical_browser(catalog) -> list[dict[str, Any]]:
         for j in range(cols):
             if i + j < len(initials):
                 initial = initials[i + j]
-                count = len(authors_by_initial[initial])
+                count = authors_by_initial[initial]
                 row.append(f"[yellow]{initial}[/yellow]({count:2d})")
             else:
                 row.append("      ")
@@ -178,20 +188,21 @@ def hierarchical_browser(catalog) -> list[dict[str, Any]]:
         return []
 
     # Step 2: Choose author
-    authors = sorted(authors_by_initial[choice])
+    initial = choice
+    total_authors = authors_by_initial[initial]
 
-    console.print(f"\n[cyan]Authors starting with '{choice}':[/cyan]\n")
+    console.print(f"\n[cyan]Authors starting with '{initial}':[/cyan]\n")
 
-    # Paginate if too many
+    # Paginate in SQL so only the visible page is held in memory
     page_size = 20
     current_page = 0
 
     while True:
         start = current_page * page_size
-        end = min(start + page_size, len(authors))
+        page = catalog.authors_page(initial, start, page_size)
+        end = start + len(page)
 
-        for i, author in enumerate(authors[start:end], start + 1):
-            book_count = len(author_to_books[author])
+        for i, (author, book_count) in enumerate(page, start + 1):
             console.print(
                 f"[green]{i:3d}[/green]) {author} ({book_count} book{'s' if book_count > 1 else ''})"
             )
@@ -199,7 +210,7 @@ def hierarchical_browser(catalog) -> list[dict[str, Any]]:
         nav_options = []
         if current_page > 0:
             nav_options.append("'p' = previous")
-        if end < len(authors):
+        if end < total_authors:
             nav_options.append("'n' = next")
         nav_options.append("number = select")
         nav_options.append("'q' = quit")
@@ -209,64 +220,43 @@ def hierarchical_browser(catalog) -> list[dict[str, Any]]:
 
         if choice == "q":
             return []
-        elif choice == "n" and end < len(authors):
+        elif choice == "n" and end < total_authors:
             current_page += 1
         elif choice == "p" and current_page > 0:
             current_page -= 1
         elif choice.isdigit():
             idx = int(choice) - 1
-            if 0 <= idx < len(authors):
-                selected_author = authors[idx]
+            if start <= idx < end:
+                selected_author = page[idx - start][0]
+                break
+            if 0 <= idx < total_authors:
+                # Number from another page: fetch just that row
+                selected_author = catalog.authors_page(initial, idx, 1)[0][0]
                 break
         else:
             console.print("[yellow]Invalid selection[/yellow]")
 
     # Step 3: Browse author's books
-    author_books = author_to_books[selected_author]
-
-    # Group by series if applicable
-    series_groups: dict[str, list[dict[str, Any]]] = {}
-    standalone = []
-
-    for book in author_books:
-        series = book.get("series", "")
-        if series and series != "—":
-            if series not in series_groups:
-                series_groups[series] = []
-            series_groups[series].append(book)
-        else:
-            standalone.append(book)
+    author_books = catalog.books_for_author(selected_author)
 
     console.print(f"\n[cyan]📚 {selected_author}[/cyan]")
 
-    all_selectable = []
-
-    # Show series first
-    if series_groups:
-        console.print("\n[bold]Series:[/bold]")
-        for series in sorted(series_groups.keys()):
-            books = sorted(series_groups[series], key=lambda x: x.get("book", ""))
+    # Rows arrive ordered by series then book, with standalone books last,
+    # which is already the display order; number them once in a single pass
+    all_selectable = author_books
+    numbered = enumerate(all_selectable, 1)
+    for series, group in groupby(numbered, key=lambda item: _series_name(item[1])):
+        books = list(group)
+        if series:
+            if books[0][0] == 1:
+                console.print("\n[bold]Series:[/bold]")
             console.print(f"\n  [magenta]{series}[/magenta] ({len(books)} books)")
-            for book in books:
-                all_selectable.append(book)
-                idx = len(all_selectable)
-                size_mb = book.get("size", 0) / (1024 * 1024)
-                indicator = "📘" if book.get("has_m4b") else "🎵"
-                console.print(
-                    f"    [green]{idx:3d}[/green]) {book['book']} {indicator} ({size_mb:.0f}MB)"
-                )
-
-    # Show standalone books
-    if standalone:
-        console.print("\n[bold]Standalone:[/bold]")
-        for book in sorted(standalone, key=lambda x: x.get("book", "")):
-            all_selectable.append(book)
-            idx = len(all_selectable)
-            size_mb = book.get("size", 0) / (1024 * 1024)
-            indicator = "📘" if book.get("has_m4b") else "🎵"
-            console.print(
-                f"  [green]{idx:3d}[/green]) {book['book']} {indicator} ({size_mb:.0f}MB)"
-            )
+            indent = "    "
+        else:
+            console.print("\n[bold]Standalone:[/bold]")
+            indent = "  "
+        for idx, book in books:
+            console.print(f"{indent}{format_row(book, idx)}")
 
     # Selection
     console.print("\n[cyan]🎯 Selection Instructions:[/cyan]")
@@ -332,7 +322,7 @@ def enhanced_text_search_browser(catalog) -> list[dict[str, Any]]:
         except Exception:
             pass  # Ignore history saving errors
 
-    results = catalog.search(query, limit=100)
+    results = catalog.search_text(query, limit=100)
 
     if not results:
         console.print("[yellow]No results found[/yellow]")
@@ -350,20 +340,7 @@ def enhanced_text_search_browser(catalog) -> list[dict[str, Any]]:
         end = min(start + page_size, len(results))
 
         for i, book in enumerate(results[start:end], start + 1):
-            author = book.get("author", "—")
-            series = book.get("series", "")
-            title = book.get("book", "—")
-            size_mb = book.get("size", 0) / (1024 * 1024)
-
-            if series:
-                display = f"{author} ▸ {series} ▸ {title}"
-            else:
-                display = f"{author} ▸ {title}"
-
-            indicator = "📘" if book.get("has_m4b") else "🎵"
-            console.print(
-                f"[green]{i:3d}[/green]) {display} {indicator} ({size_mb:.0f}MB)"
-            )
+            console.print(format_row(book, i, breadcrumb=True))
 
         nav_options = []
         if current_page > 0:
@@ -471,6 +448,29 @@ def _enhanced_input(prompt: str, autocomplete: list[str], history: list[str]) ->
         return ""
 
 
+def _fzf_line(r: dict) -> str:
+    """Format one candidate as a tab-separated fzf input line"""
+    author = r.get("author", "—")
+    series = r.get("series", "—")
+    book = r.get("book", "—")
+    path = r["path"]
+
+    # Format: "Author ▸ Series ▸ Book\tpath"
+    display = f"{author} ▸ {series} ▸ {book}" if series != "—" else f"{author} ▸ {book}"
+
+    # Add indicators
+    if r.get("has_m4b"):
+        display += " 📘"
+    elif r.get("has_mp3"):
+        display += " 🎵"
+
+    # Add size
+    size_mb = r.get("size", 0) / (1024 * 1024)
+    display += f" ({size_mb:.0f}MB)"
+
+    return f"{display}\t{path}"
+
+
 # Update fzf_pick to use hierarchical browser when fzf is not available
 def fzf_pick(candidates: list[dict], multi: bool = True) -> list[str]:
     """
@@ -484,70 +484,18 @@ def fzf_pick(candidates: list[dict], multi: bool = True) -> list[str]:
         # Use hierarchical browser instead of simple fallback
         console.print("[yellow]fzf not found. Using hierarchical browser.[/yellow]")
 
-        # Create a temporary catalog-like interface
-        class TempCatalog:
-            def search(self, query, limit=500):
-                if query == "*":
-                    return candidates[:limit]
-                query_lower = query.lower()
-                results = []
-                for c in candidates:
-                    if (
-                        query_lower in c.get("author", "").lower()
-                        or query_lower in c.get("book", "").lower()
-                        or query_lower in c.get("series", "").lower()
-                    ):
-                        results.append(c)
-                        if len(results) >= limit:
-                            break
-                return results
-
-        temp_catalog = TempCatalog()
-        selected_books = hierarchical_browser(temp_catalog)
+        # Load candidates into a throwaway in-memory catalog so the browser
+        # gets the same SQL aggregates and FTS5 search as the real one
+        temp_catalog = AudiobookCatalog.from_rows(candidates)
+        try:
+            selected_books = hierarchical_browser(temp_catalog)
+        finally:
+            temp_catalog.close()
         # Extract paths from selected books
         return [book["path"] for book in selected_books]
 
-    # Build searchable lines with metadata
-    lines = []
-    for r in candidates:
-        author = r.get("author", "—")
-        series = r.get("series", "—")
-        book = r.get("book", "—")
-        path = r["path"]
-
-        # Format: "Author ▸ Series ▸ Book\tpath\tJSON"
-        display = (
-            f"{author} ▸ {series} ▸ {book}" if series != "—" else f"{author} ▸ {book}"
-        )
-
-        # Add indicators
-        if r.get("has_m4b"):
-            display += " 📘"
-        elif r.get("has_mp3"):
-            display += " 🎵"
-
-        # Add size
-        size_mb = r.get("size", 0) / (1024 * 1024)
-        display += f" ({size_mb:.0f}MB)"
-
-        payload = json.dumps({"path": path})
-        lines.append(f"{display}\t{path}\t{payload}")
-
-    # Preview command - show files and stats
-    preview_cmd = r"""
-    p=$(echo {} | awk -F"\t" "{print \$2}");
-    if [ -d "$p" ]; then
-        echo "📁 $p";
-        echo "";
-        echo "Files:";
-        ls -lah "$p" 2>/dev/null | head -20;
-        echo "";
-        echo "Audio files:";
-        find "$p" -maxdepth 1 \( -name "*.m4b" -o -name "*.mp3" \) -exec basename {} \; 2>/dev/null | head -10;
-        echo "";
-        echo "Total size: $(du -sh "$p" 2>/dev/null | cut -f1)";
-    fi
-    """
+    # Preview command - one scandir per highlighted row instead of ls/find/du
+    preview_cmd = fzf_preview_command()
 
     # Build fzf command
     fzf_args = [
@@ -568,23 +516,35 @@ def search(self, query, limit=500):
         fzf_args.extend(["-m", "--bind=ctrl-a:select-all,ctrl-d:deselect-all"])
 
     try:
-        proc = subprocess.run(
-            fzf_args, input="\n".join(lines), text=True, capture_output=True
+        # Stream lines so fzf can start rendering before every row is formatted
+        proc = subprocess.Popen(
+            fzf_args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
         )
+        assert proc.stdin is not None and proc.stdout is not None
+        # fzf may exit (accepted or cancelled) before reading everything
+        with suppress(BrokenPipeError):
+            try:
+                for r in candidates:
+                    proc.stdin.write(_fzf_line(r) + "\n")
+            finally:
+                proc.stdin.close()
+        output = proc.stdout.read()
+        proc.wait()
 
         if proc.returncode != 0:
             return []
 
         # Extract paths from selected lines
         paths = []
-        for line in proc.stdout.strip().splitlines():
-            parts = line.split("\t")
-            if len(parts) >= 3:
-                try:
-                    payload = json.loads(parts[2])
-                    paths.append(payload["path"])
-                except json.JSONDecodeError:
-                    pass
+        for line in output.strip().splitlines():
+            # The path is the last tab-separated column
+            _display, sep, path = line.rpartition("\t")
+            if sep:
+                paths.append(path)
 
         return paths
 
@@ -660,9 +620,10 @@ def automated_maintenance():
             if library_path and Path(library_path).exists():
                 console.print(f"[dim]  • Updating catalog from {library_path}...[/dim]")
                 progress = ProgressIndicator("Updating catalog")
-                count = catalog.index_directory(
-                    Path(library_path), verbose=False, progress_callback=progress
-                )
+                with catalog.bulk():
+                    count = catalog.index_directory(
+                        Path(library_path), verbose=False, progress_callback=progress
+                    )
                 console.print(
                     f"[green]  ✅ Updated catalog with {count} audiobooks[/green]"
                 )
@@ -674,9 +635,10 @@ def automated_maintenance():
                         "[dim]  • Updating catalog from default path...[/dim]"
                     )
                     progress = ProgressIndicator("Updating catalog")
-                    count = catalog.index_directory(
-                        default_paths[0], verbose=False, progress_callback=progress
-                    )
+                    with catalog.bulk():
+                        count = catalog.index_directory(
+                            default_paths[0], verbose=False, progress_callback=progress
+                        )
                     console.print(
                         f"[green]  ✅ Updated catalog with {count} audiobooks[/green]"
                     )
@@ -705,17 +667,7 @@ def interactive_mode():
 
     # Initialize catalog if needed
     if not DB_FILE.exists():
-        feedback = VisualFeedback()
-        feedback.info("No catalog found. Building index...")
-
-        catalog = AudiobookCatalog()
-        default_path = PathValidator.get_default_search_paths()
-        if default_path:
-            progress = ProgressIndicator("Building catalog")
-            catalog.index_directory(
-                default_path[0], verbose=False, progress_callback=progress
-            )
-        catalog.close()
+        _start_initial_index()
     else:
         # Database exists, run automated maintenance
         automated_maintenance()
@@ -758,6 +710,87 @@ def interactive_mode():
             running = False
 
 
+def _build_initial_index() -> int:
+    """Index the first default search path into a fresh catalog"""
+    catalog = AudiobookCatalog()
+    try:
+        default_path = PathValidator.get_default_search_paths()
+        if not default_path:
+            return 0
+        # A cancelled build rolls back inside bulk() and still closes the catalog
+        with catalog.bulk():
+            return catalog.index_directory(
+                default_path[0], verbose=False, cancel=_initial_index_cancel
+            )
+    finally:
+        catalog.close()
+
+
+def _run_initial_index(future: Future) -> None:
+    """Worker thread body: resolve future with the build's result"""
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        future.set_result(_build_initial_index())
+    except BaseException as e:
+        future.set_exception(e)
+
+
+def _start_initial_index() -> None:
+    """Build the missing catalog on a worker thread while setup prompts run
+
+    The thread is a daemon so it never holds up interpreter exit; the
+    atexit hook below asks it to stop and waits briefly for it to roll back
+    and close its connection.
+    """
+    global _initial_index, _initial_index_thread
+    feedback = VisualFeedback()
+    feedback.info("No catalog found. Building index in the background...")
+
+    _initial_index_cancel.clear()
+    _initial_index = Future()
+    _initial_index_thread = threading.Thread(
+        target=_run_initial_index,
+        args=(_initial_index,),
+        name="catalog-index",
+        daemon=True,
+    )
+    _initial_index_thread.start()
+
+
+def _cancel_initial_index() -> None:
+    """Stop an unfinished background build at exit"""
+    thread = _initial_index_thread
+    if thread is None or not thread.is_alive():
+        return
+    _initial_index_cancel.set()
+    # index_directory checks the flag on every entry of both passes, so this
+    # normally returns at once. If I/O hangs past the timeout, the rows are
+    # still uncommitted in bulk()'s transaction and SQLite discards them.
+    thread.join(timeout=5)
+
+
+atexit.register(_cancel_initial_index)
+
+
+def _wait_for_initial_index() -> None:
+    """Block until the background catalog build (if any) has finished"""
+    global _initial_index
+    future, _initial_index = _initial_index, None
+    if future is None:
+        return
+
+    if not future.done():
+        console.print("[yellow]⏳ Waiting for the catalog build to finish...[/yellow]")
+    try:
+        count = future.result()
+    except Exception as e:
+        error_handler = ErrorHandler()
+        error_handler.handle_operation_error(e, "catalog indexing")
+        return
+    log.info("catalog.initial_index.done", indexed=count)
+
+
 def _first_run_setup(config):
     """Enhanced first run setup with validation"""
     feedback = VisualFeedback()
@@ -824,6 +857,7 @@ def search_and_link_wizard():
     """Search-first linking wizard with hierarchical browsing"""
     console.print("\n[cyan]🔍 SEARCH AND LINK[/cyan]")
 
+    _wait_for_initial_index()
     catalog = AudiobookCatalog()
 
     # Offer choice of browse vs search
@@ -841,7 +875,7 @@ def search_and_link_wizard():
     elif choice == "2":
         selected_books = enhanced_text_search_browser(catalog)
     elif choice == "3":
-        results = catalog.search("*", limit=50)
+        results = catalog.recent(limit=50)
         if results:
             console.print("\n[green]Recent audiobooks:[/green]")
             selected_books = enhanced_text_search_browser(catalog)
@@ -935,16 +969,10 @@ def search_and_link_wizard():
     )
     confirm = input("Continue? [y/N]: ").lower()
 
-    if confirm in ["y", "yes"]:
-        stats = {
-            "linked": 0,
-            "replaced": 0,
-            "already": 0,
-            "exists": 0,
-            "excluded": 0,
-            "skipped": 0,
-            "errors": 0,
-        }
+    if confirm in YES_ANSWERS:
+        # Pick up settings changed since the last run, then read them once
+        invalidate_link_config()
+        stats = new_stats()
         zero_pad = bool(config.get("zero_pad", True))
         also_cover = bool(config.get("also_cover", False))
 
@@ -963,6 +991,7 @@ def update_catalog_wizard():
     """Wizard for updating the catalog"""
     console.print("\n[cyan]📚 UPDATE CATALOG WIZARD[/cyan]")
 
+    _wait_for_initial_index()
     catalog = AudiobookCatalog()
 
     # Step 1: Choose update method
@@ -984,9 +1013,10 @@ def update_catalog_wizard():
 
         print(f"\n📂 Scanning library path: {library_path}")
         progress = ProgressIndicator("Indexing audiobooks")
-        count = catalog.index_directory(
-            library_path, verbose=False, progress_callback=progress
-        )
+        with catalog.bulk():
+            count = catalog.index_directory(
+                library_path, verbose=False, progress_callback=progress
+            )
         console.print(f"[green]✅ Indexed {count} audiobooks[/green]")
     elif choice == "2":
         # Manual directory selection
@@ -994,9 +1024,10 @@ def update_catalog_wizard():
         if root.exists() and root.is_dir():
             print(f"\n📂 Scanning directory: {root}")
             progress = ProgressIndicator("Indexing audiobooks")
-            count = catalog.index_directory(
-                root, verbose=False, progress_callback=progress
-            )
+            with catalog.bulk():
+                count = catalog.index_directory(
+                    root, verbose=False, progress_callback=progress
+                )
             console.print(f"[green]✅ Indexed {count} audiobooks[/green]")
         else:
             console.print(f"[red]❌ Invalid directory: {root}[/red]")
@@ -1016,8 +1047,9 @@ def recent_downloads_scanner():
         choice = input().strip().upper()
         if choice == "C":
             # Use catalog for recent items
+            _wait_for_initial_index()
             catalog = AudiobookCatalog()
-            results = catalog.search("*", limit=50)  # Get 50 most recent
+            results = catalog.recent(limit=50)
 
             if results:
                 selected_paths = fzf_pick(results, multi=True)
@@ -1076,15 +1108,16 @@ def folder_batch_wizard():
     console.print("\n[yellow]Scanning for audiobooks...[/yellow]")
 
     try:
-        for item in src_folder.iterdir():
-            if item.is_dir() and (any(item.glob("*.m4b")) or any(item.glob("*.mp3"))):
-                audiobook_dirs.append(item)
+        with os.scandir(src_folder) as it:
+            for entry in it:
+                if entry.is_dir() and _has_audio(entry.path):
+                    audiobook_dirs.append(Path(entry.path))
     except PermissionError:
         console.print("[red]❌ Permission denied[/red]")
         return
 
     if not audiobook_dirs:
-        if any(src_folder.glob("*.m4b")) or any(src_folder.glob("*.mp3")):
+        if _has_audio(src_folder):
             audiobook_dirs = [src_folder]
         else:
             console.print("[red]No audiobooks found[/red]")
@@ -1105,15 +1138,9 @@ def folder_batch_wizard():
         dst_root = Path(dst_input)
 
     # Link all found audiobooks
-    stats = {
-        "linked": 0,
-        "replaced": 0,
-        "already": 0,
-        "exists": 0,
-        "excluded": 0,
-        "skipped": 0,
-        "errors": 0,
-    }
+    # Pick up settings changed since the last run, then read them once
+    invalidate_link_config()
+    stats = new_stats()
     zero_pad = bool(config.get("zero_pad", True))
     also_cover = bool(config.get("also_cover", False))
 
@@ -1124,15 +1151,7 @@ def folder_batch_wizard():
     summary_table(stats, perf_counter())
 
 
-def maintenance_menu():
-    """Database maintenance and management menu"""
-    from .catalog import AudiobookCatalog
-
-    console.print("\n[cyan]🛠️ DATABASE MAINTENANCE[/cyan]")
-
-    while True:
-        console.print(
-            """
+_MAINTENANCE_MENU = """
 [yellow]Database maintenance options:[/yellow]
 
 [green]1[/green]) 🧹 Clean orphaned entries
@@ -1144,9 +1163,25 @@ def maintenance_menu():
 [green]7[/green]) ↩️  Back to main menu
 
 """
-        )
+
+
+def maintenance_menu():
+    """Database maintenance and management menu"""
+    from .catalog import AudiobookCatalog
+
+    console.print("\n[cyan]🛠️ DATABASE MAINTENANCE[/cyan]")
+
+    while True:
+        console.print(_MAINTENANCE_MENU)
         choice = input("Enter your choice (1-7): ").strip()
 
+        if choice == "7" or choice.lower() in ["q", "quit", "back"]:
+            break
+        if choice not in {"1", "2", "3", "4", "5", "6"}:
+            console.print("[yellow]Invalid choice. Please enter 1-7.[/yellow]")
+            continue
+
+        _wait_for_initial_index()
         catalog = AudiobookCatalog()
 
         try:
@@ -1213,15 +1248,6 @@ def maintenance_menu():
                 result = catalog.rebuild_indexes(True)
                 console.print("[green]✅ Indexes rebuilt successfully[/green]")
 
-            elif choice == "7" or choice.lower() in ["q", "quit", "back"]:
-                catalog.close()
-                break
-
-            else:
-                console.print("[yellow]Invalid choice. Please enter 1-7.[/yellow]")
-                catalog.close()
-                continue
-
         except Exception as e:
             console.print(f"[red]❌ Error: {e}[/red]")
         finally:
@@ -1263,7 +1289,7 @@ def configure_permissions_wizard(config):
         input("\nEnable automatic permission setting? [y/N]: ").strip().lower()
     )
 
-    if enable_choice in ["y", "yes"]:
+    if enable_choice in YES_ANSWERS:
         config["set_permissions"] = True
 
         console.print("\n[green]Choose permission mode:[/green]")
@@ -1360,7 +1386,7 @@ def configure_dir_permissions_wizard(config):
         .lower()
     )
 
-    if enable_choice in ["y", "yes"]:
+    if enable_choice in YES_ANSWERS:
         config["set_dir_permissions"] = True
 
         console.print("\n[green]Choose permission mode:[/green]")
@@ -1452,7 +1478,7 @@ def configure_ownership_wizard(config):
         input("\nEnable automatic ownership setting? [y/N]: ").strip().lower()
     )
 
-    if enable_choice in ["y", "yes"]:
+    if enable_choice in YES_ANSWERS:
         config["set_ownership"] = True
 
         console.print("\n[green]Choose ownership setup:[/green]")
@@ -1507,9 +1533,29 @@ def configure_ownership_wizard(config):
         console.print("[yellow]❌ File ownership setting disabled[/yellow]")
 
 
+_SETTINGS_OPTIONS = """
+[green]Options:[/green]
+  1) Change library path
+  2) Change legacy torrent path
+  3) Configure integrations
+  4) Toggle zero padding
+  5) Toggle cover linking
+  6) Configure file permissions
+  7) Configure directory permissions
+  8) Configure ownership
+  9) Configure logging
+ 10) Add recent source
+ 11) Remove recent source
+ 12) Reset settings to default
+ 13) Back to main menu
+"""
+
+
 def settings_menu():
     """Settings and preferences menu"""
     config = load_config()
+    # Ordered set of recent sources (dict keys keep insertion order)
+    recent_sources = dict.fromkeys(_get_recent_sources(config))
 
     console.print("\n[cyan]⚙️ SETTINGS MENU[/cyan]")
 
@@ -1609,24 +1655,9 @@ def settings_menu():
   Log file: {log_file_display}
   Log console: {log_console_display}
   Log format: {log_format_display}
-  Recent sources: {", ".join(_get_recent_sources(config)[:5])}
-
-[green]Options:[/green]
-  1) Change library path
-  2) Change legacy torrent path
-  3) Configure integrations
-  4) Toggle zero padding
-  5) Toggle cover linking
-  6) Configure file permissions
-  7) Configure directory permissions
-  8) Configure ownership
-  9) Configure logging
- 10) Add recent source
- 11) Remove recent source
- 12) Reset settings to default
- 13) Back to main menu
-"""
+  Recent sources: {", ".join(_get_recent_sources(config)[:5])}"""
         )
+        console.print(_SETTINGS_OPTIONS)
         choice = input("Select an option (1-13): ").strip()
 
         if choice == "1":
@@ -1662,21 +1693,15 @@ def settings_menu():
             configure_logging_wizard(config)
         elif choice == "10":
             source = input("Enter source path to add: ").strip()
-            recent_sources = config.get("recent_sources", [])
-            if not isinstance(recent_sources, list):
-                recent_sources = []
             if source and source not in recent_sources:
-                recent_sources.append(source)
-                config["recent_sources"] = recent_sources
+                recent_sources[source] = None
+                config["recent_sources"] = list(recent_sources)
                 console.print("[green]Source added to recent sources.[/green]")
         elif choice == "11":
             source = input("Enter source path to remove: ").strip()
-            recent_sources = config.get("recent_sources", [])
-            if not isinstance(recent_sources, list):
-                recent_sources = []
             if source and source in recent_sources:
-                recent_sources.remove(source)
-                config["recent_sources"] = recent_sources
+                del recent_sources[source]
+                config["recent_sources"] = list(recent_sources)
                 console.print("[green]Source removed from recent sources.[/green]")
         elif choice == "12":
             # Reset to default settings
@@ -1706,6 +1731,7 @@ def settings_menu():
                     "show_path": False,
                 },
             }
+            recent_sources.clear()
             console.print("[green]Settings reset to default.[/green]")
         elif choice == "13":
             break
@@ -1715,10 +1741,7 @@ def settings_menu():
     save_config(config)
 
 
-def show_interactive_help():
-    """Show help for interactive mode"""
-    print(
-        """
+_HELP_TEXT = """
 [cyan]❓ HARDBOUND HELP[/cyan]
 
 [bold]What does Hardbound do?[/bold]
@@ -1740,17 +1763,20 @@ def show_interactive_help():
 • Checks that source and destination are on same filesystem
 
 [yellow]Press Enter to continue...[/yellow]"""
-    )
+
+
+def show_interactive_help():
+    """Show help for interactive mode"""
+    print(_HELP_TEXT)
     input()
 
 
 def find_recent_audiobooks(hours=24, max_depth=3, config=None):
-    """Find recently modified audiobook files"""
+    """Find recently modified audiobook folders with better depth control"""
     if config is None:
         config = load_config()
-    """Find recently modified audiobook folders with better depth control"""
-    recent = []
-    seen = set()
+    recent: list[tuple[str, float]] = []
+    seen: set[str] = set()
     cutoff = datetime.now().timestamp() - (hours * 3600)
 
     search_paths = [
@@ -1775,30 +1801,72 @@ def find_recent_audiobooks(hours=24, max_depth=3, config=None):
             search_paths.append(sys_path)
 
     for base_path in search_paths:
-        if not Path(base_path).exists():
-            continue
-
         try:
-            for root, dirs, files in os.walk(base_path):
-                # Limit depth
-                depth = root[len(str(base_path)) :].count(os.sep)
-                if depth > max_depth:
-                    dirs.clear()
+            base_mtime = os.stat(base_path).st_mtime
+        except OSError:
+            continue
+        # Resolve symlinks once per base; nothing below it is followed
+        base = os.fspath(base_path)
+        real_base = os.path.realpath(base)
+        _walk_recent(base, real_base, base_mtime, 0, max_depth, cutoff, seen, recent)
+
+    recent.sort(key=lambda item: item[1], reverse=True)
+    return [Path(path) for path, _mtime in recent[:20]]
+
+
+def _walk_recent(
+    path: str,
+    real_path: str,
+    mtime: float,
+    depth: int,
+    max_depth: int,
+    cutoff: float,
+    seen: set[str],
+    out: list[tuple[str, float]],
+) -> None:
+    """Collect recently modified audiobook folders below path, depth-first
+
+    real_path is path with symlinks resolved; it is extended by plain string
+    joins because symlinked subdirectories are never descended into. depth is
+    the number of levels below the search base and is carried as an integer
+    rather than recounted from the path.
+    """
+    subdirs = []
+    has_audio = False
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            subdirs.append(entry)
+                    elif not has_audio and entry.name.endswith(_AUDIO_EXT):
+                        has_audio = True
+                except OSError:
                     continue
+    except OSError:
+        return
 
-                root_path = Path(root)
-                if root_path.stat().st_mtime > cutoff:
-                    # Check if it contains audiobook files
-                    if any(f.endswith((".m4b", ".mp3")) for f in files):
-                        resolved = root_path.resolve()
-                        if resolved not in seen:
-                            seen.add(resolved)
-                            recent.append(root_path)
-
-        except PermissionError:
-            continue
+    if has_audio and mtime > cutoff and real_path not in seen:
+        seen.add(real_path)
+        out.append((path, mtime))
 
-    return sorted(recent, key=lambda p: p.stat().st_mtime, reverse=True)[:20]
+    if depth < max_depth:
+        for entry in subdirs:
+            try:
+                entry_mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+            _walk_recent(
+                entry.path,
+                os.path.join(real_path, entry.name),
+                entry_mtime,
+                depth + 1,
+                max_depth,
+                cutoff,
+                seen,
+                out,
+            )
 
 
 def _link_selected_paths(selected_paths: list[str]):
@@ -1821,18 +1889,12 @@ def _link_selected_paths(selected_paths: list[str]):
         f"\n[yellow]Link {len(selected_paths)} audiobook(s)? [y/N]: [/yellow]",
         end="",
     )
-    if input().strip().lower() not in ["y", "yes"]:
+    if input().strip().lower() not in YES_ANSWERS:
         return
 
-    stats = {
-        "linked": 0,
-        "replaced": 0,
-        "already": 0,
-        "exists": 0,
-        "excluded": 0,
-        "skipped": 0,
-        "errors": 0,
-    }
+    # Pick up settings changed since the last run, then read them once
+    invalidate_link_config()
+    stats = new_stats()
     zero_pad = bool(config.get("zero_pad", True))
     also_cover = bool(config.get("also_cover", False))
 
@@ -1847,28 +1909,30 @@ def _link_selected_paths(selected_paths: list[str]):
 
 def browse_directory_tree():
     """Interactive directory tree browser (legacy mode)"""
-    current = Path.cwd()
+    current = os.fspath(Path.cwd())
 
     while True:
         console.print(f"\n[cyan]📁 Current: {current}[/cyan]")
+        parent = os.path.dirname(current) or current
 
-        items = []
+        # Keep plain path strings; only promote to Path once an entry is chosen
+        items: list[tuple[str, str]] = []
         try:
             # Show parent
-            items.append(("..", current.parent))
-
-            # List directories first
-            for item in sorted(current.iterdir()):
-                if item.is_dir():
-                    # Check if it contains audiobooks
-                    has_audio = any(item.glob("*.m4b")) or any(item.glob("*.mp3"))
-                    marker = " 🎵" if has_audio else ""
-                    items.append((f"[D] {item.name}{marker}", item))
+            items.append(("..", parent))
+
+            # List directories from a single scandir pass, sorted by name
+            with os.scandir(current) as it:
+                items += sorted(
+                    (f"[D] {entry.name}", entry.path) for entry in it if entry.is_dir()
+                )
         except PermissionError:
             console.print("[red]Permission denied[/red]")
 
-        for i, (display, _path) in enumerate(items[:20], 1):
-            print(f"  {i:2d}) {display}")
+        for i, (display, path) in enumerate(items[:20], 1):
+            # Only probe the rows actually shown for audiobooks
+            marker = " 🎵" if i > 1 and _has_audio(path) else ""
+            print(f"  {i:2d}) {display}{marker}")
 
         if len(items) > 20:
             print(f"  ... and {len(items) - 20} more")
@@ -1879,14 +1943,14 @@ def browse_directory_tree():
         choice = input("Choice: ").strip().lower()
 
         if choice == "select":
-            return current
+            return Path(current)
         elif choice == "back":
-            current = current.parent
+            current = parent
         elif choice.isdigit():
             idx = int(choice) - 1
             if 0 <= idx < len(items):
-                _, new_path = items[idx]
-                if new_path.is_dir():
+                new_path = items[idx][1]
+                if os.path.isdir(new_path):
                     current = new_path
 
 
@@ -1894,25 +1958,35 @@ def configure_integrations_wizard(config_manager: ConfigManager):
     """Configure integration settings"""
     console.print("\n[cyan]🔧 INTEGRATION CONFIGURATION[/cyan]")
 
+    # Only rebuild the listing after an integration may have been changed
+    dirty = True
+    integration_list: list[str] = []
+    rendered = ""
+
     while True:
-        integrations = config_manager.get("integrations", {})
-        if not isinstance(integrations, dict):
-            integrations = copy.deepcopy(DEFAULT_CONFIG["integrations"])
-            config_manager.config["integrations"] = integrations
-
-        assert isinstance(integrations, dict)  # Tell Pylance integrations is a dict
-
-        console.print("\n[yellow]Available integrations:[/yellow]")
-        integration_list = list(integrations.keys())
-        for i, (name, int_config) in enumerate(integrations.items(), 1):
-            if isinstance(int_config, dict):
-                enabled = "✅" if int_config.get("enabled", False) else "❌"
-                path = int_config.get("path", "Not set")
-                limit = int_config.get("path_limit")
-                limit_str = f" (limit: {limit} chars)" if limit else ""
-                console.print(
-                    f"  [green]{i}[/green]) {name.upper()}: {enabled} {path}{limit_str}"
-                )
+        if dirty:
+            integrations = config_manager.get("integrations", {})
+            if not isinstance(integrations, dict):
+                integrations = copy.deepcopy(DEFAULT_CONFIG["integrations"])
+                config_manager.config["integrations"] = integrations
+
+            assert isinstance(integrations, dict)  # Tell Pylance integrations is a dict
+
+            integration_list = list(integrations.keys())
+            lines = ["\n[yellow]Available integrations:[/yellow]"]
+            for i, (name, int_config) in enumerate(integrations.items(), 1):
+                if isinstance(int_config, dict):
+                    enabled = "✅" if int_config.get("enabled", False) else "❌"
+                    path = int_config.get("path", "Not set")
+                    limit = int_config.get("path_limit")
+                    limit_str = f" (limit: {limit} chars)" if limit else ""
+                    lines.append(
+                        f"  [green]{i}[/green]) {name.upper()}: {enabled} {path}{limit_str}"
+                    )
+            rendered = "\n".join(lines)
+            dirty = False
+
+        console.print(rendered)
 
         console.print("\n[green]Options:[/green]")
         console.print(
@@ -1929,6 +2003,7 @@ def configure_integrations_wizard(config_manager: ConfigManager):
             if 0 <= idx < len(integration_list):
                 integration_name = integration_list[idx]
                 configure_single_integration(config_manager, integration_name)
+                dirty = True
         else:
             console.print("[yellow]Invalid choice.[/yellow]")
 
@@ -2017,43 +2092,30 @@ def configure_single_integration(config_manager: ConfigManager, integration_name
             break
 
 
-def configure_logging_wizard(config):
-    """Configure logging settings wizard"""
-    log.info("logging.config_wizard_start", operation="configure_logging")
-
-    console.print("\n[cyan]📋 LOGGING CONFIGURATION[/cyan]")
-
-    # Ensure logging config exists
-    if "logging" not in config:
-        config["logging"] = {}
-
-    logging_config = config["logging"]
-    if not isinstance(logging_config, dict):
-        logging_config = config["logging"] = {}
+_LOGGING_WIZARD_DEFAULTS: dict[str, Any] = {
+    "level": "INFO",
+    "file_enabled": True,
+    "console_enabled": True,
+    "json_file": True,
+    "log_path": "logs/hardbound.log",
+    "rotate_max_bytes": 10485760,
+    "rotate_backups": 5,
+    "rich_tracebacks": True,
+    "show_path": False,
+}
 
-    while True:
-        # Display current settings
-        level = logging_config.get("level", "INFO")
-        file_enabled = logging_config.get("file_enabled", True)
-        console_enabled = logging_config.get("console_enabled", True)
-        json_file = logging_config.get("json_file", True)
-        log_path = logging_config.get("log_path", "logs/hardbound.log")
-        rotate_max_bytes = logging_config.get("rotate_max_bytes", 10485760)
-        rotate_backups = logging_config.get("rotate_backups", 5)
-        rich_tracebacks = logging_config.get("rich_tracebacks", True)
-        show_path = logging_config.get("show_path", False)
+_STATE_LABELS = {True: "✅ Enabled", False: "❌ Disabled"}
 
-        console.print(
-            f"""
+_LOGGING_WIZARD_TEMPLATE = """
 [yellow]Current logging settings:[/yellow]
   Log level: [cyan]{level}[/cyan]
-  File logging: {"✅ Enabled" if file_enabled else "❌ Disabled"}
-  Console logging: {"✅ Enabled" if console_enabled else "❌ Disabled"}
-  JSON file format: {"✅ Enabled" if json_file else "❌ Disabled"}
+  File logging: {file_enabled}
+  Console logging: {console_enabled}
+  JSON file format: {json_file}
   Log file path: {log_path}
-  File rotation: {rotate_max_bytes // 1024 // 1024}MB, {rotate_backups} backups
-  Rich tracebacks: {"✅ Enabled" if rich_tracebacks else "❌ Disabled"}
-  Show file paths: {"✅ Enabled" if show_path else "❌ Disabled"}
+  File rotation: {rotate_mb}MB, {rotate_backups} backups
+  Rich tracebacks: {rich_tracebacks}
+  Show file paths: {show_path}
 
 [green]Options:[/green]
   1) Change log level (DEBUG/INFO/WARNING/ERROR)
@@ -2067,6 +2129,49 @@ def configure_logging_wizard(config):
   9) Apply settings (reinitialize logging)
   q) Back to settings menu
 """
+
+
+def configure_logging_wizard(config):
+    """Configure logging settings wizard"""
+    log.info("logging.config_wizard_start", operation="configure_logging")
+
+    console.print("\n[cyan]📋 LOGGING CONFIGURATION[/cyan]")
+
+    # Ensure logging config exists
+    if "logging" not in config:
+        config["logging"] = {}
+
+    logging_config = config["logging"]
+    if not isinstance(logging_config, dict):
+        logging_config = config["logging"] = {}
+
+    while True:
+        # Display current settings
+        settings = ChainMap(logging_config, _LOGGING_WIZARD_DEFAULTS)
+        level = settings["level"]
+        file_enabled = settings["file_enabled"]
+        console_enabled = settings["console_enabled"]
+        json_file = settings["json_file"]
+        log_path = settings["log_path"]
+        rotate_max_bytes = settings["rotate_max_bytes"]
+        rotate_backups = settings["rotate_backups"]
+        rich_tracebacks = settings["rich_tracebacks"]
+        show_path = settings["show_path"]
+
+        console.print(
+            _LOGGING_WIZARD_TEMPLATE.format_map(
+                {
+                    "level": level,
+                    "file_enabled": _STATE_LABELS[bool(file_enabled)],
+                    "console_enabled": _STATE_LABELS[bool(console_enabled)],
+                    "json_file": _STATE_LABELS[bool(json_file)],
+                    "log_path": log_path,
+                    "rotate_mb": rotate_max_bytes // 1024 // 1024,
+                    "rotate_backups": rotate_backups,
+                    "rich_tracebacks": _STATE_LABELS[bool(rich_tracebacks)],
+                    "show_path": _STATE_LABELS[bool(show_path)],
+                }
+            )
         )
 
         choice = input("Select option (1-9, q): ").strip().lower()
@@ -5,23 +5,140 @@
 import os
 import re
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, NamedTuple
 
-from rich.console import Console
+try:
+    import grp
+    import pwd
+except ImportError:  # Windows: no user/group database
+    grp = pwd = None
 
 from .config import ConfigManager
-from .display import Sty, row
+from .display import Sty, console, row
 from .red_paths import build_dst_paths, parse_tokens
-from .utils.logging import get_logger
+from .utils.logging import bind_audiobook_context, get_logger
 from .utils.timing import log_step
 
-# Global console instance
-console = Console()
-
 # Get logger for this module
 log = get_logger(__name__)
 
 
+class PermSpec(NamedTuple):
+    """Permission/ownership settings resolved once per link run"""
+
+    do_file: bool
+    do_dir: bool
+    file_mode: int
+    dir_mode: int
+    do_own: bool
+    uid: int
+    gid: int
+
+
+# fchmod/fchown through os.chmod/os.chown on an open fd (not on Windows)
+_USE_FD_PERMS = {os.chmod, os.chown} <= os.supports_fd
+
+# Resolved from the config on first use in a link run
+_perm_spec: PermSpec | None = None
+
+
+def invalidate_link_config() -> None:
+    """Drop per-run caches so the next link run re-reads config and devices"""
+    global _perm_spec
+    _perm_spec = None
+    # Owner settings may have changed and destinations been remounted
+    _OWNER_CACHE.clear()
+    _st_dev.cache_clear()
+
+
+# (owner_user, owner_group) -> (uid, gid); NSS lookups can be slow (LDAP/AD)
+_OWNER_CACHE: dict[tuple[str, str], tuple[int, int]] = {}
+
+
+def _resolve_owner(owner_user: Any, owner_group: Any) -> tuple[int, int]:
+    """Map configured user/group names or numeric ids to (uid, gid); -1 = keep"""
+    # Non-string settings mean "leave unchanged", same as empty ones
+    user = owner_user if isinstance(owner_user, str) else ""
+    group = owner_group if isinstance(owner_group, str) else ""
+    key = (user, group)
+    cached = _OWNER_CACHE.get(key)
+    if cached is not None:
+        return cached
+    if pwd is None or grp is None:
+        raise ValueError("ownership is not supported on this platform")
+
+    # Handle numeric user ID or username
+    if user:
+        uid = int(user) if user.isdigit() else pwd.getpwnam(user).pw_uid
+    else:
+        uid = -1
+
+    # Handle numeric group ID or groupname
+    if group:
+        gid = int(group) if group.isdigit() else grp.getgrnam(group).gr_gid
+    else:
+        gid = -1
+
+    _OWNER_CACHE[key] = (uid, gid)
+    return uid, gid
+
+
+def _load_perm_spec() -> PermSpec:
+    """Resolve permission/ownership config into a PermSpec, cached per run"""
+    global _perm_spec
+    if _perm_spec is not None:
+        return _perm_spec
+
+    config = ConfigManager().load_config()
+
+    file_mode = config.get("file_permissions", 0o644)
+    do_file = bool(config.get("set_permissions", False))
+    if do_file and not isinstance(file_mode, int):
+        log.warning("permissions.file_invalid", configured_perms=file_mode)
+        do_file = False
+
+    dir_mode = config.get("dir_permissions", 0o755)
+    do_dir = bool(config.get("set_dir_permissions", False)) and isinstance(
+        dir_mode, int
+    )
+
+    owner_user = config.get("owner_user", "")
+    owner_group = config.get("owner_group", "")
+    do_own = bool(config.get("set_ownership", False)) and bool(
+        (isinstance(owner_user, str) and owner_user)
+        or (isinstance(owner_group, str) and owner_group)
+    )
+    uid = gid = -1
+    if do_own:
+        try:
+            uid, gid = _resolve_owner(owner_user, owner_group)
+        except (KeyError, ValueError) as e:
+            log.error(
+                "ownership.resolve_failed",
+                error=str(e),
+                user=owner_user,
+                group=owner_group,
+            )
+            console.print(f"[yellow]⚠️  Ownership setting failed: {e}[/yellow]")
+            do_own = False
+
+    _perm_spec = PermSpec(
+        do_file=do_file,
+        do_dir=do_dir,
+        file_mode=file_mode if do_file else 0,
+        dir_mode=dir_mode if do_dir else 0,
+        do_own=do_own,
+        uid=uid,
+        gid=gid,
+    )
+    return _perm_spec
+
+
 def _enforce_asin_policy(folder_name: str, filename: str, asin: str) -> None:
     """
     Enforce policy that ASIN must be present in both folder and file names.
@@ -50,128 +167,108 @@ def _enforce_asin_policy(folder_name: str, filename: str, asin: str) -> None:
         raise ValueError(f"ASIN policy violation: {asin} missing from folder or file")
 
 
-def set_file_permissions_and_ownership(file_path: Path):
-    """Set file permissions and ownership based on configuration"""
-    config_manager = ConfigManager()
-    config = config_manager.load_config()
-
-    logger = log.bind(file_path=str(file_path))
+def set_file_permissions_and_ownership(
+    file_path: Path,
+    dir_fd: int | None = None,
+    st: os.stat_result | None = None,
+):
+    """Set file permissions and ownership based on configuration
 
-    if config.get("set_permissions", False):
-        file_perms = config.get("file_permissions", 0o644)
-        if isinstance(file_perms, int):
-            try:
-                os.chmod(file_path, file_perms)
-                logger.debug("permissions.file_set", permissions=oct(file_perms))
-            except OSError as e:
-                logger.error(
-                    "permissions.file_failed", error=str(e), permissions=oct(file_perms)
-                )
-        else:
-            logger.warning("permissions.file_invalid", configured_perms=file_perms)
+    With dir_fd, file_path is resolved by name relative to that open directory.
+    st is a current stat of the file's inode (e.g. the hardlink source); when
+    given, chmod/chown are skipped if the inode already has the wanted values.
+    """
+    spec = _load_perm_spec()
+    target = file_path if dir_fd is None else file_path.name
 
-    if config.get("set_ownership", False):
-        owner_user = config.get("owner_user", "")
-        owner_group = config.get("owner_group", "")
+    if spec.do_file and (st is None or st.st_mode & 0o7777 != spec.file_mode):
+        try:
+            os.chmod(target, spec.file_mode, dir_fd=dir_fd)
+            log.debug(
+                "permissions.file_set",
+                file_path=str(file_path),
+                permissions=oct(spec.file_mode),
+            )
+        except OSError as e:
+            log.error(
+                "permissions.file_failed",
+                file_path=str(file_path),
+                error=str(e),
+                permissions=oct(spec.file_mode),
+            )
 
-        if (isinstance(owner_user, str) and owner_user) or (
-            isinstance(owner_group, str) and owner_group
-        ):
-            try:
-                import grp
-                import pwd
-
-                # Handle numeric user ID or username
-                if isinstance(owner_user, str) and owner_user:
-                    if owner_user.isdigit():
-                        uid = int(owner_user)
-                    else:
-                        uid = pwd.getpwnam(owner_user).pw_uid
-                else:
-                    uid = -1
-
-                # Handle numeric group ID or groupname
-                if isinstance(owner_group, str) and owner_group:
-                    if owner_group.isdigit():
-                        gid = int(owner_group)
-                    else:
-                        gid = grp.getgrnam(owner_group).gr_gid
-                else:
-                    gid = -1
-
-                os.chown(file_path, uid, gid)
-                logger.debug(
-                    "ownership.file_set",
-                    user=owner_user,
-                    group=owner_group,
-                    uid=uid,
-                    gid=gid,
-                )
-            except (KeyError, OSError, ValueError) as e:
-                logger.error(
-                    "ownership.file_failed",
-                    error=str(e),
-                    user=owner_user,
-                    group=owner_group,
-                )
-                console.print(f"[yellow]⚠️  Ownership setting failed: {e}[/yellow]")
+    if spec.do_own and (
+        st is None
+        or (spec.uid != -1 and st.st_uid != spec.uid)
+        or (spec.gid != -1 and st.st_gid != spec.gid)
+    ):
+        try:
+            os.chown(target, spec.uid, spec.gid, dir_fd=dir_fd)
+            log.debug(
+                "ownership.file_set",
+                file_path=str(file_path),
+                uid=spec.uid,
+                gid=spec.gid,
+            )
+        except OSError as e:
+            log.error(
+                "ownership.file_failed",
+                file_path=str(file_path),
+                error=str(e),
+                uid=spec.uid,
+                gid=spec.gid,
+            )
+            console.print(f"[yellow]⚠️  Ownership setting failed: {e}[/yellow]")
 
 
 def set_dir_permissions_and_ownership(dir_path: Path):
     """Set directory permissions and ownership based on configuration"""
-    config_manager = ConfigManager()
-    config = config_manager.load_config()
+    spec = _load_perm_spec()
 
-    if config.get("set_dir_permissions", False):
-        dir_perms = config.get("dir_permissions", 0o755)
-        if isinstance(dir_perms, int):
+    # When both apply, open the directory once and fchmod/fchown the fd
+    # rather than resolving the path for each call
+    fd = None
+    if spec.do_dir and spec.do_own and _USE_FD_PERMS:
+        try:
+            fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            pass  # fall back to the path; the calls below report failures
+    target = dir_path if fd is None else fd
+
+    try:
+        if spec.do_dir:
             try:
-                os.chmod(dir_path, dir_perms)
-                console.print(f"[dim]  📁 chmod {oct(dir_perms)[-3:]} (dir)[/dim]")
+                os.chmod(target, spec.dir_mode)
+                console.print(f"[dim]  📁 chmod {oct(spec.dir_mode)[-3:]} (dir)[/dim]")
             except OSError as e:
                 console.print(
                     f"[yellow]⚠️  Directory permission setting failed: {e}[/yellow]"
                 )
 
-    if config.get("set_ownership", False):
-        owner_user = config.get("owner_user", "")
-        owner_group = config.get("owner_group", "")
-        if (isinstance(owner_user, str) and owner_user) or (
-            isinstance(owner_group, str) and owner_group
-        ):
+        if spec.do_own:
             try:
-                import grp
-                import pwd
-
-                # Handle numeric user ID or username
-                if isinstance(owner_user, str) and owner_user:
-                    if owner_user.isdigit():
-                        uid = int(owner_user)
-                    else:
-                        uid = pwd.getpwnam(owner_user).pw_uid
-                else:
-                    uid = -1
-
-                # Handle numeric group ID or groupname
-                if isinstance(owner_group, str) and owner_group:
-                    if owner_group.isdigit():
-                        gid = int(owner_group)
-                    else:
-                        gid = grp.getgrnam(owner_group).gr_gid
-                else:
-                    gid = -1
-
-                os.chown(dir_path, uid, gid)
-                console.print(f"[dim]  👤 chown {owner_user}:{owner_group} (dir)[/dim]")
-            except (OSError, KeyError, ValueError) as e:
+                os.chown(target, spec.uid, spec.gid)
+                console.print(f"[dim]  👤 chown {spec.uid}:{spec.gid} (dir)[/dim]")
+            except OSError as e:
                 console.print(
                     f"[yellow]⚠️  Directory ownership setting failed: {e}[/yellow]"
                 )
+    finally:
+        if fd is not None:
+            os.close(fd)
 
 
 # Exclusions
-EXCLUDE_DEST_NAMES = {"cover.jpg", "metadata.json"}
-EXCLUDE_DEST_EXTS = {".epub"}
+STAT_KEYS = ("linked", "replaced", "already", "exists", "excluded", "skipped", "errors")
+
+
+def new_stats() -> Counter[str]:
+    """Create a link statistics counter with every summary key present"""
+    return Counter(dict.fromkeys(STAT_KEYS, 0))
+
+
+EXCLUDE_DEST_NAMES = frozenset({"cover.jpg", "metadata.json"})
+EXCLUDE_DEST_EXTS = frozenset({".epub"})
 
 WEIRD_SUFFIXES = [
     (".cue.jpg", ".jpg"),
@@ -180,62 +277,150 @@ def set_dir_permissions_and_ownership(dir_path: Path):
     (".cue.m4b", ".m4b"),
     (".cue.mp3", ".mp3"),
 ]
+# All weird suffixes as one anchored, case-insensitive alternation, mapped
+# back to their fix by the lowercased match
+_WEIRD_FIXES = dict(WEIRD_SUFFIXES)
+_WEIRD_RE = re.compile(
+    "(?:" + "|".join(re.escape(bad) for bad, _good in WEIRD_SUFFIXES) + r")\Z",
+    re.IGNORECASE,
+)
+
+# ASIN tag kept when trailing [tag]/{tag} groups are stripped from names
+_ASIN_TAG_RE = re.compile(r"\{ASIN\.[A-Z0-9]+\}")
 
 IMG_EXTS = {".jpg", ".jpeg", ".png", ".webp"}
 DOC_EXTS = {".pdf", ".txt", ".nfo"}
 AUDIO_EXTS = {".m4b", ".mp3", ".flac", ".m4a"}
 
+# Source extension -> output key (see _OUTPUT_KEYS); keys without a canonical
+# output (m4a) are linked as "<base_name>.<key>" in the destination folder
+_EXT_TO_KEY = {
+    ".cue": "cue",
+    ".m4b": "m4b",
+    ".mp3": "mp3",
+    ".flac": "flac",
+    ".m4a": "m4a",
+    ".jpg": "jpg",  # canonical .jpg name regardless of source img ext
+    ".jpeg": "jpg",
+    ".png": "jpg",
+    ".webp": "jpg",
+    ".pdf": "pdf",
+    ".txt": "txt",
+    ".nfo": "nfo",
+}
+
+
+# Volume token in base names; the decimal tail is checked by _pad_vol_number
+_VOL_RE = re.compile(r"vol_(\d+(?:\.[^_\s]+)?)")
+
+
+def _pad_vol_number(num_part: str, width: int) -> str | None:
+    """Padded 'vol_NN[.D]' for a matched volume number, None to leave it as is"""
+    whole, dot, decimal = num_part.partition(".")
+    if dot:
+        # Handle decimal volumes like "7.5"; the decimal part must be all digits
+        if not decimal.isdigit():
+            return None
+        return f"vol_{int(whole):0{width}d}.{decimal}"
+    # Handle integer volumes like "7"
+    return f"vol_{int(whole):0{width}d}"
+
+
+def _lower_ext(name: str) -> str:
+    """Lowercased extension of a bare file name, as Path.suffix finds it"""
+    i = name.rfind(".")
+    # A leading dot (".hidden") or a trailing one ("a.") doesn't start one
+    if 0 < i < len(name) - 1:
+        return name[i:].lower()
+    return ""
+
 
 def zero_pad_vol(name: str, width: int = 2) -> str:
     """Turn 'vol_4' into 'vol_04' and preserve decimals like 'vol_7.5' -> 'vol_07.5' (width=2) only in the basename string provided."""
+    i = name.find("vol_")
+    if i < 0:
+        return name
+    if name.find("vol_", i + 4) >= 0:
+        # Rare multi-volume names go through the regex
+        return _VOL_RE.sub(
+            lambda m: _pad_vol_number(m.group(1), width) or m.group(0), name
+        )
 
-    def pad(match):
-        num_part = match.group(1)
-        if "." in num_part:
-            # Handle decimal volumes like "7.5"
-            whole, decimal = num_part.split(".", 1)
-            try:
-                whole_int = int(whole)
-                if (
-                    decimal and decimal.isdigit()
-                ):  # Ensure decimal part is not empty and all digits
-                    return f"vol_{whole_int:0{width}d}.{decimal}"
-                else:
-                    # If decimal part is empty or not all digits, return original match unchanged
-                    return match.group(0)
-            except ValueError:
-                # If whole part is not a valid integer, return original match unchanged
-                return match.group(0)
-        else:
-            # Handle integer volumes like "7"
-            try:
-                return f"vol_{int(num_part):0{width}d}"
-            except ValueError:
-                # If not a valid integer, return original match unchanged
-                return match.group(0)
-
-    return re.sub(r"vol_(\d+(?:\.[^_\s]+)?)", pad, name)
+    # Single occurrence: scan the number by hand, mirroring _VOL_RE
+    n = len(name)
+    start = end = i + 4
+    while end < n and name[end].isdecimal():
+        end += 1
+    if end == start:
+        return name
+    if end < n and name[end] == ".":
+        tail = end + 1
+        while tail < n and name[tail] != "_" and not name[tail].isspace():
+            tail += 1
+        if tail > end + 1:
+            end = tail
+
+    padded = _pad_vol_number(name[start:end], width)
+    if padded is None:
+        return name
+    return f"{name[:i]}{padded}{name[end:]}"
 
 
 def normalize_weird_ext(src_name: str) -> str:
     """Normalize weird suffixes like *.cue.jpg -> *.jpg and *.cue.m4b -> *.m4b."""
-    for bad, good in WEIRD_SUFFIXES:
-        if src_name.endswith(bad):
-            return src_name[: -len(bad)] + good
-    return src_name
+    m = _WEIRD_RE.search(src_name)
+    if m is None:
+        return src_name
+    # Each fix is the tail of its weird suffix; keep that tail as spelled
+    good = _WEIRD_FIXES[m.group().lower()]
+    return src_name[: m.start()] + src_name[m.end() - len(good) :]
+
 
+def _trailing_tags_start(name: str) -> int:
+    """Index where trailing [tag]/{tag} groups (and the space before them) begin
 
+    Single backwards walk, cutting where the old trailing-tags regex did: a
+    group is "[" or "{", at least one non-closer, then "]" or "}". Returns
+    len(name) when there is no trailing group.
+    """
+    n = len(name)
+    cut = end = n
+    while True:
+        while end and name[end - 1].isspace():
+            end -= 1
+        if not end or name[end - 1] not in "]}":
+            return end if cut < n else n
+        close = end - 1
+        if close < 2:  # too short for an opener plus a body
+            return end if cut < n else n
+        # The group's body can't contain a closer; it opens at the leftmost
+        # bracket or brace after the previous closer
+        run = max(name.rfind("]", 0, close), name.rfind("}", 0, close)) + 1
+        square = name.find("[", run, close - 1)
+        curly = name.find("{", run, close - 1)
+        start = min(square, curly) if square >= 0 and curly >= 0 else max(square, curly)
+        if start < 0:
+            return end if cut < n else n
+        cut = end = start
+
+
+@lru_cache(maxsize=1024)
 def clean_base_name(name: str) -> str:
-    """Remove user tags from base name but preserve ASIN for RED compliance"""
-    # Remove user tags like [H2OKing], [UserName] but preserve {ASIN.B09CVBWLZT}
-    import re
+    """Remove user tags from base name but preserve ASIN for RED compliance
 
+    Memoized: batches and repeated interactive runs see the same names.
+    """
+    # Remove user tags like [H2OKing], [UserName] but preserve {ASIN.B09CVBWLZT}
     # First extract and preserve any ASIN tag
-    asin_match = re.search(r"\{ASIN\.[A-Z0-9]+\}", name)
-    asin_tag = asin_match.group(0) if asin_match else ""
+    asin_tag = ""
+    i = name.find("{ASIN.")
+    if i >= 0:
+        asin_match = _ASIN_TAG_RE.search(name, i)
+        if asin_match:
+            asin_tag = asin_match.group(0)
 
     # Remove all bracket and curly brace tags at the end
-    cleaned = re.sub(r"(\s*[\[\{][^\]\}]+[\]\}]\s*)+$", "", name)
+    cleaned = name[: _trailing_tags_start(name)]
 
     # Re-add the ASIN tag if it was present
     if asin_tag:
@@ -244,14 +429,20 @@ def clean_base_name(name: str) -> str:
     return cleaned.strip()
 
 
-def dest_is_excluded(p: Path) -> bool:
-    """Check if destination should be excluded"""
-    name = p.name.casefold()
+def dest_is_excluded_str(dst_str: str) -> bool:
+    """Check if a destination path or file name string should be excluded"""
+    # The excluded names/extensions are ASCII, so lower() is as good as casefold()
+    name = os.path.basename(dst_str).lower()
     if name in EXCLUDE_DEST_NAMES:
         return True
-    if p.suffix.lower() in EXCLUDE_DEST_EXTS:
-        return True
-    return False
+    # Same rule as PurePath.suffix: a leading dot alone is not an extension
+    dot = name.rfind(".")
+    return dot > 0 and name[dot:] in EXCLUDE_DEST_EXTS
+
+
+def dest_is_excluded(p: Path) -> bool:
+    """Check if destination should be excluded"""
+    return dest_is_excluded_str(p.name)
 
 
 def same_inode(a: Path, b: Path) -> bool:
@@ -276,102 +467,199 @@ def ensure_dir(p: Path, dry_run: bool, stats: dict):
         set_dir_permissions_and_ownership(p)
 
 
-def choose_base_outputs(dest_dir: Path, base_name: str):
-    """Return canonical dest paths for common types."""
+# choose_base_outputs keys, each the extension of its canonical output
+_OUTPUT_KEYS = ("cue", "jpg", "m4b", "mp3", "flac", "pdf", "txt", "nfo")
+
+
+# Link/stat/rename/chmod/chown relative to open directory fds (not on Windows);
+# os.replace uses os.rename's renameat support but isn't listed itself
+_USE_DIR_FD = {
+    os.link,
+    os.stat,
+    os.unlink,
+    os.rename,
+    os.chmod,
+    os.chown,
+} <= os.supports_dir_fd
+
+
+@contextmanager
+def _open_dir_fd(dir_path: Path, dry_run: bool):
+    """Yield an fd for dir_path for *at() calls, or None where unavailable"""
+    if dry_run or not _USE_DIR_FD:
+        yield None
+        return
+    try:
+        fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        # Fall back to full paths; do_link reports the actual failures
+        yield None
+        return
+    try:
+        yield fd
+    finally:
+        os.close(fd)
+
+
+def _output_prefix(dest_dir: Path, base_name: str) -> str:
+    """Destination path minus extension for the canonical (tag-free) outputs"""
     # Remove user tags from file names while keeping them in folder names
-    clean_file_base = clean_base_name(base_name)
+    return os.path.join(dest_dir, clean_base_name(base_name))
+
 
-    return {
-        "cue": dest_dir / f"{clean_file_base}.cue",
-        "jpg": dest_dir / f"{clean_file_base}.jpg",
-        "m4b": dest_dir / f"{clean_file_base}.m4b",
-        "mp3": dest_dir / f"{clean_file_base}.mp3",
-        "flac": dest_dir / f"{clean_file_base}.flac",
-        "pdf": dest_dir / f"{clean_file_base}.pdf",
-        "txt": dest_dir / f"{clean_file_base}.txt",
-        "nfo": dest_dir / f"{clean_file_base}.nfo",
-    }
+def choose_base_outputs(dest_dir: Path, base_name: str):
+    """Return canonical dest paths for common types."""
+    prefix = _output_prefix(dest_dir, base_name)
+    return {key: Path(f"{prefix}.{key}") for key in _OUTPUT_KEYS}
 
 
-def do_link(src: Path, dst: Path, force: bool, dry_run: bool, stats: dict):
-    """Create hardlink from src to dst with proper error handling and logging"""
-    logger = log.bind(src=str(src), dst=str(dst), force=force, dry_run=dry_run)
+def _finish_link(
+    src: Path,
+    dst: Path,
+    dst_ref: Path | str,
+    dst_dir_fd: int | None,
+    src_stat: os.stat_result | None,
+    ctx: dict,
+    stats: dict,
+) -> None:
+    """Apply permissions to a newly created link and report it"""
+    spec = _load_perm_spec()
+    if src_stat is None and (spec.do_file or spec.do_own):
+        # The new link shares src's inode; its stat lets unchanged
+        # mode/owner skip chmod/chown
+        try:
+            src_stat = os.stat(dst_ref, dir_fd=dst_dir_fd)
+        except OSError:
+            pass
+    set_file_permissions_and_ownership(dst, dst_dir_fd, src_stat)
+    log.info("link.created", action="create", mode="commit", **ctx)
+    row("🔗", Sty.GREEN, "link", src, dst, False)
+    stats["linked"] += 1
+
+
+def do_link(
+    src: Path,
+    dst: Path,
+    force: bool,
+    dry_run: bool,
+    stats: dict,
+    src_stat: os.stat_result | None = None,
+    dst_dir_fd: int | None = None,
+    src_dir_fd: int | None = None,
+):
+    """Create hardlink from src to dst with proper error handling and logging
+
+    Outside dry runs the link is attempted first; src and dst are only
+    stat'ed (at most once each) when it fails, to tell an existing, already
+    linked or missing file apart. src_stat may be passed in when the caller
+    already stat'ed the source. dst_dir_fd is an open fd for dst's parent
+    directory, used to address dst by name only; src_dir_fd does the same
+    for src. A new link shares src's inode, so src_stat also tells which
+    permission/ownership changes it still needs.
+    """
+    # Shared event fields, passed per call rather than bound per file
+    ctx = {"src": str(src), "dst": str(dst), "force": force, "dry_run": dry_run}
 
     # Safety: ensure we have a valid source
     if src is None or not isinstance(src, Path):
-        logger.warning(
-            "link.skip_invalid_src", reason="invalid_source", src=str(src), dst=str(dst)
-        )
+        log.warning("link.skip_invalid_src", reason="invalid_source", **ctx)
         row("🚫", Sty.GREY, "skip", Path("—"), dst, dry_run)
         stats["skipped"] += 1
         return
 
-    if not dry_run and not src.exists():
-        logger.warning(
-            "link.skip_missing_src",
-            reason="source_not_found",
-            src=str(src),
-            dst=str(dst),
-        )
-        row("⚠️ ", Sty.YELLOW, "skip", src, dst, dry_run)
-        stats["skipped"] += 1
-        return
-
     # Respect destination exclusions
     if dest_is_excluded(dst):
-        logger.debug(
-            "link.skip_excluded",
-            reason="destination_excluded",
-            src=str(src),
-            dst=str(dst),
-        )
+        log.debug("link.skip_excluded", reason="destination_excluded", **ctx)
         row("🚫", Sty.GREY, "excl.", src, dst, dry_run)
         stats["excluded"] += 1
         return
 
+    src_ref = src if src_dir_fd is None else src.name
+    dst_ref = dst if dst_dir_fd is None else dst.name
+
+    if not dry_run:
+        # Common case first: a free destination links in a single syscall
+        try:
+            os.link(src_ref, dst_ref, src_dir_fd=src_dir_fd, dst_dir_fd=dst_dir_fd)
+        except FileExistsError:
+            pass  # sorted out by the stat-based checks below
+        except OSError as e:
+            if src_stat is None:
+                try:
+                    src_stat = os.stat(src_ref, dir_fd=src_dir_fd)
+                except OSError:
+                    pass
+            if src_stat is None:
+                log.warning("link.skip_missing_src", reason="source_not_found", **ctx)
+                row("⚠️ ", Sty.YELLOW, "skip", src, dst, dry_run)
+                stats["skipped"] += 1
+            else:
+                log.error("link.error", action="create", error=str(e), **ctx)
+                row("💥", Sty.RED, "err", src, dst, dry_run)
+            return
+        else:
+            _finish_link(src, dst, dst_ref, dst_dir_fd, src_stat, ctx, stats)
+            return
+
+        if src_stat is None:
+            try:
+                src_stat = os.stat(src_ref, dir_fd=src_dir_fd)
+            except OSError:
+                log.warning("link.skip_missing_src", reason="source_not_found", **ctx)
+                row("⚠️ ", Sty.YELLOW, "skip", src, dst, dry_run)
+                stats["skipped"] += 1
+                return
+
+    try:
+        dst_stat = os.stat(dst_ref, dir_fd=dst_dir_fd)
+    except OSError:
+        dst_stat = None
+
     # Already hardlinked?
-    if dst.exists() and same_inode(src, dst):
-        logger.debug(
-            "link.skip_already_linked", reason="same_inode", src=str(src), dst=str(dst)
-        )
+    if dst_stat is not None and src_stat is None:
+        # Dry runs only need the source stat when dst exists
+        try:
+            src_stat = os.stat(src_ref, dir_fd=src_dir_fd)
+        except OSError:
+            pass
+    if (
+        dst_stat is not None
+        and src_stat is not None
+        and src_stat.st_ino == dst_stat.st_ino
+        and src_stat.st_dev == dst_stat.st_dev
+    ):
+        log.debug("link.skip_already_linked", reason="same_inode", **ctx)
         row("✓", Sty.GREY, "ok", src, dst, dry_run)
         stats["already"] += 1
         return
 
     # Replace if exists & force
-    if dst.exists() and force:
+    if dst_stat is not None and force:
         if dry_run:
-            logger.info(
-                "link.replaced",
-                action="replace",
-                mode="dry_run",
-                src=str(src),
-                dst=str(dst),
-            )
+            log.info("link.replaced", action="replace", mode="dry_run", **ctx)
             row("↻", Sty.YELLOW, "repl", src, dst, dry_run)
             stats["replaced"] += 1
         else:
+            # Link under a temporary name, then rename it over dst in one
+            # atomic step, so dst never goes missing
+            tmp_name = f"{dst.name}.hardbound.tmp.{os.getpid()}"
+            tmp_ref = dst.with_name(tmp_name) if dst_dir_fd is None else tmp_name
             try:
-                dst.unlink()
-                os.link(src, dst)
-                set_file_permissions_and_ownership(dst)
-                logger.info(
-                    "link.replaced",
-                    action="replace",
-                    mode="commit",
-                    src=str(src),
-                    dst=str(dst),
-                )
+                os.link(src_ref, tmp_ref, src_dir_fd=src_dir_fd, dst_dir_fd=dst_dir_fd)
+                try:
+                    os.replace(
+                        tmp_ref, dst_ref, src_dir_fd=dst_dir_fd, dst_dir_fd=dst_dir_fd
+                    )
+                except OSError:
+                    with suppress(OSError):
+                        os.unlink(tmp_ref, dir_fd=dst_dir_fd)
+                    raise
+                set_file_permissions_and_ownership(dst, dst_dir_fd, src_stat)
+                log.info("link.replaced", action="replace", mode="commit", **ctx)
                 row("↻", Sty.BLUE, "repl", src, dst, dry_run)
                 stats["replaced"] += 1
             except OSError as e:
-                logger.error(
-                    "link.error",
-                    action="replace",
-                    error=str(e),
-                    src=str(src),
-                    dst=str(dst),
-                )
+                log.error("link.error", action="replace", error=str(e), **ctx)
                 row("💥", Sty.RED, "err", src, dst, dry_run)
                 print(
                     f"\x1b[31m    {e}\x1b[0m", file=sys.stderr
@@ -380,42 +668,26 @@ def do_link(src: Path, dst: Path, force: bool, dry_run: bool, stats: dict):
         return
 
     # Don't overwrite without force
-    if dst.exists() and not force:
-        logger.debug(
-            "link.exists",
-            reason="destination_exists_no_force",
-            src=str(src),
-            dst=str(dst),
-        )
+    if dst_stat is not None:
+        log.debug("link.exists", reason="destination_exists_no_force", **ctx)
         row("⏭️", Sty.YELLOW, "exist", src, dst, dry_run)
         stats["exists"] += 1
         return
 
     # Create link
     if dry_run:
-        logger.info(
-            "link.created", action="create", mode="dry_run", src=str(src), dst=str(dst)
-        )
+        log.info("link.created", action="create", mode="dry_run", **ctx)
         row("🔗", Sty.YELLOW, "link", src, dst, dry_run)
         stats["linked"] += 1
     else:
+        # dst vanished between the failed link and its stat; try again
         try:
-            os.link(src, dst)
-            set_file_permissions_and_ownership(dst)
-            logger.info(
-                "link.created",
-                action="create",
-                mode="commit",
-                src=str(src),
-                dst=str(dst),
-            )
-            row("🔗", Sty.GREEN, "link", src, dst, dry_run)
-            stats["linked"] += 1
+            os.link(src_ref, dst_ref, src_dir_fd=src_dir_fd, dst_dir_fd=dst_dir_fd)
         except OSError as e:
-            logger.error(
-                "link.error", action="create", error=str(e), src=str(src), dst=str(dst)
-            )
+            log.error("link.error", action="create", error=str(e), **ctx)
             row("💥", Sty.RED, "err", src, dst, dry_run)
+        else:
+            _finish_link(src, dst, dst_ref, dst_dir_fd, src_stat, ctx, stats)
 
 
 @log_step("linker.plan_red")
@@ -494,122 +766,122 @@ def plan_and_link(
         logger.debug("linker.name_zero_padded", new_base_name=base_name)
 
     ensure_dir(dst_dir, dry_run, stats)
-    outputs = choose_base_outputs(dst_dir, base_name)
-    logger.debug(
-        "linker.outputs_planned", output_paths=[str(p) for p in outputs.values()]
-    )
+    # Destination Paths are built per linked file from this one joined string
+    prefix = _output_prefix(dst_dir, base_name)
+    logger.debug("linker.outputs_planned", output_prefix=prefix)
+
+    # Link by name relative to one open fd each for the source and
+    # destination directories
+    with (
+        _open_dir_fd(src_dir, dry_run) as src_fd,
+        _open_dir_fd(dst_dir, dry_run) as dst_fd,
+    ):
+        # Gather source files and normalize weird suffixes in one scandir pass;
+        # Path objects are only built for entries that actually get linked
+        try:
+            normalized = []
+            with os.scandir(src_dir) as it:
+                for entry in it:
+                    fixed_name = normalize_weird_ext(entry.name)
+                    ext = _lower_ext(fixed_name)
+                    normalized.append((entry.path, fixed_name, ext))
+            logger.debug("linker.files_discovered", file_count=len(normalized))
+        except FileNotFoundError:
+            logger.error("linker.src_dir_not_found", src_dir=str(src_dir))
+            print(
+                f"\x1b[31m[ERR] Source directory not found: {src_dir}\x1b[0m",
+                file=sys.stderr,
+            )
+            stats["errors"] += 1
+            return
+
+        if not normalized:
+            logger.warning("linker.no_files_found", src_dir=str(src_dir))
+            console.print(f"[yellow][WARN] No files found in {src_dir}[/yellow]")
+            return
+
+        # Prioritize linking: cue, audio, image, docs
+        for src_path, _fixed_name, ext in normalized:
+            key = _EXT_TO_KEY.get(ext)
+            if key is None:
+                continue
+            if key in _OUTPUT_KEYS:
+                dst = Path(f"{prefix}.{key}")
+            else:
+                dst = dst_dir / f"{base_name}.{key}"
+
+            do_link(
+                Path(src_path),
+                dst,
+                force=force,
+                dry_run=dry_run,
+                stats=stats,
+                dst_dir_fd=dst_fd,
+                src_dir_fd=src_fd,
+            )
 
-    # Gather source files
-    try:
-        files = list(src_dir.iterdir())
-        logger.debug("linker.files_discovered", file_count=len(files))
-    except FileNotFoundError:
-        logger.error("linker.src_dir_not_found", src_dir=str(src_dir))
-        print(
-            f"\x1b[31m[ERR] Source directory not found: {src_dir}\x1b[0m",
-            file=sys.stderr,
-        )
-        stats["errors"] += 1
-        return
+        # Optionally make a plain cover.jpg as well — but only if not excluded
+        if also_cover:
+            named_cover = Path(f"{prefix}.jpg")
+            plain_cover = dst_dir / "cover.jpg"
+            if not dest_is_excluded(plain_cover):
+                named_cover_exists = named_cover.exists()
+                if named_cover_exists or dry_run:
+                    # If dry-run and not created yet, pick source image to show intent
+                    src_img = None
+                    if not named_cover_exists:
+                        src_img = next(
+                            (
+                                Path(p)
+                                for p, _n, ext in normalized
+                                if ext in (".jpg", ".jpeg", ".png")
+                            ),
+                            None,
+                        )
+                    do_link(
+                        src_img if src_img is not None else named_cover,
+                        plain_cover,
+                        force=force,
+                        dry_run=dry_run,
+                        stats=stats,
+                        dst_dir_fd=dst_fd,
+                        # Without a source image, the named cover in dst_dir
+                        # is the link source
+                        src_dir_fd=dst_fd if src_img is None else src_fd,
+                    )
+                    logger.debug(
+                        "linker.cover_link_attempted",
+                        named_cover=str(named_cover),
+                        plain_cover=str(plain_cover),
+                    )
+            else:
+                logger.debug("linker.cover_excluded", plain_cover=str(plain_cover))
+                row("🚫", Sty.GREY, "excl.", named_cover, plain_cover, dry_run)
 
-    if not files:
-        logger.warning("linker.no_files_found", src_dir=str(src_dir))
-        console.print(f"[yellow][WARN] No files found in {src_dir}[/yellow]")
-        return
 
-    # Categorize and normalize weird suffixes
-    normalized = []
-    for p in files:
-        fixed_name = normalize_weird_ext(p.name)
-        normalized.append((p, fixed_name))
+# Unraid share (FUSE) and per-disk mount prefixes; hardlinks can't span them
+_UNRAID_USER = "/mnt/user/"
+_UNRAID_DISK = "/mnt/disk"
 
-    logger.debug(
-        "linker.files_normalized",
-        original_count=len(files),
-        normalized_count=len(normalized),
-    )
 
-    # Prioritize linking: cue, audio, image, docs
-    for src_path, fixed_name in normalized:
-        ext = Path(fixed_name).suffix.lower()
-        if ext not in (AUDIO_EXTS | IMG_EXTS | DOC_EXTS | {".cue"}):
-            continue
-
-        if ext == ".cue":
-            dst = outputs["cue"]
-        elif ext in AUDIO_EXTS:
-            if ext == ".m4b":
-                dst = outputs["m4b"]
-            elif ext == ".mp3":
-                dst = outputs["mp3"]
-            elif ext == ".flac":
-                dst = outputs["flac"]
-            elif ext == ".m4a":
-                dst = dst_dir / f"{base_name}.m4a"
-            else:
-                continue
-        elif ext in IMG_EXTS:
-            dst = outputs["jpg"]  # canonical .jpg name regardless of source img ext
-        elif ext in DOC_EXTS:
-            if ext == ".pdf":
-                dst = outputs["pdf"]
-            elif ext == ".txt":
-                dst = outputs["txt"]
-            elif ext == ".nfo":
-                dst = outputs["nfo"]
-            else:
-                continue
-        else:
-            continue
-
-        do_link(src_path, dst, force=force, dry_run=dry_run, stats=stats)
-
-    # Optionally make a plain cover.jpg as well — but only if not excluded
-    if also_cover:
-        named_cover = outputs["jpg"]
-        plain_cover = dst_dir / "cover.jpg"
-        if not dest_is_excluded(plain_cover):
-            if named_cover.exists() or dry_run:
-                # If dry-run and not created yet, pick source image to show intent
-                src_img = None
-                if not named_cover.exists():
-                    src_img = next(
-                        (
-                            p
-                            for p, n in normalized
-                            if normalize_weird_ext(n)
-                            .lower()
-                            .endswith((".jpg", ".jpeg", ".png"))
-                        ),
-                        None,
-                    )
-                do_link(
-                    src_img if src_img is not None else named_cover,
-                    plain_cover,
-                    force=force,
-                    dry_run=dry_run,
-                    stats=stats,
-                )
-                logger.debug(
-                    "linker.cover_link_attempted",
-                    named_cover=str(named_cover),
-                    plain_cover=str(plain_cover),
-                )
-        else:
-            logger.debug("linker.cover_excluded", plain_cover=str(plain_cover))
-            row("🚫", Sty.GREY, "excl.", named_cover, plain_cover, dry_run)
+@lru_cache(maxsize=256)
+def _st_dev(dir_path: str) -> int:
+    """Device id of a destination directory, cached across a batch"""
+    return os.stat(dir_path).st_dev
 
 
 def preflight_checks(src: Path, dst: Path) -> bool:
     """Run preflight checks before linking"""
-    # Check if paths exist
-    if not src.exists():
+    # Check the source exists; its stat doubles as the device lookup
+    try:
+        src_dev = os.stat(src).st_dev
+    except FileNotFoundError:
         console.print(f"[red]❌ Source doesn't exist: {src}[/red]")
         return False
 
     # Check same filesystem
     try:
-        if src.stat().st_dev != dst.parent.stat().st_dev:
+        if src_dev != _st_dev(os.fspath(dst.parent)):
             console.print("[red]❌ Cross-device link error[/red]")
             console.print("   Source and destination must be on same filesystem")
             console.print(f"   Source: {src}")
@@ -620,8 +892,8 @@ def preflight_checks(src: Path, dst: Path) -> bool:
 
     # Check for Unraid user/disk mixing
     src_str, dst_str = str(src), str(dst)
-    if ("/mnt/user/" in src_str and "/mnt/disk" in dst_str) or (
-        "/mnt/disk" in src_str and "/mnt/user/" in dst_str
+    if (_UNRAID_USER in src_str and _UNRAID_DISK in dst_str) or (
+        _UNRAID_DISK in src_str and _UNRAID_USER in dst_str
     ):
         console.print("[red]❌ Unraid user/disk mixing detected[/red]")
         console.print("   Hardlinks won't work between /mnt/user and /mnt/disk paths")
@@ -630,8 +902,16 @@ def preflight_checks(src: Path, dst: Path) -> bool:
     return True
 
 
-def run_batch(batch_file: Path, also_cover, zero_pad, force, dry_run):
-    """Process batch file with src|dst pairs"""
+def run_batch(batch_file: Path, also_cover, zero_pad, force, dry_run, jobs: int = 1):
+    """Process batch file with src|dst pairs
+
+    With jobs > 1, books are linked concurrently on a thread pool. Each book
+    writes only to its own destination folder and counts into its own stats.
+    Its console output is buffered on the worker and printed, in batch order,
+    when its stats are merged; a book that raises counts as one error.
+    """
+    from rich.text import Text
+
     from .display import section
 
     logger = log.bind(
@@ -644,18 +924,32 @@ def run_batch(batch_file: Path, also_cover, zero_pad, force, dry_run):
 
     logger.info("batch.start", operation="run_batch")
 
-    stats = {
-        "linked": 0,
-        "replaced": 0,
-        "already": 0,
-        "exists": 0,
-        "excluded": 0,
-        "skipped": 0,
-        "errors": 0,
-    }
+    # Read permission settings once for the whole batch
+    invalidate_link_config()
+    stats = new_stats()
+
+    def link_book(src: Path, dst: Path, book_stats: Counter[str]) -> Counter[str]:
+        base = dst.name
+
+        # Bind context for this book
+        bind_audiobook_context(asin=base, title=base, volume="")
+        logger.debug("batch.processing_book", src=str(src), dst=str(dst), base=base)
+        section(f"🎧 {base}")
+        plan_and_link(src, dst, base, also_cover, zero_pad, force, dry_run, book_stats)
+        return book_stats
+
+    def link_book_buffered(src: Path, dst: Path) -> tuple[Counter[str], str]:
+        # Rich's capture buffer is per thread, so workers don't mix output
+        with console.capture() as capture:
+            book_stats = link_book(src, dst, new_stats())
+        return book_stats, capture.get()
+
+    pool = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    futures = []
 
     try:
-        with batch_file.open() as fh:
+        # Large buffered reads for big batch files
+        with batch_file.open(buffering=1 << 20) as fh:
             line_count = 0
             processed_count = 0
 
@@ -665,10 +959,9 @@ def run_batch(batch_file: Path, also_cover, zero_pad, force, dry_run):
                 if not line or line.startswith("#"):
                     continue
 
-                try:
-                    src_s, dst_s = (x.strip() for x in line.split("|", 1))
-                    processed_count += 1
-                except ValueError:
+                # Only the first '|' separates SRC from DST
+                src_s, sep, dst_s = line.partition("|")
+                if not sep:
                     logger.warning(
                         "batch.bad_line", line_number=line_count, content=line
                     )
@@ -676,22 +969,35 @@ def run_batch(batch_file: Path, also_cover, zero_pad, force, dry_run):
                         f"[yellow][WARN] bad line (expected 'SRC|DST'): {line}[/yellow]"
                     )
                     continue
+                src_s = src_s.strip()
+                dst_s = dst_s.strip()
+                processed_count += 1
 
-                src = Path(src_s)
-                dst = Path(dst_s)
-                base = dst.name
-
-                # Bind context for this book
-                from .utils.logging import bind_audiobook_context
+                if pool is None:
+                    link_book(Path(src_s), Path(dst_s), stats)
+                else:
+                    futures.append(
+                        (
+                            dst_s,
+                            pool.submit(link_book_buffered, Path(src_s), Path(dst_s)),
+                        )
+                    )
 
-                bind_audiobook_context(asin=base, title=base, volume="")
-                logger.debug(
-                    "batch.processing_book", src=str(src), dst=str(dst), base=base
-                )
-                section(f"🎧 {base}")
-                plan_and_link(
-                    src, dst, base, also_cover, zero_pad, force, dry_run, stats
+        for dst_s, future in futures:
+            try:
+                book_stats, output = future.result()
+            except Exception as e:
+                logger.error(
+                    "batch.book_failed",
+                    dst=dst_s,
+                    error=str(e),
+                    error_type=type(e).__name__,
                 )
+                console.print(f"[red]❌ Failed to link {dst_s}: {e}[/red]")
+                stats["errors"] += 1
+                continue
+            console.print(Text.from_ansi(output), end="")
+            stats.update(book_stats)
 
         logger.info(
             "batch.complete",
@@ -711,5 +1017,8 @@ def run_batch(batch_file: Path, also_cover, zero_pad, force, dry_run):
         )
         console.print(f"[red]❌ Unexpected error processing batch: {e}[/red]")
         stats["errors"] += 1
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
 
     return stats
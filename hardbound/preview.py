@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+fzf preview helper: summarize an audiobook folder from a single directory scan
+
+Kept free of package-relative imports so fzf can run it directly as a script
+(``python path/to/preview.py DIR``) without hardbound being installed.
+"""
+
+import os
+import shlex
+import stat
+import sys
+
+AUDIO_EXTS = (".m4b", ".mp3")
+MAX_FILES = 20
+MAX_AUDIO = 10
+
+
+def human_size(size: float) -> str:
+    """Compact du -h style size (e.g. 512, 1.5K, 230M)"""
+    for unit in ("", "K", "M", "G", "T"):
+        if size < 1024 or unit == "T":
+            break
+        size /= 1024
+    if not unit:
+        return f"{int(size)}"
+    return f"{size:.1f}{unit}" if size < 10 else f"{size:.0f}{unit}"
+
+
+def _tree_size(path: str) -> int:
+    """Total size of regular files below path (used for nested folders only)"""
+    total = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        total += _tree_size(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return total
+
+
+def render(path: str) -> str:
+    """Build the preview block for one folder"""
+    if not os.path.isdir(path):
+        return ""
+
+    files: list[tuple[str, int, bool]] = []
+    total = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                is_dir = stat.S_ISDIR(st.st_mode)
+                size = _tree_size(entry.path) if is_dir else st.st_size
+                total += size
+                files.append((entry.name, size, is_dir))
+    except OSError as e:
+        return f"📁 {path}\n\n{e}"
+
+    files.sort()
+    lines = [f"📁 {path}", "", "Files:"]
+    for name, size, is_dir in files[:MAX_FILES]:
+        lines.append(f"  {human_size(size):>6}  {name}{'/' if is_dir else ''}")
+
+    lines += ["", "Audio files:"]
+    audio = [
+        name
+        for name, _size, is_dir in files
+        if not is_dir and name.endswith(AUDIO_EXTS)
+    ]
+    lines += audio[:MAX_AUDIO]
+
+    lines += ["", f"Total size: {human_size(total)}"]
+    return "\n".join(lines)
+
+
+def fzf_preview_command() -> str:
+    """Shell command fzf runs for the highlighted row; {2} is the path column"""
+    return (
+        f"{shlex.quote(sys.executable)} {shlex.quote(os.path.abspath(__file__))} {{2}}"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point: print the preview for the folder given as the first argument"""
+    args = sys.argv[1:] if argv is None else argv
+    if not args:
+        return 1
+    print(render(args[0]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,21 +4,70 @@
 Ensures paths fit within 180-character limit while preserving ASIN tags
 """
 
+import logging
+import os
 import re
+import string
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Final
 
 from .utils.logging import get_logger
 
 # RED full-path limit
-PATH_CAP = 180
-TORRENT_PATH_SEPARATOR = "/"  # RED counts internal torrent paths, not OS paths
+PATH_CAP: Final = 180
+TORRENT_PATH_SEPARATOR: Final = "/"  # RED counts internal torrent paths, not OS paths
+_SEP_LEN: Final = len(TORRENT_PATH_SEPARATOR)
 
 # Get logger for this module
 log = get_logger(__name__)
-
-
-@dataclass(frozen=True)
+# stdlib logger behind it, for cheap level checks before building debug events
+_stdlib_log = logging.getLogger(__name__)
+
+# Patterns compiled once; parse_tokens and normalize_volume run per source
+_ASIN_RE = re.compile(r"\{ASIN\.[A-Z0-9]+\}")
+_ASIN_PREFIX = "{ASIN."
+_ASIN_CHARS = string.ascii_uppercase + string.digits
+_TAG_RE = re.compile(r"\s*\[[^\]]+\]\s*$")
+_TRAILING_PAREN_RE = re.compile(r"\s*\(([^)]+)\)\s*$")
+_YEAR_ONLY_RE = re.compile(r"(?:19|20)\d{2}")
+_VOL_RE = re.compile(r"vol_?\s*\d+(?:\.\d+)?(?=\s|$)", re.IGNORECASE)
+
+# Volume formats tried in order by normalize_volume
+_VOL_NORM_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"vol_(\d+(?:\.\d+)?)",  # vol_13 or vol_13.5
+        r"vol\.?\s*(\d+(?:\.\d+)?)",  # vol.13, vol 13, vol.13.5
+        r"volume\s+(\d+(?:\.\d+)?)",  # volume 13, volume 13.5
+        r"v\.?\s*(\d+(?:\.\d+)?)",  # v.13, v13, v.13.5
+        r"(\d+(?:\.\d+)?)",  # just "13" or "13.5"
+    )
+)
+
+# Audio extensions build_dst_paths sniffs for, most preferred first
+_PREFERRED_EXTS = (".m4b", ".m4a", ".mp3", ".flac")
+
+# Trim ladders, least to most aggressive.
+# Filename: (include_subtitle, include_year, include_author, include_tag)
+_FILENAME_CONFIGS = (
+    (True, True, True, True),  # Full filename (all components)
+    (True, False, True, True),  # Remove year
+    (True, False, False, True),  # Remove year and author
+    (True, False, False, False),  # Remove year, author, and tag
+    (False, False, False, False),  # Remove everything optional (minimal)
+)
+# Folder: (include_subtitle, include_year, include_author)
+_FOLDER_CONFIGS = (
+    (True, True, True),  # Full folder name
+    (True, False, True),  # Remove year
+    (True, False, False),  # Remove year and author
+    (False, False, False),  # Remove everything optional (minimal)
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Tokens:
     """Parsed tokens from audiobook name"""
 
@@ -31,22 +80,26 @@ class Tokens:
     tag: str | None  # e.g. "[H2OKing]"
     ext: str  # ".m4b"
 
+    def __post_init__(self) -> None:
+        # Collapse whitespace runs once here so the builders can join fields as-is
+        for field in ("title", "volume", "subtitle", "year", "author", "asin", "tag"):
+            value = getattr(self, field)
+            if value:
+                object.__setattr__(self, field, " ".join(value.split()))
+
 
 def normalize_volume(volume_str: str) -> str:
     """Normalize volume string to vol_XX format, preserving decimals"""
-    # Handle various volume formats including decimals
-    patterns = [
-        r"vol_(\d+(?:\.\d+)?)",  # vol_13 or vol_13.5
-        r"vol\.?\s*(\d+(?:\.\d+)?)",  # vol.13, vol 13, vol.13.5
-        r"volume\s+(\d+(?:\.\d+)?)",  # volume 13, volume 13.5
-        r"v\.?\s*(\d+(?:\.\d+)?)",  # v.13, v13, v.13.5
-        r"(\d+(?:\.\d+)?)",  # just "13" or "13.5"
-    ]
-
     volume_str = volume_str.lower().strip()
 
-    for pattern in patterns:
-        match = re.search(pattern, volume_str, re.IGNORECASE)
+    # Already-normalized integer form, as produced by parse_tokens
+    digits = volume_str[4:]
+    if volume_str.startswith("vol_") and digits.isdecimal():
+        return f"vol_{int(digits):02d}"
+
+    # Handle various volume formats including decimals
+    for pattern in _VOL_NORM_RES:
+        match = pattern.search(volume_str)
         if match:
             volume_part = match.group(1)
             if "." in volume_part:
@@ -77,53 +130,75 @@ def normalize_volume(volume_str: str) -> str:
         return f"vol_{volume_str.zfill(2)}"
 
 
+def _find_asin(name: str) -> tuple[int, int] | None:
+    """Span of the first {ASIN.XXXX} tag in name, as _ASIN_RE.search would find it."""
+    start = name.find(_ASIN_PREFIX)
+    while start != -1:
+        close = name.find("}", start + len(_ASIN_PREFIX))
+        if close == -1:
+            return None
+        body = name[start + len(_ASIN_PREFIX) : close]
+        if body and not body.strip(_ASIN_CHARS):
+            return start, close + 1
+        start = name.find(_ASIN_PREFIX, start + 1)
+    return None
+
+
+@lru_cache(maxsize=8192)
 def parse_tokens(name: str, extension: str = ".m4b") -> Tokens:
     """
     Parse audiobook name into component tokens
 
     Expected format:
     <title> - <vol_00> - <subtitle> (year) (author) {ASIN.B0XXXXXX} [tag]
+
+    Results are cached per (name, extension); Tokens is frozen, so callers
+    share instances safely. The cache is bounded at 8192 unique names.
     """
     # Remove extension if present
-    if name.endswith(extension):
-        name = name[: -len(extension)]
+    name = name.removesuffix(extension)
 
     # Extract ASIN (required)
-    asin_pattern = r"\{ASIN\.[A-Z0-9]+\}"
-    asin_match = re.search(asin_pattern, name)
-    if not asin_match:
+    asin_span = _find_asin(name)
+    if asin_span is None:
         raise ValueError(f"No ASIN found in name: {name}")
-    asin = asin_match.group(0)
+    asin_start, asin_end = asin_span
+    asin = name[asin_start:asin_end]
 
     # Extract trailing tag [xxx] (keep brackets, strictly at end)
-    tag_pattern = r"\s*\[[^\]]+\]\s*$"
-    tag_match = re.search(tag_pattern, name)
+    tag_match = _TAG_RE.search(name)
     tag = tag_match.group(0).strip() if tag_match else None
 
-    # Remove ASIN and tag from working string
-    working = name
-    working = re.sub(asin_pattern, "", working).strip()
+    # Remove ASIN and tag from working string; the regex is only needed when
+    # another "{ASIN." follows the first match
+    if name.find(_ASIN_PREFIX, asin_end) == -1:
+        working = (name[:asin_start] + name[asin_end:]).strip()
+    else:
+        working = _ASIN_RE.sub("", name).strip()
     if tag:
-        working = re.sub(tag_pattern, "", working).strip()
-
-    # Extract from right to left: author first (outermost), then year (next inner)
-    # Extract trailing author "(Name Name)" if present; keep parens
-    author_pattern = r"\s*\(([^)]+)\)\s*$"
-    author_match = re.search(author_pattern, working)
-    author = author_match.group(0).strip() if author_match else None
+        working = _TAG_RE.sub("", working).strip()
+
+    # Extract from right to left: author first (outermost), then year (next inner).
+    # The outermost trailing "(...)" is always the author; the innermost
+    # trailing "(...)" left after it is the year only if it holds 19xx/20xx.
+    # Parens are kept.
+    author = year = None
+    author_match = _TRAILING_PAREN_RE.search(working)
     if author_match:
+        author = author_match.group(0).strip()
         working = working[: author_match.start()].strip()
-
-    # Now extract trailing year "(2024)" if present; keep parens
-    year_pattern = r"\s*\((19|20)\d{2}\)\s*$"
-    year_match = re.search(year_pattern, working)
-    year = year_match.group(0).strip() if year_match else None
-    if year_match:
-        working = working[: year_match.start()].rstrip()
+        year_start = working.rfind("(")
+        if (
+            year_start != -1
+            and working.endswith(")")
+            and _YEAR_ONLY_RE.fullmatch(working, year_start + 1, len(working) - 1)
+        ):
+            year = working[year_start:]
+            working = working[:year_start].rstrip()
 
     # Parse the new format: <title> vol_XX <subtitle>
     # Use robust volume matching with validation to prevent decimal fragment leakage
-    vol_match = re.search(r"vol_?\s*\d+(?:\.\d+)?(?=\s|$)", working, re.IGNORECASE)
+    vol_match = _VOL_RE.search(working)
 
     if vol_match:
         # Extract the volume and validate it
@@ -155,31 +230,10 @@ def parse_tokens(name: str, extension: str = ".m4b") -> Tokens:
             subtitle = subtitle_part if subtitle_part else None
         else:
             # Invalid volume format, fallback to default parsing
-            parts = [p.strip() for p in working.split(" - ") if p.strip()]
-            if len(parts) >= 2:
-                title = parts[0]
-                volume_part = parts[1]
-                volume = normalize_volume(volume_part)
-                subtitle = " - ".join(parts[2:]) if len(parts) > 2 else None
-            else:
-                title = parts[0] if parts else working
-                volume = "vol_01"  # Default
-                subtitle = None
+            title, volume, subtitle = _split_old_format(working)
     else:
         # Fallback: no volume found, try old format or default
-        parts = [p.strip() for p in working.split(" - ") if p.strip()]
-
-        if len(parts) >= 2:
-            # Try old format: title - vol_XX - subtitle
-            title = parts[0]
-            volume_part = parts[1]
-            volume = normalize_volume(volume_part)
-            subtitle = " - ".join(parts[2:]) if len(parts) > 2 else None
-        else:
-            # Last resort: assume first part is title, default volume
-            title = parts[0] if parts else working
-            volume = "vol_01"  # Default
-            subtitle = None
+        title, volume, subtitle = _split_old_format(working)
 
     return Tokens(
         title=title.strip(),
@@ -193,6 +247,36 @@ def parse_tokens(name: str, extension: str = ".m4b") -> Tokens:
     )
 
 
+def _split_old_format(working: str) -> tuple[str, str, str | None]:
+    """
+    Split the old "<title> - <vol_XX> - <subtitle>" layout.
+
+    Empty " - " segments are skipped. With fewer than two segments the whole
+    name is the title and the volume defaults to vol_01.
+    """
+    title, rest = _next_dash_segment(working)
+    volume_part, rest = _next_dash_segment(rest)
+    if not volume_part:
+        # Last resort: assume first part is title, default volume
+        return title or working, "vol_01", None
+
+    if " - " in rest:
+        subtitle = " - ".join(p.strip() for p in rest.split(" - ") if p.strip())
+    else:
+        subtitle = rest.strip()
+    return title, normalize_volume(volume_part), subtitle or None
+
+
+def _next_dash_segment(text: str) -> tuple[str, str]:
+    """First non-empty, stripped " - " segment of text and what follows it."""
+    while text:
+        head, _, text = text.partition(" - ")
+        head = head.strip()
+        if head:
+            return head, text
+    return "", ""
+
+
 def _series_str(tokens: Tokens, include_subtitle: bool = True) -> str:
     """
     Build the left-hand 'series' part using space joiners:
@@ -201,7 +285,7 @@ def _series_str(tokens: Tokens, include_subtitle: bool = True) -> str:
     parts = [tokens.title, tokens.volume]
     if include_subtitle and tokens.subtitle:
         parts.append(tokens.subtitle)
-    return " ".join(parts)
+    return " ".join(part for part in parts if part)
 
 
 def build_filename(
@@ -212,6 +296,23 @@ def build_filename(
     include_tag: bool = True,
 ) -> str:
     """Build filename from tokens with optional components."""
+    # Fast path: untrimmed name with every component present
+    if (
+        include_subtitle
+        and include_year
+        and include_author
+        and include_tag
+        and tokens.title
+        and tokens.subtitle
+        and tokens.year
+        and tokens.author
+        and tokens.tag
+    ):
+        return (
+            f"{tokens.title} {tokens.volume} {tokens.subtitle} {tokens.year} "
+            f"{tokens.author} {tokens.asin} {tokens.tag}{tokens.ext}"
+        )
+
     left = _series_str(tokens, include_subtitle=include_subtitle)
     right: list[str] = []
     if include_year and tokens.year:
@@ -221,13 +322,7 @@ def build_filename(
     right.append(tokens.asin)
     if include_tag and tokens.tag:
         right.append(tokens.tag)
-    filename = (
-        f"{left} {' '.join(right)}{tokens.ext}" if right else f"{left}{tokens.ext}"
-    )
-    # Normalize whitespace
-    filename = re.sub(r"\s+", " ", filename).strip()
-
-    return filename
+    return f"{left} {' '.join(right)}{tokens.ext}"
 
 
 def build_folder_name(
@@ -244,11 +339,7 @@ def build_folder_name(
     if include_author and tokens.author:
         right.append(tokens.author)
     right.append(tokens.asin)
-    folder_name = f"{left} {' '.join(right)}" if right else left
-    # Normalize whitespace
-    folder_name = re.sub(r"\s+", " ", folder_name).strip()
-
-    return folder_name
+    return f"{left} {' '.join(right)}"
 
 
 def build_dst_paths(
@@ -272,115 +363,84 @@ def build_dst_paths(
         tuple[Path, Path]: (destination_directory, destination_filename)
     """
     if extension is None:
-        # Prefer common audiobook types in a deterministic order
-        preferred_exts = [".m4b", ".m4a", ".mp3", ".flac"]
-        lower_files = [f.suffix.lower() for f in src.iterdir() if f.is_file()]
-        for ext in preferred_exts:
-            if ext in lower_files:
-                extension = ext
-                break
-        if extension is None:
-            extension = ".m4b"  # Default
+        # Prefer common audiobook types in a deterministic order; stop
+        # scanning as soon as the top choice turns up
+        found: set[str] = set()
+        with os.scandir(src) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    found.add(os.path.splitext(entry.name)[1].lower())
+                    if _PREFERRED_EXTS[0] in found:
+                        break
+        extension = next((ext for ext in _PREFERRED_EXTS if ext in found), ".m4b")
+
+    folder_name, filename = _build_dst_paths_cached(src.name, str(dst_root), extension)
+    return dst_root / folder_name, Path(filename)
+
+
+@lru_cache(maxsize=4096)
+def _build_dst_paths_cached(
+    src_name: str, dst_root_str: str, extension: str
+) -> tuple[str, str]:
+    """
+    Trim src_name to a RED-compliant (folder_name, filename) pair.
 
+    Pure in its arguments, so repeated sources (re-scans, dry runs followed
+    by a real run) skip parsing and trimming; trim logging only happens on
+    a cache miss.
+    """
     # Parse tokens from source name
-    tokens = parse_tokens(src.name, extension)
+    tokens = parse_tokens(src_name, extension)
 
-    # Bind context for logging
+    # Bind context for logging; debug payloads are only built when enabled
+    debug = _stdlib_log.isEnabledFor(logging.DEBUG)
     logger = log.bind(
         asin=tokens.asin,
         title=tokens.title,
-        src_name=src.name,
+        src_name=src_name,
         extension=extension,
-        dst_root=str(dst_root),
+        dst_root=dst_root_str,
     )
 
-    logger.debug(
-        "trim.start",
-        subtitle=tokens.subtitle,
-        year=tokens.year,
-        author=tokens.author,
-        tag=tokens.tag,
-    )
-
-    # Stage A: Try different filename trimming levels
-    filename_configs = [
-        # Full filename (all components)
-        {
-            "include_subtitle": True,
-            "include_year": True,
-            "include_author": True,
-            "include_tag": True,
-        },
-        # Remove year from filename
-        {
-            "include_subtitle": True,
-            "include_year": False,
-            "include_author": True,
-            "include_tag": True,
-        },
-        # Remove year and author from filename
-        {
-            "include_subtitle": True,
-            "include_year": False,
-            "include_author": False,
-            "include_tag": True,
-        },
-        # Remove year, author, and tag from filename
-        {
-            "include_subtitle": True,
-            "include_year": False,
-            "include_author": False,
-            "include_tag": False,
-        },
-        # Remove everything optional from filename (minimal)
-        {
-            "include_subtitle": False,
-            "include_year": False,
-            "include_author": False,
-            "include_tag": False,
-        },
-    ]
-
-    # Start with full folder name
-    folder_configs = [
-        # Full folder name
-        {"include_subtitle": True, "include_year": True, "include_author": True},
-        # Remove year from folder
-        {"include_subtitle": True, "include_year": False, "include_author": True},
-        # Remove year and author from folder
-        {"include_subtitle": True, "include_year": False, "include_author": False},
-        # Remove everything optional from folder (minimal)
-        {"include_subtitle": False, "include_year": False, "include_author": False},
-    ]
-
-    logger.debug("trim.phase_a.start", phase="filename_trimming")
-
-    # Try each filename configuration with full folder first
-    for i, filename_config in enumerate(filename_configs):
-        filename = build_filename(tokens, **filename_config)
-        folder_name = build_folder_name(tokens, **folder_configs[0])  # Full folder
-
-        dst_dir = dst_root / folder_name
-        torrent_length = _torrent_path_length(folder_name, filename)
-
+    if debug:
         logger.debug(
-            "trim.try_filename",
-            attempt=i + 1,
-            config=filename_config,
-            filename=filename,
-            folder=folder_name,
-            path_len=torrent_length,
-            path_cap=PATH_CAP,
-            within=torrent_length <= PATH_CAP,
+            "trim.start",
+            subtitle=tokens.subtitle,
+            year=tokens.year,
+            author=tokens.author,
+            tag=tokens.tag,
         )
 
-        if _fits_red_cap(folder_name, filename):
+    if debug:
+        logger.debug("trim.phase_a.start", phase="filename_trimming")
+
+    # Try each filename configuration with full folder first. Attempts are
+    # measured arithmetically; only the winning names are built.
+    folder_len = _folder_name_len(tokens, *_FOLDER_CONFIGS[0])
+    for i, filename_config in enumerate(_FILENAME_CONFIGS):
+        _, include_year, include_author, include_tag = filename_config
+        torrent_length = folder_len + _SEP_LEN + _filename_len(tokens, *filename_config)
+
+        if debug:
+            logger.debug(
+                "trim.try_filename",
+                attempt=i + 1,
+                config=filename_config,
+                path_len=torrent_length,
+                path_cap=PATH_CAP,
+                within=torrent_length <= PATH_CAP,
+            )
+
+        if torrent_length <= PATH_CAP:
+            folder_name = build_folder_name(tokens, *_FOLDER_CONFIGS[0])
+            filename = build_filename(tokens, *filename_config)
+            torrent_length = len(folder_name) + _SEP_LEN + len(filename)
             trim_steps = []
-            if not filename_config.get("include_year", True):
+            if not include_year:
                 trim_steps.append("drop year")
-            if not filename_config.get("include_author", True):
+            if not include_author:
                 trim_steps.append("drop author")
-            if not filename_config.get("include_tag", True):
+            if not include_tag:
                 trim_steps.append("drop tag")
 
             logger.info(
@@ -395,47 +455,45 @@ def build_dst_paths(
                 trim_steps=trim_steps,
                 trim_level=f"filename_config_{i}",
             )
-            return dst_dir, Path(filename)
+            return folder_name, filename
 
-    logger.debug("trim.phase_b.start", phase="folder_trimming")
+    if debug:
+        logger.debug("trim.phase_b.start", phase="folder_trimming")
 
     # Stage B: If still too long, try folder trimming with minimal filename
-    minimal_filename = build_filename(
-        tokens,
-        include_subtitle=False,
-        include_year=False,
-        include_author=False,
-        include_tag=False,
-    )
+    minimal_filename_len = _filename_len(tokens, *_FILENAME_CONFIGS[-1])
 
-    for j, folder_config in enumerate(folder_configs):
-        folder_name = build_folder_name(tokens, **folder_config)
-        dst_dir = dst_root / folder_name
-        torrent_length = _torrent_path_length(folder_name, minimal_filename)
-
-        logger.debug(
-            "trim.try_folder",
-            attempt=j + 1,
-            config=folder_config,
-            filename=minimal_filename,
-            folder=folder_name,
-            path_len=torrent_length,
-            path_cap=PATH_CAP,
-            within=torrent_length <= PATH_CAP,
+    for j, folder_config in enumerate(_FOLDER_CONFIGS):
+        include_subtitle, include_year, include_author = folder_config
+        torrent_length = (
+            _folder_name_len(tokens, *folder_config) + _SEP_LEN + minimal_filename_len
         )
 
-        if _fits_red_cap(folder_name, minimal_filename):
+        if debug:
+            logger.debug(
+                "trim.try_folder",
+                attempt=j + 1,
+                config=folder_config,
+                path_len=torrent_length,
+                path_cap=PATH_CAP,
+                within=torrent_length <= PATH_CAP,
+            )
+
+        if torrent_length <= PATH_CAP:
+            folder_name = build_folder_name(tokens, *folder_config)
+            minimal_filename = build_filename(tokens, *_FILENAME_CONFIGS[-1])
+            torrent_length = len(folder_name) + _SEP_LEN + len(minimal_filename)
             folder_trim_steps = [
                 "drop year",
                 "drop author",
                 "drop tag",
                 "drop subtitle(file)",
             ]  # Already applied minimal filename
-            if not folder_config.get("include_year", True):
+            if not include_year:
                 folder_trim_steps.append("drop year(folder)")
-            if not folder_config.get("include_author", True):
+            if not include_author:
                 folder_trim_steps.append("drop author(folder)")
-            if not folder_config.get("include_subtitle", True):
+            if not include_subtitle:
                 folder_trim_steps.append("drop subtitle(folder)")
 
             logger.info(
@@ -450,34 +508,29 @@ def build_dst_paths(
                 trim_steps=folder_trim_steps,
                 trim_level=f"folder_config_{j}",
             )
-            return dst_dir, Path(minimal_filename)
+            return folder_name, minimal_filename
 
     # Phase C: Title truncation as final fallback
-    logger.debug("trim.phase_c.start", phase="title_truncation")
+    if debug:
+        logger.debug("trim.phase_c.start", phase="title_truncation")
 
-    # Calculate how much space we need for the essential parts
     # Format will be: "Title... - vol_XX {ASIN.XXXXXXX}"
-    essential_parts = f" - {tokens.volume} {tokens.asin}"
-    extension = tokens.ext
-    # Need space for folder/filename (same content) + separator
-    # folder_name + "/" + filename = 2 * (title + essential_parts) + 1 + len(extension)
-
-    # Calculate max title length to fit under PATH_CAP
-    # 2 * (max_title_len + len(essential_parts)) + 1 + len(extension) <= PATH_CAP
-    # max_title_len <= (PATH_CAP - 1 - len(extension) - 2 * len(essential_parts)) / 2
-    max_title_len = (PATH_CAP - 1 - len(extension) - 2 * len(essential_parts)) // 2
+    max_title_len = _max_title_len(
+        len(tokens.volume), len(tokens.asin), len(tokens.ext)
+    )
 
     if len(tokens.title) > max_title_len:
         # Truncate title, but leave room for "..." indicator
         truncated_title = tokens.title[: max_title_len - 3] + "..."
-        logger.debug(
-            "trim.title_truncate",
-            original_title=tokens.title,
-            original_len=len(tokens.title),
-            truncated_title=truncated_title,
-            truncated_len=len(truncated_title),
-            max_allowed=max_title_len,
-        )
+        if debug:
+            logger.debug(
+                "trim.title_truncate",
+                original_title=tokens.title,
+                original_len=len(tokens.title),
+                truncated_title=truncated_title,
+                truncated_len=len(truncated_title),
+                max_allowed=max_title_len,
+            )
     else:
         truncated_title = tokens.title
 
@@ -487,8 +540,7 @@ def build_dst_paths(
         f"{truncated_title} - {tokens.volume} {tokens.asin}{tokens.ext}"
     )
 
-    dst_dir = dst_root / truncated_folder
-    final_length = _torrent_path_length(truncated_folder, truncated_filename)
+    final_length = len(truncated_folder) + _SEP_LEN + len(truncated_filename)
 
     if final_length <= PATH_CAP:
         logger.info(
@@ -513,7 +565,7 @@ def build_dst_paths(
             truncated_title_len=len(truncated_title),
             trim_level="title_truncation",
         )
-        return dst_dir, Path(truncated_filename)
+        return truncated_folder, truncated_filename
     else:
         # This should never happen with reasonable ASIN lengths, but just in case
         logger.error(
@@ -525,12 +577,73 @@ def build_dst_paths(
             within=False,
             message="Even with maximum title truncation, path exceeds limit. Check ASIN length.",
         )
-        return dst_dir, Path(truncated_filename)
+        return truncated_folder, truncated_filename
+
+
+def _max_title_len(volume_len: int, asin_len: int, ext_len: int) -> int:
+    """
+    Longest title that fits Phase C's "<title> - <vol> <asin>" layout.
+
+    Folder and file share that text, so with essential = len(" - <vol> <asin>"):
+    2 * (max_title_len + essential) + 1 + ext_len <= PATH_CAP
+    """
+    essential = len(" - ") + volume_len + len(" ") + asin_len
+    return (PATH_CAP - _SEP_LEN - ext_len - 2 * essential) // 2
+
+
+def _joined_len(*parts: str | None) -> int:
+    """len(" ".join(p for p in parts if p)) without building the string."""
+    length = -1
+    for part in parts:
+        if part:
+            length += len(part) + 1
+    return max(length, 0)
+
+
+def _filename_len(
+    tokens: Tokens,
+    include_subtitle: bool = True,
+    include_year: bool = True,
+    include_author: bool = True,
+    include_tag: bool = True,
+) -> int:
+    """
+    Length build_filename would return for the same options.
+
+    Exact when token fields carry no stray whitespace; otherwise an upper
+    bound, so a name that fits by this measure always fits once built.
+    """
+    return _joined_len(
+        tokens.title,
+        tokens.volume,
+        tokens.subtitle if include_subtitle else None,
+        tokens.year if include_year else None,
+        tokens.author if include_author else None,
+        tokens.asin,
+        tokens.tag if include_tag else None,
+    ) + len(tokens.ext)
+
+
+def _folder_name_len(
+    tokens: Tokens,
+    include_subtitle: bool = True,
+    include_year: bool = True,
+    include_author: bool = True,
+) -> int:
+    """Length build_folder_name would return; exact under the same terms."""
+    return _joined_len(
+        tokens.title,
+        tokens.volume,
+        tokens.subtitle if include_subtitle else None,
+        tokens.year if include_year else None,
+        tokens.author if include_author else None,
+        tokens.asin,
+    )
 
 
 def _torrent_path_length(folder_name: str, filename: str) -> int:
     """Length of the path inside the .torrent (folder/filename), not the OS path."""
-    return len(folder_name) + len(TORRENT_PATH_SEPARATOR) + len(filename)
+    return len(folder_name) + _SEP_LEN + len(filename)
 
 
 def _fits_red_cap(folder_name: str, filename: str, path_cap: int = PATH_CAP) -> bool:
@@ -1,18 +1,21 @@
 """Visual feedback and messaging system with Rich"""
 
 import time
+from pathlib import Path
 from typing import Any
 
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
 
+console = Console()
+
 
 class VisualFeedback:
     """Rich visual feedback for user actions"""
 
     def __init__(self):
-        self.console = Console()
+        self.console = console
 
     def success(self, message: str, details: str = ""):
         """Show success with icon and color"""
@@ -83,12 +86,14 @@ def __init__(self, title: str, total: int | None = None):
                 BarColumn(),
                 TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
                 TimeElapsedColumn(),
+                console=console,
             )
         else:
             self.progress = Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 TimeElapsedColumn(),
+                console=console,
             )
         self.task_id = None
 
@@ -133,11 +138,11 @@ def done(self, message: str = "Complete"):
 
         self.progress.stop()
 
-        # Show final success message
-        console = Console()
-        console.print(f"\n[green]✅ {self.title} {message}[/green]")
+        # Show final success message on the console the progress display used
+        out = self.progress.console
+        out.print(f"\n[green]✅ {self.title} {message}[/green]")
         if elapsed:
-            console.print(f"   [dim]({elapsed:.1f}s)[/dim]")
+            out.print(f"   [dim]({elapsed:.1f}s)[/dim]")
 
 
 class ErrorHandler:
@@ -146,11 +151,9 @@ class ErrorHandler:
     def __init__(self):
         self.feedback = VisualFeedback()
 
-    def handle_path_error(self, path: str, operation: str):
+    def handle_path_error(self, path: str | Path, operation: str):
         """User-friendly path error messages"""
-        from pathlib import Path
-
-        p = Path(path)
+        p = path if isinstance(path, Path) else Path(path)
         if not p.exists():
             self.feedback.error(
                 f"Path not found: {path}",
@@ -2,6 +2,7 @@
 
 import re
 import unicodedata
+from functools import cache
 
 from rich import box
 from rich.console import Console
@@ -10,6 +11,8 @@
 
 from .feedback import VisualFeedback
 
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
 
 class MenuSystem:
     """Standardized menu system with Rich for perfect Unicode display"""
@@ -18,6 +21,8 @@ def __init__(self):
         self.menus: dict[str, dict] = {}
         self.current_menu: str | None = None
         self.console = Console()
+        # Built panels per menu; menus are static once added
+        self._rendered: dict[str, Panel] = {}
 
     def add_menu(
         self, name: str, title: str, options: dict[str, tuple], width: int = 50
@@ -31,6 +36,7 @@ def add_menu(
             width: Menu width in characters
         """
         self.menus[name] = {"title": title, "options": options, "width": width}
+        self._rendered.pop(name, None)
 
     def display_menu(self, name: str) -> str | None:
         """Display a menu using Rich for perfect alignment
@@ -44,22 +50,25 @@ def display_menu(self, name: str) -> str | None:
 
         menu = self.menus[name]
 
-        # Create table for menu items
-        table = Table.grid(padding=(0, 1))
-        table.add_column(justify="left")
-
-        # Add menu items
-        for choice, (label, _) in menu["options"].items():
-            table.add_row(f"[bold green]{choice})[/] {label}")
-
-        # Create panel with perfect borders
-        panel = Panel.fit(
-            table,
-            title=f"[bold cyan]{menu['title']}[/]",
-            box=box.DOUBLE,  # ╔═╦═╗ style
-            padding=(0, 2),
-            border_style="cyan",
-        )
+        panel = self._rendered.get(name)
+        if panel is None:
+            # Create table for menu items
+            table = Table.grid(padding=(0, 1))
+            table.add_column(justify="left")
+
+            # Add menu items
+            for choice, (label, _) in menu["options"].items():
+                table.add_row(f"[bold green]{choice})[/] {label}")
+
+            # Create panel with perfect borders
+            panel = Panel.fit(
+                table,
+                title=f"[bold cyan]{menu['title']}[/]",
+                box=box.DOUBLE,  # ╔═╦═╗ style
+                padding=(0, 2),
+                border_style="cyan",
+            )
+            self._rendered[name] = panel
 
         self.console.print(panel)
         return self._get_choice(list(menu["options"].keys()))
@@ -117,16 +126,16 @@ def handle_choice(self, menu_name: str, choice: str):
 def display_width(text: str) -> int:
     """Calculate the display width of text, accounting for full-width characters"""
     # Remove ANSI codes first
-    clean_text = re.sub(r"\x1b\[[0-9;]*m", "", text)
-
-    width = 0
-    for char in clean_text:
-        # Check if character is full-width (East Asian Wide, Full-width, etc.)
-        if unicodedata.east_asian_width(char) in ("W", "F", "A"):
-            width += 2
-        else:
-            width += 1
-    return width
+    clean_text = _ANSI_RE.sub("", text)
+    if clean_text.isascii():
+        return len(clean_text)
+    return sum(map(_char_width, clean_text))
+
+
+@cache
+def _char_width(char: str) -> int:
+    """Columns for one character: 2 for East Asian Wide, Full-width or Ambiguous"""
+    return 2 if unicodedata.east_asian_width(char) in ("W", "F", "A") else 1
 
 
 # Global menu system instance
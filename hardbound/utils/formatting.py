@@ -11,6 +11,15 @@
 
 console = Console()
 
+_SIZE_NAMES = ("B", "KB", "MB", "GB", "TB")
+_STATUS_STYLES = {
+    "success": "green",
+    "error": "red",
+    "warning": "yellow",
+    "info": "blue",
+}
+_STATUS_ICONS = {"success": "✅", "error": "❌", "warning": "⚠️", "info": "ℹ️"}
+
 
 class TextFormatter:
     """Utilities for formatting text and data display"""
@@ -21,15 +30,14 @@ def format_file_size(size_bytes: int) -> str:
         if size_bytes == 0:
             return "0 B"
 
-        size_names = ["B", "KB", "MB", "GB", "TB"]
+        # Each unit is 2**10 of the previous one, so the bit length picks it
         size_index = 0
-        size = float(size_bytes)
-
-        while size >= 1024 and size_index < len(size_names) - 1:
-            size /= 1024
-            size_index += 1
+        if size_bytes >= 1024:
+            size_index = min(
+                (int(size_bytes).bit_length() - 1) // 10, len(_SIZE_NAMES) - 1
+            )
 
-        return f"{size:.1f} {size_names[size_index]}"
+        return f"{size_bytes / (1 << (size_index * 10)):.1f} {_SIZE_NAMES[size_index]}"
 
     @staticmethod
     def format_duration(seconds: float) -> str:
@@ -109,17 +117,9 @@ def create_info_panel(
     @staticmethod
     def format_status_message(status: str, message: str, icon: str = "") -> Text:
         """Format a status message with appropriate styling"""
-        status_styles = {
-            "success": "green",
-            "error": "red",
-            "warning": "yellow",
-            "info": "blue",
-        }
-
-        style = status_styles.get(status.lower(), "white")
-        icon_map = {"success": "✅", "error": "❌", "warning": "⚠️", "info": "ℹ️"}
-
-        icon = icon or icon_map.get(status.lower(), "")
+        status = status.lower()
+        style = _STATUS_STYLES.get(status, "white")
+        icon = icon or _STATUS_ICONS.get(status, "")
         return Text(f"{icon} {message}", style=style)
 
 
@@ -6,10 +6,12 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import queue
 from logging import Logger
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 import structlog
@@ -30,6 +32,27 @@
 except ImportError:
     _HAS_RICH = False
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# ---- renderers --------------------------------------------------------------
+
+if _HAS_ORJSON:
+
+    def _json_renderer(logger, method_name, event_dict):
+        """Render log events as JSON (orjson: compact, UTF-8, like the fallback)"""
+        return orjson.dumps(event_dict, option=orjson.OPT_NON_STR_KEYS).decode()
+
+else:
+
+    def _json_renderer(logger, method_name, event_dict):
+        """Render log events as JSON"""
+        return json.dumps(event_dict, ensure_ascii=False, separators=(",", ":"))
+
 # ---- public helpers ---------------------------------------------------------
 
 
@@ -63,6 +86,23 @@ def clear_context() -> None:
 
 # ---- setup ------------------------------------------------------------------
 
+# Background writer for the log file; replaced on each setup_logging call
+_file_listener: QueueListener | None = None
+
+
+def _stop_file_listener() -> None:
+    """Flush queued records to the log file and close it."""
+    global _file_listener
+    if _file_listener is None:
+        return
+    _file_listener.stop()
+    for handler in _file_listener.handlers:
+        handler.close()
+    _file_listener = None
+
+
+atexit.register(_stop_file_listener)
+
 
 def setup_logging(
     *,
@@ -96,9 +136,14 @@ def setup_logging(
     Returns:
         Configured stdlib logger for compatibility
     """
+    global _file_listener
+
     # Ensure log directory exists
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Drain the previous file writer before reconfiguring
+    _stop_file_listener()
+
     # Build stdlib handlers
     handlers: list[logging.Handler] = []
 
@@ -126,7 +171,14 @@ def setup_logging(
         )
         # Plain formatter; structlog will render the message
         file_handler.setFormatter(logging.Formatter("%(message)s"))
-        handlers.append(file_handler)
+        # Writes and rotation checks happen on a listener thread; callers only
+        # enqueue the record
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _file_listener = QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _file_listener.start()
+        handlers.append(QueueHandler(log_queue))
 
     # Configure standard library root logger
     root_level = getattr(logging, level.upper(), logging.INFO)
@@ -140,10 +192,6 @@ def setup_logging(
     # Configure structlog processors
     timestamper = TimeStamper(fmt="iso", utc=True)
 
-    def json_renderer(logger, method_name, event_dict):
-        """Render log events as JSON"""
-        return json.dumps(event_dict, ensure_ascii=False, separators=(",", ":"))
-
     def console_renderer(logger, method_name, event_dict):
         """Render log events for console (Rich-friendly)"""
         # Use structlog's built-in console renderer for nice key=value formatting
@@ -152,42 +200,50 @@ def console_renderer(logger, method_name, event_dict):
 
     # Choose renderer based on whether we want JSON files
     if json_file and file_enabled:
-        final_renderer = json_renderer
+        final_renderer = _json_renderer
     else:
         final_renderer = console_renderer
 
     # Import CallsiteParameterAdder for debugging
     from structlog.processors import CallsiteParameterAdder
 
-    # Configure structlog
-    structlog.configure(
-        cache_logger_on_first_use=True,
-        wrapper_class=structlog.stdlib.BoundLogger,
-        logger_factory=LoggerFactory(),
-        processors=[
-            # Filter by level first (performance optimization)
-            filter_by_level,
-            # Merge context variables (ASIN, title, volume, etc.)
-            merge_contextvars,
-            # Add log level to event dict
-            add_log_level,
-            # Add callsite information (filename, func_name, lineno) for debugging
+    processors = [
+        # Filter by level first (performance optimization)
+        filter_by_level,
+        # Merge context variables (ASIN, title, volume, etc.)
+        merge_contextvars,
+        # Add log level to event dict
+        add_log_level,
+    ]
+    if root_level <= logging.DEBUG:
+        # Add callsite information (filename, func_name, lineno) for debugging;
+        # it walks the stack per event, so only pay for it at DEBUG
+        processors.append(
             CallsiteParameterAdder(
                 parameters=[
                     structlog.processors.CallsiteParameter.FILENAME,
                     structlog.processors.CallsiteParameter.FUNC_NAME,
                     structlog.processors.CallsiteParameter.LINENO,
                 ]
-            ),
-            # Add timestamp
-            timestamper,
-            # Format stack info for exceptions
-            structlog.processors.StackInfoRenderer(),
-            # Format exception info
-            structlog.processors.format_exc_info,
-            # Final rendering step
-            final_renderer,
-        ],
+            )
+        )
+    processors += [
+        # Add timestamp
+        timestamper,
+        # Format stack info for exceptions
+        structlog.processors.StackInfoRenderer(),
+        # Format exception info
+        structlog.processors.format_exc_info,
+        # Final rendering step
+        final_renderer,
+    ]
+
+    # Configure structlog
+    structlog.configure(
+        cache_logger_on_first_use=True,
+        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=LoggerFactory(),
+        processors=processors,
     )
 
     # Return a conventional stdlib logger for compatibility
@@ -29,17 +29,23 @@ def plan_and_link(...):
     """
 
     def decorator(fn: Callable) -> Callable:
+        # Resolved once per decorated function, like a module-level logger.
+        # structlog binds the proxy on its first log call and caches it, so
+        # setup_logging() must run before the decorated function is first called
+        log = get_logger(fn.__module__)
+        start_event = f"{event_base}_start"
+        complete_event = f"{event_base}_complete"
+
         @wraps(fn)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            log = get_logger(fn.__module__)
-            log.info(f"{event_base}_start")
+            log.info(start_event)
             t0 = time.perf_counter()
             try:
                 result = fn(*args, **kwargs)
                 return result
             finally:
                 dt = (time.perf_counter() - t0) * 1000
-                log.info(f"{event_base}_complete", took_ms=round(dt, 3))
+                log.info(complete_event, took_ms=round(dt, 3))
 
         return wrapper
 
@@ -7,6 +7,9 @@
 # Global console instance
 console = Console()
 
+# Accepted answers for yes/no confirmation prompts
+YES_ANSWERS = frozenset({"y", "yes"})
+
 
 class PathValidator:
     """Centralized path validation"""
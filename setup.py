@@ -7,6 +7,7 @@
     entry_points={
         "console_scripts": [
             "hardbound=hardbound:main",
+            "hardbound-preview=hardbound.preview:main",
         ],
     },
     python_requires=">=3.13",
@@ -20,3 +20,13 @@ def pytest_configure(config: pytest.Config) -> None:
     )
     config.addinivalue_line("markers", "integration: marks tests as integration tests")
     config.addinivalue_line("markers", "unit: marks tests as unit tests")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_link_config():
+    """Keep the linker's cached config from leaking between tests"""
+    from hardbound.linker import invalidate_link_config
+
+    invalidate_link_config()
+    yield
+    invalidate_link_config()
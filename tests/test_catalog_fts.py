@@ -6,6 +6,7 @@
 Part of the Hardbound test improvement plan (Phase 2: Catalog)
 """
 
+import sqlite3
 from pathlib import Path
 from unittest.mock import patch
 
@@ -328,6 +329,14 @@ def test_limit_respects_matches(
         assert len(results) == 2
         assert all("Sanderson" in r["author"] for r in results)
 
+    def test_recent_orders_by_mtime(
+        self, catalog_with_sample_data: AudiobookCatalog
+    ) -> None:
+        """Test recent() returns the newest items first"""
+        results = catalog_with_sample_data.recent(limit=2)
+
+        assert [r["asin"] for r in results] == ["B0TEST006", "B0TEST005"]
+
     def test_zero_limit(self, catalog_with_sample_data: AudiobookCatalog) -> None:
         """Test that zero limit returns empty results"""
         results = catalog_with_sample_data.search("", limit=0)
@@ -558,5 +567,257 @@ def test_search_very_long_query(
         assert isinstance(results, list)
 
 
+# ============================================================================
+# AUTHOR BROWSER AGGREGATES
+# ============================================================================
+
+
+@pytest.mark.unit
+class TestAuthorBrowserQueries:
+    """Test the SQL aggregates backing the hierarchical author browser"""
+
+    def test_authors_by_initial_counts_distinct_authors(
+        self, catalog_with_sample_data: AudiobookCatalog
+    ) -> None:
+        """Test initials map to the number of distinct authors"""
+        initials = catalog_with_sample_data.authors_by_initial()
+
+        assert initials == {"B": 1, "N": 1, "P": 1}
+
+    def test_authors_by_initial_groups_unknown_and_symbols(
+        self, catalog_with_sample_data: AudiobookCatalog
+    ) -> None:
+        """Test empty authors group as Unknown and non-letters as '#'"""
+        catalog_with_sample_data.conn.executemany(
+            "INSERT INTO items (author, book, path) VALUES (?, ?, ?)",
+            [("", "Orphan", "/x/orphan"), ("42 Authors", "Numbers", "/x/numbers")],
+        )
+
+        initials = catalog_with_sample_data.authors_by_initial()
+
+        assert initials["U"] == 1
+        assert initials["#"] == 1
+        assert catalog_with_sample_data.authors_page("U") == [("Unknown", 1)]
+        assert [b["book"] for b in catalog_with_sample_data.books_for_author("Unknown")] == [
+            "Orphan"
+        ]
+
+    def test_authors_by_initial_groups_non_ascii_under_hash(
+        self, catalog_with_sample_data: AudiobookCatalog
+    ) -> None:
+        """Test non-ASCII and emoji initials, in any case, all group as '#'"""
+        catalog_with_sample_data.conn.executemany(
+            "INSERT INTO items (author, book, path) VALUES (?, ?, ?)",
+            [
+                ("Émile Zola", "Germinal", "/x/1"),
+                ("émile ajar", "La vie", "/x/2"),
+                ("😀 Smile", "Grin", "/x/3"),
+            ],
+        )
+
+        initials = catalog_with_sample_data.authors_by_initial()
+
+        assert initials["#"] == 3
+        assert set(initials) == {"#", "B", "N", "P"}
+        assert [name for name, _ in catalog_with_sample_data.authors_page("#")] == [
+            "Émile Zola",
+            "émile ajar",
+            "😀 Smile",
+        ]
+
+    def test_stale_author_initial_index_is_rebuilt(self, tmp_path: Path) -> None:
+        """Test an index built from an older initial expression is replaced"""
+        from hardbound.catalog import _AUTHOR_INITIAL_INDEX_SQL
+
+        db = tmp_path / "old.db"
+        AudiobookCatalog(db).close()
+        conn = sqlite3.connect(db)
+        conn.execute("DROP INDEX idx_author_initial")
+        conn.execute("CREATE INDEX idx_author_initial ON items(upper(author))")
+        conn.commit()
+        conn.close()
+
+        catalog = AudiobookCatalog(db)
+        try:
+            sql = catalog.conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'idx_author_initial'"
+            ).fetchone()[0]
+        finally:
+            catalog.close()
+
+        assert sql == _AUTHOR_INITIAL_INDEX_SQL
+
+    def test_author_initial_uses_index(
+        self, catalog_with_sample_data: AudiobookCatalog
+    ) -> None:
+        """Test initial lookups search idx_author_initial instead of scanning"""
+        from hardbound.catalog import _AUTHOR_INITIAL_SQL
+
+        plan = catalog_with_sample_data.conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT author FROM items WHERE {_AUTHOR_INITIAL_SQL} = ?",
+            ("N",),
+        ).fetchall()
+
+        assert any("idx_author_initial" in row["detail"] for row in plan)
+
+    def test_authors_page_returns_book_counts(
+        self, catalog_with_sample_data: AudiobookCatalog
+    ) -> None:
+        """Test per-initial author listing includes book counts"""
+        authors = catalog_with_sample_data.authors_page("B")
+
+        assert authors == [("Brandon Sanderson", 3)]
+
+    def test_authors_page_limit_and_offset(
+        self, catalog_with_sample_data: AudiobookCatalog
+    ) -> None:
+        """Test author pages are sliced in SQL"""
+        catalog_with_sample_data.conn.executemany(
+            "INSERT INTO items (author, book, path) VALUES (?, ?, ?)",
+            [(f"Bob {i}", "Book", f"/x/bob{i}") for i in range(3)],
+        )
+
+        first = catalog_with_sample_data.authors_page("B", 0, 2)
+        second = catalog_with_sample_data.authors_page("B", 2, 2)
+
+        assert first == [("Bob 0", 1), ("Bob 1", 1)]
+        assert second == [("Bob 2", 1), ("Brandon Sanderson", 3)]
+
+    def test_authors_page_is_cached_until_reindex(
+        self, catalog_with_sample_data: AudiobookCatalog, tmp_path: Path
+    ) -> None:
+        """Test repeated page fetches are served from cache and reindex clears it"""
+        first = catalog_with_sample_data.authors_page("N", 0, 20)
+        catalog_with_sample_data.conn.execute(
+            "INSERT INTO items (author, book, path) VALUES ('Nora', 'Book', '/x/nora')"
+        )
+
+        assert catalog_with_sample_data.authors_page("N", 0, 20) == first
+
+        catalog_with_sample_data.index_directory(tmp_path)
+
+        assert catalog_with_sample_data.authors_page("N", 0, 20) == [
+            ("Neil Gaiman", 2),
+            ("Nora", 1),
+        ]
+
+    def test_authors_page_cache_is_per_catalog(
+        self, catalog_with_sample_data: AudiobookCatalog
+    ) -> None:
+        """Test closing another catalog leaves this catalog's page cache alone"""
+        first = catalog_with_sample_data.authors_page("N", 0, 20)
+        catalog_with_sample_data.conn.execute(
+            "INSERT INTO items (author, book, path) VALUES ('Nora', 'Book', '/x/nora')"
+        )
+
+        AudiobookCatalog.from_rows([]).close()
+
+        assert catalog_with_sample_data.authors_page("N", 0, 20) == first
+
+    def test_authors_page_cache_cleared_by_file_indexing(
+        self, catalog_with_sample_data: AudiobookCatalog, tmp_path: Path
+    ) -> None:
+        """Test the parallel file indexer invalidates cached author pages"""
+        catalog_with_sample_data.authors_page("N", 0, 20)
+        catalog_with_sample_data.conn.execute(
+            "INSERT INTO items (author, book, path) VALUES ('Nora', 'Book', '/x/nora')"
+        )
+
+        catalog_with_sample_data.index_directory_parallel(tmp_path, verbose=False)
+
+        assert ("Nora", 1) in catalog_with_sample_data.authors_page("N", 0, 20)
+
+    def test_books_for_author(self, catalog_with_sample_data: AudiobookCatalog) -> None:
+        """Test fetching all books for a single author"""
+        books = catalog_with_sample_data.books_for_author("Neil Gaiman")
+
+        assert len(books) == 2
+        assert all(b["author"] == "Neil Gaiman" for b in books)
+
+    def test_books_for_author_ordered_by_series_then_book(
+        self, catalog_with_sample_data: AudiobookCatalog
+    ) -> None:
+        """Test series books come first by series/book, standalone books last"""
+        catalog_with_sample_data.conn.executemany(
+            "INSERT INTO items (author, series, book, path) VALUES (?, ?, ?, ?)",
+            [
+                ("Ann", "", "Zeta", "/x/1"),
+                ("Ann", "Beta", "Two", "/x/2"),
+                ("Ann", "—", "Alpha", "/x/3"),
+                ("Ann", "Alpha", "One", "/x/4"),
+                ("Ann", "Beta", "One", "/x/5"),
+                ("Ann", None, "Mid", "/x/6"),
+            ],
+        )
+
+        books = catalog_with_sample_data.books_for_author("Ann")
+
+        assert [(b["series"], b["book"]) for b in books] == [
+            ("Alpha", "One"),
+            ("Beta", "One"),
+            ("Beta", "Two"),
+            ("—", "Alpha"),
+            (None, "Mid"),
+            ("", "Zeta"),
+        ]
+
+
+# ============================================================================
+# PLAIN-TEXT SEARCH & IN-MEMORY CATALOGS
+# ============================================================================
+
+
+@pytest.mark.unit
+class TestSearchText:
+    """Test prefix search over plain user input"""
+
+    def test_search_text_prefix_matches(
+        self, catalog_with_sample_data: AudiobookCatalog
+    ) -> None:
+        """Test each term is treated as a prefix"""
+        results = catalog_with_sample_data.search_text("sand mist")
+
+        assert len(results) == 2
+        assert all(r["series"] == "Mistborn" for r in results)
+
+    def test_search_text_tolerates_fts_syntax(
+        self, catalog_with_sample_data: AudiobookCatalog
+    ) -> None:
+        """Test punctuation and operators don't raise FTS5 syntax errors"""
+        for query in ("O'Brien", '"unbalanced', "Gaiman OR", "vol_01 - (x"):
+            assert isinstance(catalog_with_sample_data.search_text(query), list)
+
+    def test_search_text_empty_returns_recent(
+        self, catalog_with_sample_data: AudiobookCatalog
+    ) -> None:
+        """Test blank input falls back to the most recent items"""
+        results = catalog_with_sample_data.search_text("   ", limit=2)
+
+        assert [r["book"] for r in results] == [
+            "The Name of the Wind vol_01 {ASIN.B0TEST006}",
+            "The Ocean at the End of the Lane {ASIN.B0TEST005}",
+        ]
+
+
+@pytest.mark.unit
+class TestFromRows:
+    """Test building in-memory catalogs from result rows"""
+
+    def test_from_rows_supports_search_and_aggregates(self, tmp_path: Path) -> None:
+        """Test in-memory catalogs expose the same queries as the on-disk one"""
+        rows = [
+            {"author": "Neil Gaiman", "book": "American Gods", "path": "/a/1"},
+            {"author": "Neil Gaiman", "book": "Coraline", "path": "/a/2", "id": 99},
+        ]
+
+        with patch("hardbound.catalog.DB_DIR", tmp_path):
+            catalog = AudiobookCatalog.from_rows(rows)
+            try:
+                assert catalog.authors_by_initial() == {"N": 1}
+                assert [r["path"] for r in catalog.search_text("cora")] == ["/a/2"]
+            finally:
+                catalog.close()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
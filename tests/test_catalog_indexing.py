@@ -6,13 +6,14 @@
 Part of the Hardbound test improvement plan (Phase 2: Catalog)
 """
 
+import threading
 from pathlib import Path
 from unittest.mock import patch
 from time import sleep
 
 import pytest
 
-from hardbound.catalog import AudiobookCatalog
+from hardbound.catalog import AudiobookCatalog, IndexCancelled
 
 
 # ============================================================================
@@ -181,6 +182,41 @@ def test_index_directory_empty(
 
         assert count == 0
 
+    def test_index_directory_cancel_stops_counting_pass(
+        self, catalog_instance: AudiobookCatalog, sample_audiobook_structure: Path
+    ) -> None:
+        """Test a set cancel event stops the walk before anything is written"""
+        cancel = threading.Event()
+        cancel.set()
+
+        with pytest.raises(IndexCancelled):
+            catalog_instance.index_directory(sample_audiobook_structure, cancel=cancel)
+
+        assert catalog_instance.get_stats()["total"] == 0
+
+    def test_index_directory_cancel_rolls_back_bulk_writes(
+        self, catalog_instance: AudiobookCatalog, sample_audiobook_structure: Path
+    ) -> None:
+        """Test cancelling mid-write inside bulk() leaves no partial rows"""
+        total_entries = sum(1 for _ in sample_audiobook_structure.rglob("*"))
+
+        class CancelLate(threading.Event):
+            """Reports set only once the second pass has written some rows"""
+
+            checks = 0
+
+            def is_set(self) -> bool:
+                self.checks += 1
+                return self.checks > total_entries + total_entries // 2
+
+        with pytest.raises(IndexCancelled):
+            with catalog_instance.bulk():
+                catalog_instance.index_directory(
+                    sample_audiobook_structure, cancel=CancelLate()
+                )
+
+        assert catalog_instance.get_stats()["total"] == 0
+
     def test_index_directory_updates_existing(
         self, catalog_instance: AudiobookCatalog, sample_audiobook_structure: Path
     ) -> None:
@@ -220,6 +256,32 @@ def test_index_directory_recursive(
         books_without_series = cursor.fetchone()[0]
         assert books_without_series == 2  # Gaiman and Rothfuss books
 
+    def test_bulk_indexes_in_one_wal_transaction(
+        self, catalog_instance: AudiobookCatalog, sample_audiobook_structure: Path
+    ) -> None:
+        """Test bulk() switches to WAL and commits once on exit"""
+        with catalog_instance.bulk():
+            catalog_instance.index_directory(sample_audiobook_structure)
+            assert catalog_instance.conn.in_transaction
+
+        assert not catalog_instance.conn.in_transaction
+        journal_mode = catalog_instance.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert journal_mode == "wal"
+        count = catalog_instance.conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        assert count == 4
+
+    def test_bulk_rolls_back_on_error(
+        self, catalog_instance: AudiobookCatalog, sample_audiobook_structure: Path
+    ) -> None:
+        """Test a failing bulk block leaves the catalog untouched"""
+        with pytest.raises(RuntimeError):
+            with catalog_instance.bulk():
+                catalog_instance.index_directory(sample_audiobook_structure)
+                raise RuntimeError("interrupted")
+
+        count = catalog_instance.conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        assert count == 0
+
 
 # ============================================================================
 # PHASE 2.4: CATALOG STATISTICS
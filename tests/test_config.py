@@ -97,3 +97,76 @@ def test_save_config_creates_directory(self) -> None:
                 save_config(test_config)
                 assert temp_config_dir.exists()
                 assert temp_config_file.exists()
+
+    def test_load_after_save_returns_migrated_config(self) -> None:
+        """Test a load served from the cache after save still fills in defaults"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_config_dir = Path(temp_dir) / ".config" / "hardbound"
+            temp_config_file = temp_config_dir / "config.json"
+
+            with (
+                patch("hardbound.config.CONFIG_DIR", temp_config_dir),
+                patch("hardbound.config.CONFIG_FILE", temp_config_file),
+                patch("hardbound.config.json.loads", wraps=json.loads) as loads,
+            ):
+                save_config({"library_path": temp_dir, "zero_pad": False})
+                config = load_config()
+
+            assert loads.call_count == 0
+            assert config["library_path"] == temp_dir
+            assert config["zero_pad"] is False
+            assert "integrations" in config
+            assert "first_run" in config
+
+    def test_load_config_reuses_parsed_file(self) -> None:
+        """Test repeated loads of an unchanged file skip JSON parsing"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_config_file = Path(temp_dir) / "config.json"
+            temp_config_file.write_text(
+                json.dumps(
+                    {
+                        "library_path": temp_dir,
+                        "torrent_path": temp_dir,
+                        "zero_pad": False,
+                    }
+                )
+            )
+
+            with (
+                patch("hardbound.config.CONFIG_FILE", temp_config_file),
+                patch("hardbound.config.json.loads", wraps=json.loads) as loads,
+            ):
+                first = load_config()
+                first["zero_pad"] = True  # Caller mutations must not leak
+                second = load_config()
+
+            assert loads.call_count == 1
+            assert second["zero_pad"] is False
+
+    def test_load_config_picks_up_external_edits(self) -> None:
+        """Test the cache is invalidated when the file changes on disk"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_config_file = Path(temp_dir) / "config.json"
+            temp_config_file.write_text(
+                json.dumps(
+                    {
+                        "library_path": temp_dir,
+                        "torrent_path": temp_dir,
+                        "zero_pad": False,
+                    }
+                )
+            )
+
+            with patch("hardbound.config.CONFIG_FILE", temp_config_file):
+                assert load_config()["zero_pad"] is False
+                temp_config_file.write_text(
+                    json.dumps(
+                        {
+                            "library_path": temp_dir,
+                            "torrent_path": temp_dir,
+                            "zero_pad": True,
+                            "also_cover": True,
+                        }
+                    )
+                )
+                assert load_config()["zero_pad"] is True
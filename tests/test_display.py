@@ -2,9 +2,19 @@
 Tests for display utilities
 """
 
+from pathlib import Path
 from unittest.mock import Mock, patch
 
-from hardbound.display import Sty, banner, ellipsize, section, summary_table, term_width
+from hardbound.display import (
+    Sty,
+    banner,
+    ellipsize,
+    format_row,
+    row,
+    section,
+    summary_table,
+    term_width,
+)
 
 
 class TestSty:
@@ -115,6 +125,67 @@ def test_section_display(self, mock_print: Mock) -> None:
         assert any("Test Section" in call for call in calls)
 
 
+class TestRow:
+    """Test link status row display"""
+
+    @patch("hardbound.display.term_width", return_value=200)
+    @patch("hardbound.display.console.print")
+    def test_row_prints_paths_verbatim(self, mock_print: Mock, _width: Mock) -> None:
+        """Test bracketed path parts are not treated as Rich markup"""
+        row(
+            "🔗",
+            Sty.GREEN,
+            "link",
+            Path("/src/[red]Book[/red]"),
+            Path("/dst/b.m4b"),
+            False,
+        )
+
+        text = mock_print.call_args.args[0]
+        assert text.plain == "🔗 link    /src/[red]Book[/red] → /dst/b.m4b"
+
+    @patch("hardbound.display.term_width", return_value=40)
+    @patch("hardbound.display.console.print")
+    def test_row_truncates_long_paths(self, mock_print: Mock, _width: Mock) -> None:
+        """Test the path part is ellipsized to the terminal width"""
+        row("✓", Sty.GREY, "ok", Path("/s/" + "x" * 80), Path("/d/" + "y" * 80), False)
+
+        text = mock_print.call_args.args[0]
+        assert text.plain.endswith("…")
+        assert len(text.plain) <= 40
+
+
+class TestFormatRow:
+    """Test format_row browser row builder"""
+
+    def test_format_row_title_only(self) -> None:
+        """Test plain rows show title, format indicator and size"""
+        book = {"book": "Dune", "has_m4b": True, "size": 3 * 1024 * 1024}
+
+        assert format_row(book, 7) == "[green]  7[/green]) Dune 📘 (3MB)"
+
+    def test_format_row_breadcrumb(self) -> None:
+        """Test breadcrumb rows include author and series"""
+        book = {
+            "author": "Frank Herbert",
+            "series": "Dune",
+            "book": "Dune",
+            "size": None,
+        }
+
+        assert format_row(book, 1, breadcrumb=True).endswith(
+            "Frank Herbert ▸ Dune ▸ Dune 🎵 (0MB)"
+        )
+
+    def test_format_row_memoizes_label(self) -> None:
+        """Test the label is computed once and reused with new indices"""
+        book = {"book": "Dune", "size": 0}
+        format_row(book, 1)
+        book["book"] = "Changed"
+
+        assert format_row(book, 2) == "[green]  2[/green]) Dune 🎵 (0MB)"
+
+
 class TestSummaryTable:
     """Test summary table display"""
 
@@ -13,7 +13,9 @@
     parse_selection_input,
     display_selection_review,
     have_fzf,
+    fzf_pick,
     _get_recent_sources,
+    _has_audio,
 )
 
 
@@ -51,6 +53,26 @@ def test_get_recent_sources_none(self) -> None:
         assert result == []
 
 
+class TestHasAudio:
+    """Test _has_audio directory probe"""
+
+    def test_has_audio_detects_audio_files(self, tmp_path: Path) -> None:
+        """Test .m4b/.mp3 files mark a directory as audio"""
+        (tmp_path / "cover.jpg").write_text("x")
+        assert _has_audio(tmp_path) is False
+        (tmp_path / "book.mp3").write_text("x")
+        assert _has_audio(tmp_path) is True
+
+    def test_has_audio_counts_hidden_files(self, tmp_path: Path) -> None:
+        """Test dotfiles like '.book.m4b' count, as they did with glob("*.m4b")"""
+        (tmp_path / ".book.m4b").write_text("x")
+        assert _has_audio(str(tmp_path)) is True
+
+    def test_has_audio_missing_directory(self, tmp_path: Path) -> None:
+        """Test unreadable or missing directories report no audio"""
+        assert _has_audio(tmp_path / "missing") is False
+
+
 class TestParseSelectionInput:
     """Test parse_selection_input function"""
 
@@ -206,6 +228,43 @@ def test_have_fzf_not_found(self, mock_which) -> None:
         mock_which.assert_called_once_with("fzf")
 
 
+class TestFzfPick:
+    """Test fzf_pick streaming selection"""
+
+    @patch("hardbound.interactive.have_fzf", return_value=True)
+    @patch("hardbound.interactive.subprocess.Popen")
+    def test_fzf_pick_streams_lines_and_parses_selection(
+        self, mock_popen, _mock_have_fzf
+    ) -> None:
+        """Test candidates are written to fzf stdin and selections parsed"""
+        proc = mock_popen.return_value
+        proc.returncode = 0
+        proc.stdout.read.return_value = "Author ▸ Two (0MB)\t/books/two\n"
+        candidates = [
+            {"author": "Author", "book": "One", "path": "/books/one"},
+            {"author": "Author", "book": "Two", "path": "/books/two"},
+        ]
+
+        result = fzf_pick(candidates)
+
+        assert result == ["/books/two"]
+        assert proc.stdin.write.call_count == 2
+        proc.stdin.write.assert_any_call("Author ▸ One (0MB)\t/books/one\n")
+        proc.stdin.close.assert_called_once()
+
+    @patch("hardbound.interactive.have_fzf", return_value=True)
+    @patch("hardbound.interactive.subprocess.Popen")
+    def test_fzf_pick_tolerates_early_exit(self, mock_popen, _mock_have_fzf) -> None:
+        """Test fzf closing its stdin early doesn't raise"""
+        proc = mock_popen.return_value
+        proc.returncode = 130
+        proc.stdin.write.side_effect = BrokenPipeError
+        proc.stdout.read.return_value = ""
+
+        assert fzf_pick([{"author": "A", "book": "B", "path": "/b"}]) == []
+        proc.stdin.close.assert_called_once()
+
+
 class TestInteractiveUtilsIntegration:
     """Integration tests for interactive utility functions"""
 
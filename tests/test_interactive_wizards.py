@@ -3,6 +3,8 @@
 Tests wizard functions and browser interfaces with mocked user input.
 """
 
+import os
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch, call
 
@@ -14,6 +16,10 @@
     update_catalog_wizard,
     folder_batch_wizard,
     automated_maintenance,
+    find_recent_audiobooks,
+    _start_initial_index,
+    _wait_for_initial_index,
+    maintenance_menu,
 )
 
 
@@ -108,7 +114,7 @@ def test_search_and_link_recent_mode(self, mock_input, mock_search, mock_catalog
         """Test search and link wizard in recent audiobooks mode"""
         mock_catalog = MagicMock()
         mock_catalog_class.return_value = mock_catalog
-        mock_catalog.search.return_value = [
+        mock_catalog.recent.return_value = [
             {"author": "Author", "book": "Book", "path": "/path"}
         ]
         mock_input.return_value = "3"  # Choose recent
@@ -116,7 +122,7 @@ def test_search_and_link_recent_mode(self, mock_input, mock_search, mock_catalog
 
         search_and_link_wizard()
 
-        mock_catalog.search.assert_called_once_with("*", limit=50)
+        mock_catalog.recent.assert_called_once_with(limit=50)
         mock_search.assert_called_once()
         mock_catalog.close.assert_called_once()
 
@@ -209,7 +215,7 @@ class TestFolderBatchWizard:
     @patch("hardbound.interactive.input")
     @patch("hardbound.interactive.browse_directory_tree")
     @patch("hardbound.interactive.load_config")
-    def test_folder_batch_wizard_basic(self, mock_load_config, mock_browse, mock_input, mock_plan_link, mock_summary):
+    def test_folder_batch_wizard_basic(self, mock_load_config, mock_browse, mock_input, mock_plan_link, mock_summary, tmp_path):
         """Test basic folder batch wizard"""
         mock_load_config.return_value = {
             "torrent_path": "/dest",
@@ -217,20 +223,36 @@ def test_folder_batch_wizard_basic(self, mock_load_config, mock_browse, mock_inp
             "also_cover": False
         }
 
-        # Mock browse to return a source directory
-        mock_src = MagicMock()
-        mock_src.name = "TestBook"
-        mock_src.exists.return_value = True
-        mock_src.is_dir.return_value = True
-        mock_src.iterdir.return_value = [mock_src]  # Returns self as subdirectory
-        mock_src.glob.return_value = ["file.m4b"]  # Has audio files
-        mock_browse.return_value = mock_src
+        # Source folder with one audiobook subdirectory and one without audio
+        book_dir = tmp_path / "TestBook"
+        book_dir.mkdir()
+        (book_dir / "file.m4b").write_bytes(b"audio")
+        (tmp_path / "Extras").mkdir()
+        mock_browse.return_value = tmp_path
 
         mock_input.return_value = ""  # Use default destination
 
         folder_batch_wizard()
 
-        mock_plan_link.assert_called()
+        mock_plan_link.assert_called_once()
+        assert mock_plan_link.call_args[0][0] == book_dir
+
+    @patch("hardbound.interactive.summary_table")
+    @patch("hardbound.interactive.plan_and_link_red")
+    @patch("hardbound.interactive.input")
+    @patch("hardbound.interactive.browse_directory_tree")
+    @patch("hardbound.interactive.load_config")
+    def test_folder_batch_wizard_source_is_audiobook(self, mock_load_config, mock_browse, mock_input, mock_plan_link, mock_summary, tmp_path):
+        """Test the selected folder itself is used when it holds the audio"""
+        mock_load_config.return_value = {"torrent_path": "/dest"}
+        (tmp_path / "book.mp3").write_bytes(b"audio")
+        mock_browse.return_value = tmp_path
+        mock_input.return_value = ""
+
+        folder_batch_wizard()
+
+        mock_plan_link.assert_called_once()
+        assert mock_plan_link.call_args[0][0] == tmp_path
 
     @patch("hardbound.interactive.browse_directory_tree")
     @patch("hardbound.interactive.load_config")
@@ -245,6 +267,119 @@ def test_folder_batch_wizard_no_integrations(self, mock_load_config, mock_browse
         mock_browse.assert_called_once()
 
 
+class TestFindRecentAudiobooks:
+    """Test find_recent_audiobooks directory walker"""
+
+    def test_find_recent_audiobooks_depth_and_age(self, tmp_path: Path) -> None:
+        """Test recent audio folders are found within max_depth only"""
+        base = tmp_path / "library"
+        recent_book = base / "Author" / "Recent Book"
+        old_book = base / "Author" / "Old Book"
+        deep_book = base / "a" / "b" / "c" / "Deep Book"
+        for book in (recent_book, old_book, deep_book):
+            book.mkdir(parents=True)
+            (book / "book.m4b").write_bytes(b"audio")
+        (base / "Author" / "notes.txt").write_text("not audio")
+        old = time.time() - 7 * 24 * 3600
+        os.utime(old_book, (old, old))
+
+        config = {"system_search_paths": [str(base)]}
+        with patch("hardbound.interactive.Path.home", return_value=tmp_path / "nohome"):
+            found = find_recent_audiobooks(hours=24, max_depth=2, config=config)
+
+        assert found == [recent_book]
+
+    def test_find_recent_audiobooks_dedups_symlinked_bases(self, tmp_path: Path) -> None:
+        """Test a folder reachable through a symlinked search path is listed once"""
+        base = tmp_path / "library"
+        book = base / "Book"
+        book.mkdir(parents=True)
+        (book / "book.mp3").write_bytes(b"audio")
+        alias = tmp_path / "alias"
+        alias.symlink_to(base)
+
+        config = {"system_search_paths": [str(base), str(alias)]}
+        with patch("hardbound.interactive.Path.home", return_value=tmp_path / "nohome"):
+            found = find_recent_audiobooks(hours=24, config=config)
+
+        assert found == [book]
+
+
+class TestInitialIndex:
+    """Test the background catalog build started on first launch"""
+
+    @patch("hardbound.interactive.PathValidator")
+    @patch("hardbound.interactive.AudiobookCatalog")
+    def test_initial_index_runs_off_thread_until_awaited(self, mock_catalog_class, mock_validator):
+        """Test the build runs on a worker and wizards wait for it"""
+        import threading
+
+        release = threading.Event()
+        mock_catalog = MagicMock()
+        mock_catalog_class.return_value = mock_catalog
+        mock_catalog.index_directory.side_effect = lambda *a, **k: release.wait(5) and 3
+        mock_validator.get_default_search_paths.return_value = [Path("/library")]
+
+        _start_initial_index()
+        # Caller is not blocked while the index is being built
+        mock_catalog.close.assert_not_called()
+
+        release.set()
+        _wait_for_initial_index()
+
+        mock_catalog.index_directory.assert_called_once()
+        assert mock_catalog.index_directory.call_args.args == (Path("/library"),)
+        mock_catalog.close.assert_called_once()
+
+    def test_wait_without_pending_build(self):
+        """Test waiting is a no-op when no build was started"""
+        _wait_for_initial_index()
+
+    @patch("hardbound.interactive.PathValidator")
+    @patch("hardbound.interactive.AudiobookCatalog")
+    def test_initial_index_cancelled_at_exit(self, mock_catalog_class, mock_validator):
+        """Test the exit hook stops the daemon build and it still closes the catalog"""
+        import threading
+
+        import hardbound.interactive as interactive
+        from hardbound.catalog import IndexCancelled
+
+        started = threading.Event()
+        mock_catalog = MagicMock()
+        mock_catalog_class.return_value = mock_catalog
+        mock_validator.get_default_search_paths.return_value = [Path("/library")]
+
+        def index_directory(root, verbose, cancel):
+            started.set()
+            while not cancel.is_set():
+                time.sleep(0.01)
+            raise IndexCancelled(str(root))
+
+        mock_catalog.index_directory.side_effect = index_directory
+
+        _start_initial_index()
+        assert interactive._initial_index_thread.daemon
+        started.wait(5)
+
+        interactive._cancel_initial_index()
+
+        assert not interactive._initial_index_thread.is_alive()
+        mock_catalog.close.assert_called_once()
+        interactive._initial_index = None
+
+    @patch("hardbound.interactive._wait_for_initial_index")
+    @patch("hardbound.interactive.AudiobookCatalog")
+    @patch("hardbound.interactive.input", return_value="7")
+    def test_maintenance_back_does_not_wait_for_build(
+        self, mock_input, mock_catalog_class, mock_wait
+    ):
+        """Test leaving the maintenance menu doesn't block on the catalog build"""
+        maintenance_menu()
+
+        mock_wait.assert_not_called()
+        mock_catalog_class.assert_not_called()
+
+
 class TestAutomatedMaintenance:
     """Test automated_maintenance function"""
 
@@ -16,6 +16,7 @@
     _enforce_asin_policy,
     do_link,
     ensure_dir,
+    new_stats,
     preflight_checks,
 )
 
@@ -244,6 +245,46 @@ def test_preflight_unraid_user_disk_mixing(self, tmp_path: Path) -> None:
         # But the Unraid check happens first
         assert not preflight_checks(src, dst)
 
+    def test_preflight_caches_destination_device(self, tmp_path: Path) -> None:
+        """Test the destination directory is stat'ed once across a batch"""
+        dst_root = tmp_path / "dst"
+        dst_root.mkdir()
+        sources = []
+        for i in range(3):
+            src = tmp_path / f"book{i}.m4b"
+            src.write_text("content")
+            sources.append(src)
+
+        with patch("os.stat", wraps=os.stat) as mock_stat:
+            for src in sources:
+                assert preflight_checks(src, dst_root / src.name)
+
+        stat_paths = [os.fspath(c.args[0]) for c in mock_stat.call_args_list]
+        assert stat_paths.count(str(dst_root)) == 1
+
+    def test_preflight_device_cache_cleared_between_runs(self, tmp_path: Path) -> None:
+        """Test a new link run re-stats the destination (it may be remounted)"""
+        from hardbound.linker import invalidate_link_config
+
+        src = tmp_path / "book.m4b"
+        src.write_text("content")
+        dst = tmp_path / "dst" / "book.m4b"
+        dst.parent.mkdir()
+
+        assert preflight_checks(src, dst)
+        invalidate_link_config()
+
+        real_stat = os.stat
+
+        def remounted(path, **kwargs):
+            st = real_stat(path, **kwargs)
+            if os.fspath(path) == str(dst.parent):
+                return MagicMock(st_dev=st.st_dev + 1)
+            return st
+
+        with patch("os.stat", side_effect=remounted):
+            assert not preflight_checks(src, dst)
+
 
 # ============================================================================
 # PHASE 3.2: CORE LINKING - do_link()
@@ -271,6 +312,123 @@ def test_do_link_creates_hardlink(self, sample_files: dict, stats_dict: dict) ->
         # Stats should reflect creation
         assert stats_dict["linked"] == 1
 
+    def test_do_link_stats_each_path_once(
+        self, sample_files: dict, stats_dict: dict
+    ) -> None:
+        """Test an already-linked check stats src and dst once each"""
+        src = sample_files["src_file"]
+        dst = sample_files["dst_file"]
+        os.link(src, dst)
+
+        with patch("os.stat", wraps=os.stat) as mock_stat:
+            do_link(src, dst, force=False, dry_run=False, stats=stats_dict)
+
+        assert stats_dict["already"] == 1
+        assert [c.args[0] for c in mock_stat.call_args_list] == [src, dst]
+
+    @patch("hardbound.linker.ConfigManager")
+    def test_do_link_free_destination_skips_stat(
+        self, mock_config_manager, sample_files: dict, stats_dict: dict
+    ) -> None:
+        """Test a link to a free destination is attempted without any stat"""
+        mock_config_manager.return_value.load_config.return_value = {}
+        src = sample_files["src_file"]
+        dst = sample_files["dst_file"]
+
+        with patch("os.stat", wraps=os.stat) as mock_stat:
+            do_link(src, dst, force=False, dry_run=False, stats=stats_dict)
+
+        assert stats_dict["linked"] == 1
+        mock_stat.assert_not_called()
+
+    def test_do_link_missing_source_skipped(
+        self, tmp_path: Path, stats_dict: dict
+    ) -> None:
+        """Test a failed link to a missing source is reported as skipped"""
+        do_link(
+            tmp_path / "missing.m4b",
+            tmp_path / "dst.m4b",
+            force=False,
+            dry_run=False,
+            stats=stats_dict,
+        )
+
+        assert stats_dict["skipped"] == 1
+        assert stats_dict["errors"] == 0
+
+    def test_do_link_reuses_given_src_stat(
+        self, sample_files: dict, stats_dict: dict
+    ) -> None:
+        """Test a caller-provided source stat replaces the source lookup"""
+        src = sample_files["src_file"]
+        dst = sample_files["dst_file"]
+        src_stat = os.stat(src)
+
+        with patch("os.stat", wraps=os.stat) as mock_stat:
+            do_link(src, dst, force=False, dry_run=False, stats=stats_dict, src_stat=src_stat)
+
+        assert stats_dict["linked"] == 1
+        assert src not in [c.args[0] for c in mock_stat.call_args_list]
+
+    def test_do_link_relative_to_dst_dir_fd(
+        self, sample_files: dict, stats_dict: dict
+    ) -> None:
+        """Test linking by name through an open destination directory fd"""
+        src = sample_files["src_file"]
+        dst = sample_files["dst_file"]
+        dst.write_text("old")
+
+        fd = os.open(dst.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            do_link(src, dst, force=True, dry_run=False, stats=stats_dict, dst_dir_fd=fd)
+        finally:
+            os.close(fd)
+
+        assert stats_dict["replaced"] == 1
+        assert dst.stat().st_ino == src.stat().st_ino
+
+    def test_do_link_force_replace_is_atomic(
+        self, sample_files: dict, stats_dict: dict
+    ) -> None:
+        """Test force replaces via rename, never unlinking dst or leaving temps"""
+        src = sample_files["src_file"]
+        dst = sample_files["dst_file"]
+        dst.write_text("old")
+
+        with patch("os.unlink", wraps=os.unlink) as mock_unlink:
+            do_link(src, dst, force=True, dry_run=False, stats=stats_dict)
+
+        mock_unlink.assert_not_called()
+        assert stats_dict["replaced"] == 1
+        assert dst.stat().st_ino == src.stat().st_ino
+        assert sorted(p.name for p in dst.parent.iterdir()) == [dst.name]
+
+    def test_do_link_relative_to_both_dir_fds(
+        self, sample_files: dict, stats_dict: dict
+    ) -> None:
+        """Test linking by name through open source and destination dir fds"""
+        src = sample_files["src_file"]
+        dst = sample_files["dst_file"]
+
+        src_fd = os.open(src.parent, os.O_RDONLY | os.O_DIRECTORY)
+        dst_fd = os.open(dst.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            do_link(
+                src,
+                dst,
+                force=False,
+                dry_run=False,
+                stats=stats_dict,
+                dst_dir_fd=dst_fd,
+                src_dir_fd=src_fd,
+            )
+        finally:
+            os.close(src_fd)
+            os.close(dst_fd)
+
+        assert stats_dict["linked"] == 1
+        assert dst.stat().st_ino == src.stat().st_ino
+
     def test_do_link_dry_run(self, sample_files: dict, stats_dict: dict) -> None:
         """Test that do_link in dry-run mode doesn't create files"""
         src = sample_files["src_file"]
@@ -421,7 +579,7 @@ def test_file_permissions_set(
         set_file_permissions_and_ownership(test_file)
 
         # Should have called chmod
-        mock_chmod.assert_called_once_with(test_file, 0o644)
+        mock_chmod.assert_called_once_with(test_file, 0o644, dir_fd=None)
 
     @patch("hardbound.linker.ConfigManager")
     @patch("os.chmod")
@@ -443,6 +601,176 @@ def test_file_permissions_disabled(
         # Should NOT have called chmod
         mock_chmod.assert_not_called()
 
+    @patch("hardbound.linker.ConfigManager")
+    @patch("os.chmod")
+    def test_permissions_config_loaded_once(
+        self, mock_chmod, mock_config_manager, tmp_path: Path
+    ) -> None:
+        """Test the config is read once per run, not once per file"""
+        from hardbound.linker import (
+            invalidate_link_config,
+            set_dir_permissions_and_ownership,
+            set_file_permissions_and_ownership,
+        )
+
+        mock_config = MagicMock()
+        mock_config.load_config.return_value = {
+            "set_permissions": True,
+            "file_permissions": 0o640,
+        }
+        mock_config_manager.return_value = mock_config
+
+        for i in range(3):
+            set_file_permissions_and_ownership(tmp_path / f"{i}.m4b")
+        set_dir_permissions_and_ownership(tmp_path)
+
+        assert mock_config.load_config.call_count == 1
+        assert mock_chmod.call_count == 3
+
+        invalidate_link_config()
+        set_file_permissions_and_ownership(tmp_path / "again.m4b")
+        assert mock_config.load_config.call_count == 2
+
+    @patch("hardbound.linker.ConfigManager")
+    @patch("os.chown")
+    def test_unknown_owner_resolved_once(
+        self, mock_chown, mock_config_manager, tmp_path: Path
+    ) -> None:
+        """Test an unresolvable owner disables chown instead of failing per file"""
+        from hardbound.linker import (
+            _load_perm_spec,
+            set_file_permissions_and_ownership,
+        )
+
+        mock_config = MagicMock()
+        mock_config.load_config.return_value = {
+            "set_ownership": True,
+            "owner_user": "no-such-user-hardbound",
+            "owner_group": "",
+        }
+        mock_config_manager.return_value = mock_config
+
+        with patch("pwd.getpwnam", side_effect=KeyError("no-such-user")) as getpw:
+            for i in range(3):
+                set_file_permissions_and_ownership(tmp_path / f"{i}.m4b")
+
+        assert getpw.call_count == 1
+        assert _load_perm_spec().do_own is False
+        mock_chown.assert_not_called()
+
+    @patch("hardbound.linker.ConfigManager")
+    def test_link_skips_chmod_when_mode_matches(
+        self, mock_config_manager, tmp_path: Path
+    ) -> None:
+        """Test chmod is only issued when the linked inode's mode differs"""
+        src = tmp_path / "src.m4b"
+        src.write_text("content")
+        src.chmod(0o640)
+
+        mock_config = MagicMock()
+        mock_config.load_config.return_value = {
+            "set_permissions": True,
+            "file_permissions": 0o640,
+        }
+        mock_config_manager.return_value = mock_config
+        stats = new_stats()
+
+        with patch("os.chmod") as mock_chmod:
+            do_link(src, tmp_path / "a.m4b", force=False, dry_run=False, stats=stats)
+            mock_chmod.assert_not_called()
+
+            src.chmod(0o600)
+            do_link(src, tmp_path / "b.m4b", force=False, dry_run=False, stats=stats)
+            mock_chmod.assert_called_once()
+
+        assert stats["linked"] == 2
+
+    @patch("hardbound.linker.ConfigManager")
+    def test_dir_permissions_share_one_fd(
+        self, mock_config_manager, tmp_path: Path
+    ) -> None:
+        """Test dir chmod and chown both go through a single opened fd"""
+        from hardbound.linker import set_dir_permissions_and_ownership
+
+        mock_config = MagicMock()
+        mock_config.load_config.return_value = {
+            "set_dir_permissions": True,
+            "dir_permissions": 0o750,
+            "set_ownership": True,
+            "owner_user": "0",
+            "owner_group": "0",
+        }
+        mock_config_manager.return_value = mock_config
+
+        with patch("os.chmod") as mock_chmod, patch("os.chown") as mock_chown:
+            set_dir_permissions_and_ownership(tmp_path)
+
+        fd = mock_chmod.call_args.args[0]
+        assert isinstance(fd, int)
+        assert mock_chown.call_args.args == (fd, 0, 0)
+
+    @patch("hardbound.linker.ConfigManager")
+    def test_permission_failure_logs_as_json(
+        self, mock_config_manager, tmp_path: Path
+    ) -> None:
+        """Test permission log events render through the JSON file renderer"""
+        import io
+        import json
+
+        import structlog
+
+        from hardbound.linker import set_file_permissions_and_ownership
+        from hardbound.utils.logging import _json_renderer
+
+        mock_config = MagicMock()
+        mock_config.load_config.return_value = {
+            "set_permissions": True,
+            "file_permissions": 0o644,
+        }
+        mock_config_manager.return_value = mock_config
+
+        out = io.StringIO()
+        json_log = structlog.wrap_logger(
+            structlog.PrintLogger(out), processors=[_json_renderer]
+        )
+        test_file = tmp_path / "test.m4b"
+
+        with (
+            patch("hardbound.linker.log", json_log),
+            patch("os.chmod", side_effect=PermissionError("denied")),
+        ):
+            set_file_permissions_and_ownership(test_file)
+
+        event = json.loads(out.getvalue())
+        assert event["event"] == "permissions.file_failed"
+        assert event["file_path"] == str(test_file)
+
+    def test_owner_lookup_cached_within_run(self) -> None:
+        """Test user/group names hit the user database once per link run"""
+        from hardbound.linker import (
+            _OWNER_CACHE,
+            _resolve_owner,
+            invalidate_link_config,
+        )
+
+        with (
+            patch.dict(_OWNER_CACHE, clear=True),
+            patch("pwd.getpwnam", return_value=MagicMock(pw_uid=1234)) as getpw,
+            patch("grp.getgrnam", return_value=MagicMock(gr_gid=99)) as getgr,
+        ):
+            assert _resolve_owner("media", "users") == (1234, 99)
+            assert _resolve_owner("media", "users") == (1234, 99)
+            assert _resolve_owner("1000", "") == (1000, -1)
+            assert getpw.call_count == 1
+            assert getgr.call_count == 1
+
+            # Settings may change between runs: the next run looks names up again
+            invalidate_link_config()
+            assert _resolve_owner("media", "users") == (1234, 99)
+
+        assert getpw.call_count == 2
+        assert getgr.call_count == 2
+
 
 # ============================================================================
 # PHASE 3.2: INTEGRATION TESTS
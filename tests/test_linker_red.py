@@ -4,12 +4,14 @@
 """
 
 import os
+from collections import Counter
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from hardbound.linker import (
+    STAT_KEYS,
     choose_base_outputs,
     plan_and_link,
     plan_and_link_red,
@@ -249,6 +251,35 @@ def test_plan_and_link_empty_directory(
         # Should handle gracefully, no errors
         assert stats_dict["errors"] == 0
 
+    def test_plan_and_link_extension_dispatch(
+        self, tmp_path: Path, stats_dict: dict
+    ) -> None:
+        """Test each source extension maps to its canonical destination"""
+        src_dir = tmp_path / "src"
+        src_dir.mkdir()
+        for name in ("a.M4A", "b.webp", "c.PDF", "d.epub", "e.cue.m4b"):
+            (src_dir / name).write_text("x")
+        dst_dir = tmp_path / "dst"
+        base_name = "Book [tag]"
+
+        plan_and_link(
+            src_dir,
+            dst_dir,
+            base_name,
+            also_cover=False,
+            zero_pad=False,
+            force=False,
+            dry_run=False,
+            stats=stats_dict,
+        )
+
+        assert sorted(p.name for p in dst_dir.iterdir()) == [
+            "Book [tag].m4a",  # no canonical output: raw base name
+            "Book.jpg",
+            "Book.m4b",
+            "Book.pdf",
+        ]
+
 
 class TestPlanAndLinkRed:
     """Test plan_and_link_red function"""
@@ -375,6 +406,21 @@ def test_run_batch_invalid_line(self, tmp_path: Path, capfd) -> None:
         captured = capfd.readouterr()
         assert "bad line" in captured.out or "bad line" in captured.err
 
+    def test_run_batch_quotes_and_extra_pipes(self, tmp_path: Path) -> None:
+        """Test quotes stay literal and only the first '|' splits the line"""
+        src_dir = tmp_path / 'The "Quoted" Book'
+        src_dir.mkdir()
+        (src_dir / "audiobook.m4b").write_text("content")
+
+        batch_file = tmp_path / "batch.txt"
+        dst_dir = tmp_path / "dest|odd"
+        batch_file.write_text(f"  {src_dir} | {dst_dir}  \n")
+
+        result = run_batch(batch_file, also_cover=False, zero_pad=False, force=False, dry_run=False)
+
+        assert result["linked"] == 1
+        assert (dst_dir / "dest|odd.m4b").exists()
+
     def test_run_batch_nonexistent_file(self, tmp_path: Path) -> None:
         """Test batch processing with nonexistent batch file"""
         batch_file = tmp_path / "nonexistent.txt"
@@ -385,6 +431,113 @@ def test_run_batch_nonexistent_file(self, tmp_path: Path) -> None:
         # Should increment error counter
         assert result["errors"] == 1
 
+    def test_run_batch_returns_counter_with_all_keys(self, tmp_path: Path) -> None:
+        """Test run_batch stats are a Counter pre-seeded with every summary key"""
+        batch_file = tmp_path / "batch.txt"
+        batch_file.write_text("# nothing to do\n")
+
+        result = run_batch(batch_file, also_cover=False, zero_pad=False, force=False, dry_run=False)
+
+        assert isinstance(result, Counter)
+        assert set(result) == set(STAT_KEYS)
+        assert sum(result.values()) == 0
+
+    def test_run_batch_parallel_jobs_merge_stats(self, tmp_path: Path) -> None:
+        """Test books linked on a thread pool report the same totals"""
+        lines = []
+        for i in range(6):
+            src_dir = tmp_path / f"source{i}"
+            src_dir.mkdir()
+            (src_dir / "audiobook.m4b").write_text(f"content{i}")
+            (src_dir / "cover.jpg").write_text("img")
+            lines.append(f"{src_dir}|{tmp_path / f'dest{i}'}")
+        batch_file = tmp_path / "batch.txt"
+        batch_file.write_text("\n".join(lines) + "\n")
+
+        result = run_batch(
+            batch_file, also_cover=False, zero_pad=False, force=False, dry_run=False, jobs=4
+        )
+
+        assert result["linked"] == 12
+        assert result["errors"] == 0
+        assert set(result) == set(STAT_KEYS)
+        for i in range(6):
+            assert (tmp_path / f"dest{i}" / f"dest{i}.m4b").exists()
+
+    def test_run_batch_parallel_output_in_batch_order(
+        self, tmp_path: Path, capsys
+    ) -> None:
+        """Test each book's output is printed whole, in batch file order"""
+        lines = []
+        for i in range(6):
+            src_dir = tmp_path / f"source{i}"
+            src_dir.mkdir()
+            (src_dir / "audiobook.m4b").write_text(f"content{i}")
+            lines.append(f"{src_dir}|{tmp_path / f'dest{i}'}")
+        batch_file = tmp_path / "batch.txt"
+        batch_file.write_text("\n".join(lines) + "\n")
+
+        run_batch(
+            batch_file, also_cover=False, zero_pad=False, force=False, dry_run=True, jobs=4
+        )
+
+        out = capsys.readouterr().out
+        headers = [out.index(f"🎧 dest{i}") for i in range(6)] + [len(out)]
+        assert headers == sorted(headers)
+        for i in range(6):
+            # Every row for a book sits between its header and the next one
+            block = out[headers[i] : headers[i + 1]]
+            assert block.count("📁 mkdir") == 1
+            assert block.count("🔗 link") == 1
+
+    def test_run_batch_parallel_failure_keeps_other_books(self, tmp_path: Path) -> None:
+        """Test one book raising counts an error without dropping the others"""
+        from unittest.mock import patch
+
+        from hardbound.linker import plan_and_link
+
+        lines = []
+        for i in range(4):
+            src_dir = tmp_path / f"source{i}"
+            src_dir.mkdir()
+            (src_dir / "audiobook.m4b").write_text(f"content{i}")
+            lines.append(f"{src_dir}|{tmp_path / f'dest{i}'}")
+        batch_file = tmp_path / "batch.txt"
+        batch_file.write_text("\n".join(lines) + "\n")
+
+        def flaky(src, dst, *args):
+            if dst.name == "dest0":
+                raise RuntimeError("boom")
+            return plan_and_link(src, dst, *args)
+
+        with patch("hardbound.linker.plan_and_link", side_effect=flaky):
+            result = run_batch(
+                batch_file, also_cover=False, zero_pad=False, force=False, dry_run=False, jobs=2
+            )
+
+        assert result["errors"] == 1
+        assert result["linked"] == 3
+
+    def test_run_batch_reads_config_once(self, tmp_path: Path) -> None:
+        """Test permission settings are loaded once per batch, not per book"""
+        lines = []
+        for i in range(3):
+            src_dir = tmp_path / f"source{i}"
+            src_dir.mkdir()
+            (src_dir / "audiobook.m4b").write_text(f"content{i}")
+            lines.append(f"{src_dir}|{tmp_path / f'dest{i}'}")
+        batch_file = tmp_path / "batch.txt"
+        batch_file.write_text("\n".join(lines) + "\n")
+
+        with patch("hardbound.linker.ConfigManager") as mock_config_manager:
+            mock_config_manager.return_value.load_config.return_value = {}
+            result = run_batch(
+                batch_file, also_cover=False, zero_pad=False, force=False, dry_run=False
+            )
+
+        assert result["linked"] == 3
+        assert mock_config_manager.return_value.load_config.call_count == 1
+
     @pytest.mark.integration
     def test_run_batch_dry_run(self, tmp_path: Path) -> None:
         """Test batch processing in dry-run mode"""
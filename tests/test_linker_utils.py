@@ -6,13 +6,16 @@
 Part of the Hardbound test improvement plan (Phase 3: Linker)
 """
 
+import os
 from pathlib import Path
 
 import pytest
 
 from hardbound.linker import (
+    _lower_ext,
     clean_base_name,
     dest_is_excluded,
+    dest_is_excluded_str,
     normalize_weird_ext,
     same_inode,
     zero_pad_vol,
@@ -113,6 +116,11 @@ def test_normalize_cue_mp3(self) -> None:
         """Test normalizing .cue.mp3 to .mp3"""
         assert normalize_weird_ext("track.cue.mp3") == "track.mp3"
 
+    def test_normalize_mixed_case(self) -> None:
+        """Test weird suffixes match case-insensitively, keeping the real ext"""
+        assert normalize_weird_ext("cover.CUE.JPG") == "cover.JPG"
+        assert normalize_weird_ext("book.Cue.m4b") == "book.m4b"
+
     def test_normalize_normal_ext(self) -> None:
         """Test that normal extensions are unchanged"""
         assert normalize_weird_ext("file.jpg") == "file.jpg"
@@ -140,6 +148,17 @@ def test_normalize_no_extension(self) -> None:
 # ============================================================================
 
 
+@pytest.mark.unit
+class TestLowerExt:
+    """Test extension extraction used when planning links"""
+
+    def test_lower_ext_matches_path_suffix(self) -> None:
+        """Test _lower_ext agrees with Path.suffix on edge cases"""
+        names = ["book.M4B", "a.b.mp3", ".hidden", "..mp3", "a..b", "noext", "a.", ".."]
+        for name in names:
+            assert _lower_ext(name) == Path(name).suffix.lower()
+
+
 @pytest.mark.unit
 class TestCleanBaseName:
     """Test cleaning of base names (removing user tags)"""
@@ -200,6 +219,19 @@ def test_clean_whitespace_handling(self) -> None:
         result = clean_base_name("Book Title  [Tag]")
         assert result == "Book Title"  # Trailing spaces removed
 
+    def test_clean_malformed_tags(self) -> None:
+        """Test bracket edge cases cut the same way as the original regex"""
+        assert clean_base_name("Book []") == "Book []"  # empty tag kept
+        assert clean_base_name("Book {mixed]") == "Book"
+        assert clean_base_name("Book [a[b]") == "Book"  # leftmost opener
+        assert clean_base_name("Book] [Tag]") == "Book]"
+        assert clean_base_name("}{ASIN.}") == "}"
+
+    def test_clean_asin_before_trailing_tags(self) -> None:
+        """Test an ASIN followed by untagged text is re-appended once"""
+        result = clean_base_name("Book {ASIN.B09CVBWLZT} Extra  [Tag]")
+        assert result == "Book {ASIN.B09CVBWLZT} Extra {ASIN.B09CVBWLZT}"
+
 
 # ============================================================================
 # PHASE 3.1: DESTINATION EXCLUSIONS
@@ -244,6 +276,14 @@ def test_not_excluded_similar_names(self) -> None:
         assert not dest_is_excluded(Path("mycover.jpg"))  # Not exactly "cover.jpg"
         assert not dest_is_excluded(Path("metadata.txt"))  # Not .json
 
+    def test_excluded_str_matches_path_rules(self) -> None:
+        """Test the string variant agrees with the Path-based check"""
+        for name in ("cover.jpg", "/a/Cover.JPG", "b/book.EPUB", "metadata.json"):
+            assert dest_is_excluded_str(name)
+        for name in ("/a/book.m4b", "mycover.jpg", ".epub", "/a/.epub", "book."):
+            assert not dest_is_excluded_str(name)
+            assert dest_is_excluded(Path(name)) is False
+
 
 # ============================================================================
 # PHASE 3.1: INODE COMPARISON
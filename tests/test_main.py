@@ -45,6 +45,22 @@ def test_version_output(self) -> None:
             result.returncode == 0 or result.returncode == 1
         )  # 1 is ok for interrupted interactive mode
 
+    def test_jobs_must_be_positive(self) -> None:
+        """Test --jobs below 1 is rejected by the parser"""
+        result = subprocess.run(
+            [
+                sys.executable,
+                str(Path(__file__).parent.parent / "hardbound.py"),
+                "--jobs",
+                "0",
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 2
+        assert "must be at least 1" in result.stderr
+
     def test_invalid_args_error(self) -> None:
         """Test that invalid arguments produce errors"""
         result = subprocess.run(
@@ -0,0 +1,69 @@
+"""Tests for the fzf preview helper
+
+Tests render, human_size, fzf_preview_command and main.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from hardbound.preview import fzf_preview_command, human_size, main, render
+
+
+class TestHumanSize:
+    """Test human_size formatting"""
+
+    def test_human_size_bytes(self) -> None:
+        """Test sizes below 1K are shown as plain byte counts"""
+        assert human_size(512) == "512"
+
+    def test_human_size_units(self) -> None:
+        """Test larger sizes pick a unit with du -h style precision"""
+        assert human_size(1536) == "1.5K"
+        assert human_size(230 * 1024 * 1024) == "230M"
+
+
+class TestRender:
+    """Test render preview block"""
+
+    def test_render_lists_files_audio_and_total(self, tmp_path: Path) -> None:
+        """Test one scan yields the file list, audio files and total size"""
+        (tmp_path / "book.m4b").write_bytes(b"a" * 2048)
+        (tmp_path / "cover.jpg").write_bytes(b"c" * 1024)
+        extras = tmp_path / "extras"
+        extras.mkdir()
+        (extras / "notes.txt").write_bytes(b"n" * 1024)
+
+        output = render(str(tmp_path))
+
+        assert output.startswith(f"📁 {tmp_path}")
+        assert "book.m4b" in output.split("Audio files:")[1]
+        assert "cover.jpg" not in output.split("Audio files:")[1]
+        assert "extras/" in output
+        assert output.endswith("Total size: 4.0K")
+
+    def test_render_missing_directory(self, tmp_path: Path) -> None:
+        """Test non-directories render nothing"""
+        assert render(str(tmp_path / "missing")) == ""
+
+
+class TestPreviewCommand:
+    """Test the command string handed to fzf"""
+
+    def test_fzf_preview_command_runs_as_script(self, tmp_path: Path) -> None:
+        """Test the preview script runs standalone with the path argument"""
+        (tmp_path / "book.mp3").write_bytes(b"a")
+        command = fzf_preview_command().replace("{2}", f"'{tmp_path}'")
+
+        result = subprocess.run(command, shell=True, capture_output=True, text=True)
+
+        assert result.returncode == 0
+        assert "book.mp3" in result.stdout
+
+    def test_main_requires_path(self) -> None:
+        """Test main returns an error code without arguments"""
+        assert main([]) == 1
+
+    def test_preview_command_uses_current_interpreter(self) -> None:
+        """Test fzf runs the preview with the interpreter hardbound runs under"""
+        assert sys.executable in fzf_preview_command()
@@ -8,6 +8,7 @@
 Phase 1.4: RED Compliance Integration
 """
 
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -15,7 +16,10 @@
 from hardbound.red_paths import (
     PATH_CAP,
     Tokens,
+    _build_dst_paths_cached,
+    _filename_len,
     _fits_red_cap,
+    _folder_name_len,
     _torrent_path_length,
     build_dst_paths,
     build_filename,
@@ -134,6 +138,11 @@ def test_volume_case_insensitivity(self) -> None:
         assert normalize_volume("Volume 13") == "vol_13"
         assert normalize_volume("V.13") == "vol_13"
 
+    def test_vol_prefix_with_trailing_text(self) -> None:
+        """Test that non-numeric vol_ forms still go through the patterns"""
+        assert normalize_volume(" vol_007 ") == "vol_07"
+        assert normalize_volume("vol_13a") == "vol_13"
+
 
 # ============================================================================
 # PHASE 1.1: TOKEN PARSING - parse_tokens()
@@ -308,6 +317,57 @@ def test_parse_year_format_validation(self) -> None:
         assert tokens3.author == "(3000)"
         assert tokens3.year is None
 
+    def test_parse_year_after_unbalanced_paren(self) -> None:
+        """Test that a stray "(" before the year does not swallow it"""
+        name = "Title (x vol_01 (1999) (Author Name) {ASIN.B0ABC123}.m4b"
+        tokens = parse_tokens(name, ".m4b")
+
+        assert tokens.year == "(1999)"
+        assert tokens.author == "(Author Name)"
+        assert tokens.title == "Title (x"
+
+    def test_parse_skips_malformed_asin_tags(self) -> None:
+        """Test that lowercase or empty ASIN tags are passed over"""
+        name = "Title {ASIN.} {ASIN.b0abc} vol_01 {ASIN.B0ABC123}.m4b"
+        tokens = parse_tokens(name, ".m4b")
+
+        assert tokens.asin == "{ASIN.B0ABC123}"
+
+    def test_parse_removes_every_asin_tag(self) -> None:
+        """Test that repeated ASIN tags are all dropped from the title"""
+        name = "Title {ASIN.B0AAA111} vol_01 {ASIN.B0ABC123}.m4b"
+        tokens = parse_tokens(name, ".m4b")
+
+        assert tokens.asin == "{ASIN.B0AAA111}"
+        assert tokens.title == "Title"
+
+    def test_parse_old_format_skips_empty_segments(self) -> None:
+        """Test the dashed fallback ignores empty segments"""
+        name = "Title -  - Volume 3 - Part One -  - Two {ASIN.B0ABC123}.m4b"
+        tokens = parse_tokens(name, ".m4b")
+
+        assert tokens.title == "Title"
+        assert tokens.volume == "vol_03"
+        assert tokens.subtitle == "Part One - Two"
+
+    def test_parse_collapses_whitespace_runs(self) -> None:
+        """Test that whitespace runs are collapsed when tokens are built"""
+        name = "Long  Title vol_01 Sub\ttitle (Some  Author) {ASIN.B0ABC123}.m4b"
+        tokens = parse_tokens(name, ".m4b")
+
+        assert tokens.title == "Long Title"
+        assert tokens.subtitle == "Sub title"
+        assert tokens.author == "(Some Author)"
+
+    def test_parse_non_year_before_author_stays_in_title(self) -> None:
+        """Test that a non-year paren before the author is left in place"""
+        name = "Title vol_01 Sub (Extra) (Author Name) {ASIN.B0ABC123}.m4b"
+        tokens = parse_tokens(name, ".m4b")
+
+        assert tokens.year is None
+        assert tokens.author == "(Author Name)"
+        assert tokens.subtitle == "Sub (Extra)"
+
 
 # ============================================================================
 # PHASE 1.2: PATH BUILDING - build_filename()
@@ -329,6 +389,17 @@ def test_build_filename_all_components(self, sample_tokens: Tokens) -> None:
         assert "[H2OKing]" in filename
         assert filename.endswith(".m4b")
 
+    def test_build_filename_full_matches_generic_path(
+        self, sample_tokens: Tokens
+    ) -> None:
+        """Test the all-components fast path against the generic join"""
+        filename = build_filename(sample_tokens)
+
+        assert filename == (
+            "Overlord vol_13 The Paladin of the Sacred Kingdom Part 2 (2024) "
+            "(Kugane Maruyama) {ASIN.B0CW3NF5NY} [H2OKing].m4b"
+        )
+
     def test_build_filename_minimal(self, minimal_tokens: Tokens) -> None:
         """Test building filename with only required components"""
         filename = build_filename(minimal_tokens)
@@ -542,6 +613,35 @@ def test_validate_path_length_uses_leaf_only(self, tmp_path: Path) -> None:
         # Should pass because only "Short {ASIN.B0ABC123}" + "/" + filename is measured
         assert validate_path_length(deep_path, dst_file, path_cap=180)
 
+    @pytest.mark.parametrize(
+        "flags",
+        [
+            (True, True, True, True),
+            (True, False, True, True),
+            (True, False, False, False),
+            (False, False, False, False),
+        ],
+    )
+    def test_arithmetic_lengths_match_built_names(
+        self,
+        flags: tuple[bool, bool, bool, bool],
+        sample_tokens: Tokens,
+        minimal_tokens: Tokens,
+    ) -> None:
+        """Test that computed lengths match the names the builders produce"""
+        for tokens in (sample_tokens, minimal_tokens):
+            assert _filename_len(tokens, *flags) == len(build_filename(tokens, *flags))
+            assert _folder_name_len(tokens, *flags[:3]) == len(
+                build_folder_name(tokens, *flags[:3])
+            )
+
+    def test_arithmetic_lengths_skip_empty_title(self, minimal_tokens: Tokens) -> None:
+        """Test that an empty title adds no separator"""
+        tokens = replace(minimal_tokens, title="")
+
+        assert _filename_len(tokens) == len(build_filename(tokens))
+        assert _folder_name_len(tokens) == len(build_folder_name(tokens))
+
 
 # ============================================================================
 # PHASE 1.3: RED PATH SHORTENING - build_dst_paths()
@@ -660,6 +760,19 @@ def test_build_dst_paths_extension_preference_order(self, tmp_path: Path) -> Non
 
         assert dst_file.name.endswith(".mp3")
 
+    def test_build_dst_paths_cached_per_root(self, tmp_path: Path) -> None:
+        """Test repeated sources hit the cache without leaking across roots"""
+        src = tmp_path / "Book Title vol_01 {ASIN.B0ABC123}"
+        _build_dst_paths_cached.cache_clear()
+
+        first = build_dst_paths(src, tmp_path / "a", extension=".m4b")
+        again = build_dst_paths(src, tmp_path / "a", extension=".m4b")
+        other = build_dst_paths(src, tmp_path / "b", extension=".m4b")
+
+        assert again == first
+        assert other[0] == tmp_path / "b" / first[0].name
+        assert _build_dst_paths_cached.cache_info().hits == 1
+
     def test_build_dst_paths_respects_path_cap(self, tmp_path: Path) -> None:
         """Test that generated paths always respect 180 char limit"""
         # Create various length source names